@@ -0,0 +1,327 @@
+"""Streaming analytics over exported game logs. Reads JSONL or CSV records of
+guesses and their outcomes in a single pass with bounded memory, optionally
+splitting large files into byte ranges processed by a pool of workers, and
+reports per-answer solve rates and average guesses, first guess popularity and
+per-position letter frequencies.
+
+Each record describes one guess:
+
+    game_id, answer, guess, outcome[, guess_number]
+
+where outcome is either a digit string with one Accuracy value per character
+("20100"), a list of Accuracy names or values, or a packed outcome code (as a
+number, or as text with fewer digits than the guess has letters, e.g. "100").
+Records are parsed straight into integers; outcomes are never materialized as
+lists of Accuracy's. Without guess_number, guesses are numbered per game in
+file order, which requires a single worker.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from model.wordle_model import Accuracy, WordleModel
+
+ALPHABET_SIZE = 26
+ACCURACY_NAMES = {accuracy.name: accuracy.value for accuracy in Accuracy}
+
+# (game id, answer code, guess code, outcome code, guess number or 0)
+ParsedRecord = Tuple[str, int, int, int, int]
+
+
+def encode_word(word: str) -> int:
+    """Packs a lowercase word into an integer, first letter least
+    significant. Lossless for a known word length.
+    """
+    code = 0
+    for char in reversed(word):
+        code = code * ALPHABET_SIZE + ord(char) - ord("a")
+    return code
+
+
+def decode_word(code: int, length: int) -> str:
+    """Inverse of encode_word."""
+    chars = []
+    for _ in range(length):
+        code, letter = divmod(code, ALPHABET_SIZE)
+        chars.append(chr(letter + ord("a")))
+    return "".join(chars)
+
+
+def parse_outcome(outcome: object, word_length: int) -> int:
+    """Converts any supported outcome representation to a packed code. Text
+    fields (every CSV field) holding only digits are a digit string when they
+    have one digit per letter and a packed code otherwise: codes are below
+    3 ** word_length, so they never have that many digits.
+
+    :param outcome: digit string, list of Accuracy names or values, or code.
+    :param word_length: number of letters of the guess.
+    :return: packed outcome code.
+    """
+    if isinstance(outcome, int):
+        return outcome
+    if isinstance(outcome, str):
+        if outcome.isdigit():
+            if len(outcome) == word_length:
+                return int(outcome[::-1], 3)
+            return int(outcome)
+        outcome = outcome.replace("|", " ").replace(",", " ").split()
+    code = 0
+    for accuracy in reversed(list(outcome)):  # type: ignore
+        value = ACCURACY_NAMES[accuracy] if isinstance(accuracy, str) else accuracy
+        code = code * 3 + value
+    return code
+
+
+def _parse_fields(fields: Dict) -> ParsedRecord:
+    guess = fields["guess"].lower()
+    return (
+        str(fields["game_id"]),
+        encode_word(fields["answer"].lower()),
+        encode_word(guess),
+        parse_outcome(fields["outcome"], len(guess)),
+        int(fields.get("guess_number") or 0),
+    )
+
+
+def iter_lines(path: str, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """Yields the lines that start within a byte range of a file. Ranges can
+    be chosen arbitrarily: a line belongs to the range its first byte is in.
+
+    :param path: path of the file.
+    :param start: first byte of the range.
+    :param end: optional end of the range (exclusive), defaults to the end of
+    the file.
+    """
+    with open(path, "rb") as log_file:
+        if start > 0:
+            log_file.seek(start - 1)
+            log_file.readline()  # skip the line owned by the previous range
+        position = log_file.tell()
+        for line in log_file:
+            if end is not None and position >= end:
+                return
+            position += len(line)
+            yield line.decode("utf-8")
+
+
+def parse_records(
+    path: str, start: int = 0, end: Optional[int] = None
+) -> Iterator[ParsedRecord]:
+    """Streams parsed records from a JSONL or CSV log (chosen by extension).
+
+    :param path: path of the log.
+    :param start: first byte of the range to parse.
+    :param end: optional end of the range to parse.
+    """
+    lines = iter_lines(path, start, end)
+    if path.endswith(".csv"):
+        with open(path, newline="") as log_file:
+            header = next(csv.reader(log_file))
+        if start == 0:
+            next(lines, None)  # header row
+        for row in csv.DictReader(lines, fieldnames=header):
+            yield _parse_fields(row)
+    else:
+        for line in lines:
+            if line.strip():
+                yield _parse_fields(json.loads(line))
+
+
+class Aggregates:
+    __slots__ = (
+        "word_length",
+        "max_guesses",
+        "answers",
+        "first_guesses",
+        "letter_counts",
+        "_open_games",
+    )
+
+    def __init__(self, word_length: int, max_guesses: int) -> None:
+        """Running aggregates. Merging the aggregates of several byte ranges
+        gives the same result as a single pass over the whole file.
+
+        :param word_length: number of letters per word.
+        :param max_guesses: number of guesses after which a game is lost.
+        """
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        # answer code -> [games, wins, guesses used in wins]
+        self.answers: Dict[int, List[int]] = {}
+        # guess code -> number of games it opened
+        self.first_guesses: Dict[int, int] = {}
+        # position * ALPHABET_SIZE + letter -> number of guesses
+        self.letter_counts = [0] * (word_length * ALPHABET_SIZE)
+        # guesses so far of games without explicit guess numbers
+        self._open_games: Dict[str, int] = {}
+
+    def add(self, record: ParsedRecord) -> None:
+        game_id, answer, guess, outcome, guess_number = record
+        if not guess_number:
+            guess_number = self._open_games.get(game_id, 0) + 1
+            self._open_games[game_id] = guess_number
+
+        if guess_number == 1:
+            self.first_guesses[guess] = self.first_guesses.get(guess, 0) + 1
+
+        code = guess
+        for position in range(self.word_length):
+            code, letter = divmod(code, ALPHABET_SIZE)
+            self.letter_counts[position * ALPHABET_SIZE + letter] += 1
+
+        won = outcome == 3**self.word_length - 1
+        if won or guess_number >= self.max_guesses:
+            self._open_games.pop(game_id, None)
+            totals = self.answers.get(answer)
+            if totals is None:
+                totals = self.answers[answer] = [0, 0, 0]
+            totals[0] += 1
+            if won:
+                totals[1] += 1
+                totals[2] += guess_number
+
+    def merge(self, other: "Aggregates") -> None:
+        for answer, (games, wins, guesses) in other.answers.items():
+            totals = self.answers.setdefault(answer, [0, 0, 0])
+            totals[0] += games
+            totals[1] += wins
+            totals[2] += guesses
+        for guess, count in other.first_guesses.items():
+            self.first_guesses[guess] = self.first_guesses.get(guess, 0) + count
+        for i, count in enumerate(other.letter_counts):
+            self.letter_counts[i] += count
+
+    def report(self, top: int = 10) -> Dict:
+        """Decodes the aggregates into a JSON serializable summary."""
+        length = self.word_length
+
+        per_answer = {
+            decode_word(answer, length): {
+                "games": games,
+                "solve_rate": wins / games,
+                "average_guesses": guesses / wins if wins else None,
+            }
+            for answer, (games, wins, guesses) in self.answers.items()
+        }
+        hardest = sorted(
+            per_answer,
+            key=lambda word: (
+                per_answer[word]["solve_rate"],
+                -(per_answer[word]["average_guesses"] or self.max_guesses + 1),
+                word,
+            ),
+        )[:top]
+        first_guesses = sorted(
+            self.first_guesses.items(), key=lambda item: (-item[1], item[0])
+        )[:top]
+        letters = [
+            {
+                chr(letter + ord("a")): self.letter_counts[
+                    position * ALPHABET_SIZE + letter
+                ]
+                for letter in range(ALPHABET_SIZE)
+            }
+            for position in range(length)
+        ]
+        return {
+            "games": sum(totals[0] for totals in self.answers.values()),
+            "answers": per_answer,
+            "hardest_answers": hardest,
+            "first_guesses": {decode_word(g, length): n for g, n in first_guesses},
+            "letter_frequency": letters,
+        }
+
+
+def analyze_range(
+    path: str, start: int, end: Optional[int], word_length: int, max_guesses: int
+) -> Aggregates:
+    """Aggregates the records of one byte range of a log."""
+    aggregates = Aggregates(word_length, max_guesses)
+    for record in parse_records(path, start, end):
+        aggregates.add(record)
+    return aggregates
+
+
+def _analyze_range(args: Tuple) -> Aggregates:
+    aggregates = analyze_range(*args)
+    if aggregates._open_games:
+        raise ValueError("Records need a guess_number to be analyzed in parallel.")
+    return aggregates
+
+
+def analyze(
+    path: str,
+    word_length: int = 5,
+    max_guesses: int = WordleModel.MAX_GUESSES,
+    workers: int = 1,
+    chunk_bytes: int = 64 << 20,
+) -> Aggregates:
+    """Aggregates a whole log, splitting it into byte ranges across a pool of
+    workers when workers > 1.
+
+    :param path: path of the JSONL or CSV log.
+    :param word_length: number of letters per word.
+    :param max_guesses: number of guesses after which a game is lost.
+    :param workers: number of worker processes.
+    :param chunk_bytes: size of the byte range handed to a worker at a time.
+    :return: aggregates for the whole log.
+    """
+    if workers <= 1:
+        return analyze_range(path, 0, None, word_length, max_guesses)
+
+    size = os.path.getsize(path)
+    ranges = [
+        (path, start, min(start + chunk_bytes, size), word_length, max_guesses)
+        for start in range(0, size, chunk_bytes)
+    ]
+    aggregates = Aggregates(word_length, max_guesses)
+    with Pool(workers) as pool:
+        for partial in pool.imap_unordered(_analyze_range, ranges):
+            aggregates.merge(partial)
+    return aggregates
+
+
+def format_report(report: Dict) -> str:
+    """Renders a report as plain text."""
+    out = io.StringIO()
+    out.write(f"games: {report['games']}\n\nhardest answers:\n")
+    for word in report["hardest_answers"]:
+        stats = report["answers"][word]
+        average = stats["average_guesses"]
+        out.write(
+            f"  {word}  solve rate {100 * stats['solve_rate']:.1f}%"
+            f"  average guesses {'-' if average is None else f'{average:.2f}'}"
+            f"  ({stats['games']} games)\n"
+        )
+    out.write("\nmost popular first guesses:\n")
+    for word, count in report["first_guesses"].items():
+        out.write(f"  {word}  {count}\n")
+    out.write("\nmost frequent letter per position:\n")
+    for position, counts in enumerate(report["letter_frequency"]):
+        letter = max(counts, key=counts.__getitem__)
+        out.write(f"  {position + 1}: {letter} ({counts[letter]})\n")
+    return out.getvalue()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("log", help="JSONL or CSV (.csv) game log")
+    parser.add_argument("--word-length", type=int, default=5)
+    parser.add_argument("--max-guesses", type=int, default=WordleModel.MAX_GUESSES)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="print the full report")
+    args = parser.parse_args(argv)
+
+    aggregates = analyze(args.log, args.word_length, args.max_guesses, args.workers)
+    report = aggregates.report(args.top)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Command line entrypoint for the benchmark suite:
+
+    python -m benchmarks [--save results.json] [--baseline] [--compare]
+
+Exits with a non-zero status when --compare finds a regression.
+"""
+import argparse
+import sys
+
+from pathlib import Path
+
+from model.lexicon import get_lexicon
+
+from benchmarks.harness import (
+    BASELINE_PATH,
+    BENCHMARKS,
+    DEFAULT_TOLERANCE,
+    find_regressions,
+    load_results,
+    run_all,
+    save_results,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks the game's hot paths.")
+    parser.add_argument(
+        "names", nargs="*", help=f"benchmarks to run: {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument("--dictionary", help="dictionary to build the lexicon from")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--save", type=Path, help="write results to this file")
+    parser.add_argument(
+        "--baseline", action="store_true", help=f"store results as {BASELINE_PATH}"
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="compare results with the baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark {name}")
+    if args.compare and not args.baseline and not BASELINE_PATH.exists():
+        print(f"no baseline at {BASELINE_PATH}, run --baseline first", file=sys.stderr)
+        return 2
+
+    results = run_all(
+        get_lexicon(args.dictionary), args.names, args.repeat, args.min_time
+    )
+    for name, result in results.items():
+        print(f"{name:20} {result.seconds_per_op * 1e6:12.2f} us/op")
+
+    if args.save:
+        save_results(results, args.save)
+    if args.baseline:
+        save_results(results, BASELINE_PATH)
+    if args.compare:
+        regressions = find_regressions(
+            results, load_results(BASELINE_PATH), args.tolerance
+        )
+        for name, ratio in regressions.items():
+            print(f"REGRESSION {name}: {ratio:.2f}x slower than baseline")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""Pytest entrypoint for the benchmark suite. Not collected by a plain pytest
+run; invoke it explicitly:
+
+    pytest benchmarks/bench_pytest.py
+
+Each benchmark fails if it is slower than the stored baseline by more than
+the default tolerance, and is skipped when no baseline was stored yet (see
+python -m benchmarks --baseline).
+"""
+import pytest
+
+from model.lexicon import get_lexicon
+
+from benchmarks.harness import (
+    BASELINE_PATH,
+    BENCHMARKS,
+    find_regressions,
+    load_results,
+    run_benchmark,
+)
+
+
+@pytest.mark.parametrize("name", list(BENCHMARKS))
+def test_benchmark(name):
+    result = run_benchmark(BENCHMARKS[name](get_lexicon()))
+    print(f"{name}: {result.seconds_per_op * 1e6:.2f} us/op")
+
+    if not BASELINE_PATH.exists():
+        pytest.skip(f"no baseline at {BASELINE_PATH}, run --baseline first")
+    regressions = find_regressions({name: result}, load_results(BASELINE_PATH))
+    assert name not in regressions, f"{regressions[name]:.2f}x slower"
@@ -0,0 +1,244 @@
+"""
+Benchmark harness for the game's hot paths. Each benchmark is a function that
+receives the lexicon under test and returns a zero argument callable; the
+harness times that callable and reports the best time per operation. Results
+can be saved as JSON and compared against a stored baseline.
+"""
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from controller.wordle_controller import ACCURACY_TO_COLOR_PAIR, color_pairs_for
+from model.feedback import Feedback
+from model.keyboard_state import KeyboardState
+from model.lexicon import Lexicon, VocabularyIndex
+from model.multi_board import MultiBoardModel
+from model.scoring import encode_lexicon, score_matrix
+from model.wordle_model import WordleModel, score_guess
+from view.framebuffer import FramebufferBackend
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+ROOT = Path(__file__).parent.parent
+
+# starts a game the way main.py does and quits on the first key, right after
+# the first frame
+STARTUP_SCRIPT = """
+import sys
+import main
+from view.framebuffer import FramebufferBackend
+main.main(sys.argv[1:], FramebufferBackend(keys="\\x1b"))
+"""
+
+# a benchmark is reported as a regression when it is this much slower
+DEFAULT_TOLERANCE = 0.25
+
+Benchmark = Callable[[Lexicon], Callable[[], object]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """Registers a benchmark under the given name."""
+
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+def _non_winning_words(lexicon: Lexicon, count: int) -> List[str]:
+    return [lexicon[i] for i in range(1, min(count + 1, len(lexicon)))]
+
+
+@benchmark("lexicon_load")
+def bench_lexicon_load(lexicon: Lexicon) -> Callable[[], object]:
+    """Cold start: map the compiled index and build the hash table."""
+    index_path = lexicon.index.path
+    return lambda: Lexicon(VocabularyIndex(index_path))
+
+
+@benchmark("startup")
+def bench_startup(lexicon: Lexicon) -> Callable[[], object]:
+    """Time to first frame of a new process, interpreter startup included."""
+    command = [sys.executable, "-c", STARTUP_SCRIPT]
+    command += ["--word-length", str(lexicon.word_length)]
+    return lambda: subprocess.run(command, cwd=ROOT, check=True)
+
+
+@benchmark("model_construction")
+def bench_model_construction(lexicon: Lexicon) -> Callable[[], object]:
+    """Warm start: a new game on an already loaded lexicon."""
+    return lambda: WordleModel(lexicon)
+
+
+@benchmark("guess")
+def bench_guess(lexicon: Lexicon) -> Callable[[], object]:
+    """A full game's worth of scored guesses."""
+    words = _non_winning_words(lexicon, WordleModel.MAX_GUESSES)
+
+    def play() -> None:
+        model = WordleModel(lexicon, 0)
+        for word in words:
+            model.guess(word)
+
+    return play
+
+
+@benchmark("validation")
+def bench_validation(lexicon: Lexicon) -> Callable[[], object]:
+    """Rejected guesses, which only exercise validation."""
+    model = WordleModel(lexicon, 0)
+    words = ["zzzzz", "qqqqq", lexicon[len(lexicon) // 2] + "s"]
+
+    def validate() -> None:
+        for word in words:
+            model.guess(word)
+
+    return validate
+
+
+@benchmark("batch_scoring")
+def bench_batch_scoring(lexicon: Lexicon) -> Callable[[], object]:
+    """100 guesses against every word in the lexicon."""
+    words = encode_lexicon(lexicon)
+    return lambda: score_matrix(words[:100], words)
+
+
+@benchmark("multi_board_guess")
+def bench_multi_board_guess(lexicon: Lexicon) -> Callable[[], object]:
+    """A full 16 board game's worth of shared guesses."""
+    num_boards = min(16, len(lexicon) // 2)
+    answers = range(len(lexicon) - num_boards, len(lexicon))
+    words = _non_winning_words(lexicon, num_boards + MultiBoardModel.EXTRA_GUESSES)
+
+    def play() -> None:
+        model = MultiBoardModel(lexicon, answers)
+        for word in words:
+            model.guess(word)
+
+    return play
+
+
+@benchmark("ui_layout")
+def bench_ui_layout(lexicon: Lexicon) -> Callable[[], object]:
+    """Laying out the whole interface on an in-memory framebuffer."""
+    from view.wordle_ui import WordleUI
+
+    return lambda: WordleUI(backend=FramebufferBackend())
+
+
+@benchmark("ui_guess")
+def bench_ui_guess(lexicon: Lexicon) -> Callable[[], object]:
+    """Typing, coloring and rendering a full game's worth of guesses."""
+    from view.wordle_ui import WordleUI
+
+    words = _non_winning_words(lexicon, WordleModel.MAX_GUESSES)
+    outcomes = [Feedback.from_accuracies(score_guess(w, lexicon[0])) for w in words]
+
+    def play() -> None:
+        ui = WordleUI(lexicon.word_length, backend=FramebufferBackend())
+        keyboard = KeyboardState()
+        for word, outcome in zip(words, outcomes):
+            for char in word:
+                ui.key_was_pressed(char.upper())
+                ui.render()
+            ui.move_on_to_next_row(color_pairs_for(outcome))
+            changes = keyboard.update(word, outcome)
+            ui.update_keys(
+                {
+                    char.upper(): ACCURACY_TO_COLOR_PAIR[accuracy.name]
+                    for char, accuracy in changes.items()
+                }
+            )
+            ui.render()
+
+    return play
+
+
+class Result(NamedTuple):
+    seconds_per_op: float
+    ops: int
+
+
+def run_benchmark(
+    func: Callable[[], object], repeat: int = 5, min_time: float = 0.2
+) -> Result:
+    """Times a callable, calibrating the number of calls per repetition so
+    that each repetition takes at least min_time seconds.
+
+    :param func: callable to time.
+    :param repeat: number of repetitions, the fastest one is reported.
+    :param min_time: minimum duration of each repetition in seconds.
+    :return: best time per call and the number of calls per repetition.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat, number))
+    return Result(best / number, number)
+
+
+def run_all(
+    lexicon: Lexicon,
+    names: Optional[List[str]] = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+) -> Dict[str, Result]:
+    """Runs the selected benchmarks (all by default).
+
+    :param lexicon: lexicon to benchmark against.
+    :param names: optional benchmark names to run.
+    :param repeat: number of repetitions per benchmark.
+    :param min_time: minimum duration of each repetition in seconds.
+    :return: results by benchmark name.
+    """
+    return {
+        name: run_benchmark(BENCHMARKS[name](lexicon), repeat, min_time)
+        for name in (names or list(BENCHMARKS))
+    }
+
+
+def save_results(results: Dict[str, Result], path: Path) -> None:
+    """Writes results, along with some context about the machine, as JSON."""
+    document = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: result._asdict() for name, result in results.items()},
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def load_results(path: Path) -> Dict[str, Result]:
+    """Reads results written by save_results."""
+    document = json.loads(path.read_text())
+    return {name: Result(**result) for name, result in document["results"].items()}
+
+
+def find_regressions(
+    results: Dict[str, Result],
+    baseline: Dict[str, Result],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> Dict[str, float]:
+    """Compares results with a baseline.
+
+    :param results: current results.
+    :param baseline: stored results to compare against.
+    :param tolerance: allowed slowdown as a fraction, e.g. 0.25 for 25%.
+    :return: slowdown ratio of every benchmark that regressed.
+    """
+    regressions = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result.seconds_per_op / baseline[name].seconds_per_op
+        if ratio > 1 + tolerance:
+            regressions[name] = ratio
+    return regressions
@@ -0,0 +1,67 @@
+"""
+Renders games without a terminal: the compact board view is drawn on the
+in-memory framebuffer backend and returned as plain or ANSI colored text. Used
+to print games from the simulator and the game server.
+"""
+from typing import Sequence, Tuple
+
+from controller.wordle_controller import color_pairs_for
+from model.feedback import Accuracy, Feedback
+from model.wordle_model import WordleModel
+from view.framebuffer import FramebufferBackend
+from view.multi_board_ui import HEADER_HEIGHT, MultiBoardUI
+from view.screen import DEFAULT_PADDING_X
+
+MIN_WIDTH = 40  # room for the title and a short message
+
+
+def render_game(
+    previous_guesses: Sequence[Tuple[str, Sequence[Accuracy]]],
+    word_length: int,
+    max_guesses: int,
+    message: str = "",
+    ansi: bool = False,
+) -> str:
+    """Draws a game's board.
+
+    :param previous_guesses: the game's (word, outcome) pairs in order.
+    :param word_length: number of letters per guess.
+    :param max_guesses: number of guesses per game.
+    :param message: optional text shown below the board, e.g. the result.
+    :param ansi: whether to color the outcomes with ANSI escape sequences.
+    :return: rendered board, without leading or trailing blank lines.
+    """
+    # one board, the input line and the message line below it
+    width = max(MIN_WIDTH, 2 * word_length + 4 + 2 * DEFAULT_PADDING_X)
+    height = HEADER_HEIGHT + max_guesses + 2 + 4
+    backend = FramebufferBackend(width, height)
+
+    ui = MultiBoardUI(1, word_length, max_guesses, backend=backend)
+    for word, outcome in previous_guesses:
+        for char in word:
+            ui.key_was_pressed(char.upper())
+        ui.show_outcomes([color_pairs_for(Feedback.from_accuracies(outcome))])
+    ui.game_over()
+    if message:
+        ui.show_hint(message)
+    ui.render()
+    rendered = backend.render_ansi() if ansi else backend.render_text()
+    return rendered.lstrip("\n")
+
+
+def render_model(model: WordleModel, ansi: bool = False) -> str:
+    """Draws a local game's board along with its result.
+
+    :param model: game to draw.
+    :param ansi: whether to color the outcomes with ANSI escape sequences.
+    :return: rendered board.
+    """
+    if model.did_win:
+        message = f"Solved in {len(model.previous_guesses)} guesses"
+    elif model.did_win is False:
+        message = f"Out of guesses: {model.winning_word.upper()}"
+    else:
+        message = ""
+    return render_game(
+        model.previous_guesses, model.word_length, model.max_guesses, message, ansi
+    )
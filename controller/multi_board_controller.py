@@ -0,0 +1,77 @@
+"""
+Controller for multi-board games. Mirrors the WordleController's handling of
+keyboard input, with bursts of keys coalesced into events, but plays every
+guess on all boards of a MultiBoardModel and shows the outcomes in the compact
+MultiBoardUI.
+"""
+from typing import Optional
+
+from controller.wordle_controller import BACKSPACE, ENTER, HINT, QUIT
+from controller.wordle_controller import coalesce_keys, color_pairs_for
+from model.multi_board import MultiBoardModel
+from view.backend import Backend
+from view.multi_board_ui import MultiBoardUI
+
+
+class MultiBoardController:
+    def __init__(
+        self, model: MultiBoardModel, backend: Optional[Backend] = None
+    ) -> None:
+        """Starts listening for user input right away.
+
+        :param model: multi-board game to drive.
+        :param backend: optional backend the view draws with, defaults to the
+        terminal.
+        """
+        self.model = model
+        self.ui = MultiBoardUI(
+            model.num_boards, model.word_length, model.max_guesses, backend
+        )
+
+        self.run()
+
+    def run(self) -> None:
+        """Listens for user input until escape is pressed, handling every
+        burst of keys at once and rendering once per burst.
+        """
+        while True:
+            events = coalesce_keys(self.ui.get_input_character_codes())
+            for event in events:
+                if event.kind == QUIT:
+                    self.ui.close()
+                    return
+                elif event.kind == BACKSPACE:
+                    for _ in range(min(len(event.keys), self.model.word_length)):
+                        self.ui.backspace_was_pressed()
+                elif event.kind == ENTER:
+                    self.submit_guess()
+                elif event.kind == HINT:
+                    self.ui.show_hint("Hints are not available in multi-board games")
+                else:
+                    for key in event.keys:
+                        self.ui.key_was_pressed(key)
+
+            self.ui.render()
+
+    def submit_guess(self) -> None:
+        """Plays the current input on every unsolved board."""
+        outcomes = self.model.guess(self.ui.get_current_input())
+        if outcomes is None:
+            return
+        self.ui.show_outcomes(
+            [
+                None if outcome is None else color_pairs_for(outcome)
+                for outcome in outcomes
+            ]
+        )
+
+        if self.model.did_win is not None:
+            self.ui.game_over()
+            if self.model.did_win:
+                self.ui.show_hint(
+                    f"Solved every board in {len(self.model.previous_guesses)} guesses"
+                )
+            else:
+                self.ui.show_hint(
+                    "Out of guesses: " + " ".join(self.model.winning_words).upper()
+                )
@@ -0,0 +1,108 @@
+"""
+Thin client for the game server. RemoteModel exposes the same guess/did_win
+interface as WordleModel so the controller can drive a game hosted by
+server.py exactly like a local one.
+"""
+import select
+import socket
+
+from typing import List, Optional, Tuple
+
+from model.protocol import (
+    decode_outcome,
+    did_win_from_status,
+    format_message,
+    parse_message,
+)
+from model.feedback import Feedback
+
+
+class RemoteModel:
+    def __init__(self, sock: socket.socket) -> None:
+        """Opens a session on an already connected socket.
+
+        :param sock: socket connected to a game server.
+        """
+        self._socket = sock
+        self._stream = sock.makefile("rb")
+        self.previous_guesses: List[Tuple[str, Feedback]] = []
+        self.did_win: Optional[bool] = None
+        self.winning_word: Optional[str] = None  # only known once lost
+        self.session_ended: Optional[str] = None  # why, once the session ended
+
+        command, args = self._receive()
+        if command == "BUSY":
+            raise ConnectionRefusedError("Game server is at capacity.")
+        if command != "HELLO":
+            raise ConnectionError(f"Unexpected greeting from server: {command}")
+        self.word_length, self.max_guesses = int(args[0]), int(args[1])
+
+    @classmethod
+    def connect_tcp(cls, host: str, port: int) -> "RemoteModel":
+        return cls(socket.create_connection((host, port)))
+
+    @classmethod
+    def connect_unix(cls, path: str) -> "RemoteModel":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(path)
+        return cls(sock)
+
+    def _receive(self) -> Tuple[str, List[str]]:
+        line = self._stream.readline()
+        if not line:
+            raise ConnectionError("Game server closed the connection.")
+        return parse_message(line)
+
+    def guess(self, word: str) -> Optional[Feedback]:
+        """Sends a guess to the server.
+
+        :param word: string
+        :return: None if guess was invalid. Otherwise returns the outcome of
+        the guess as a Feedback.
+        :raise ConnectionError: if the session ended, e.g. because it was idle
+        for too long. The connection is closed.
+        """
+        if self.session_ended is not None:
+            raise ConnectionError(self.session_ended)
+        if not word.isalpha():  # keeps the request a single, well formed line
+            return None
+        try:
+            if select.select([self._socket], [], [], 0)[0]:
+                # the server only speaks unprompted to end the session, e.g.
+                # with TIMEOUT, and its reply would be lost once we send
+                command, args = self._receive()
+            else:
+                self._socket.sendall(format_message("GUESS", word))
+                command, args = self._receive()
+        except OSError as error:
+            raise self._disconnect("Lost the connection to the game server.") from error
+        if command == "INVALID":
+            return None
+        if command == "TIMEOUT":
+            raise self._disconnect("The game server ended the idle session.")
+        if command != "RESULT":
+            raise self._disconnect(f"Game server error: {' '.join(args) or command}")
+
+        outcome = decode_outcome(args[0])
+        self.did_win = did_win_from_status(args[1])
+        if len(args) > 2:
+            self.winning_word = args[2]
+        self.previous_guesses.append((word, outcome))
+        return outcome
+
+    def _disconnect(self, reason: str) -> ConnectionError:
+        self.session_ended = reason
+        self._stream.close()
+        self._socket.close()
+        return ConnectionError(reason)
+
+    def close(self) -> None:
+        """Ends the session."""
+        if self.session_ended is not None:
+            return
+        try:
+            self._socket.sendall(format_message("QUIT"))
+            self._receive()
+        except (ConnectionError, OSError):
+            pass
+        self._disconnect("The game session was closed.")
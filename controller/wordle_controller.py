@@ -2,12 +2,37 @@
 The Controller's responsibility is to handle communication between the view
 and the model. This allows each of those two pieces to be defined cleanly and
 remain agnostic to the way in which the other will make use of it.
+
+Input is handled in ticks: every tick drains all pending keys, coalesces them
+into events (pasted text, a held backspace), handles the events and renders
+once. While no key is pressed, idle hooks get short slices of time for
+background work such as precomputing the next hint.
+
+The controller can also start from a ModelLoader: the board is drawn and
+letters can be typed while the model loads in the background, and the first
+guess waits for it.
 """
-import curses
+import time
+
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from typing import TYPE_CHECKING, Union
+
+import instrumentation
 
+from model.feedback import Feedback
+from model.keyboard_state import KeyboardState
+from model.loader import ModelLoader
 from model.wordle_model import WordleModel, Accuracy
+from view.backend import Backend
 from view.wordle_ui import WordleUI
 
+if TYPE_CHECKING:
+    from controller.remote_model import RemoteModel
+
+    # the solver imports numpy, which is slow to import and only needed once
+    # hints are computed
+    from model.solver import RankedGuess, Solver
 
 # Define preset mapping from model's correctness enum to the view's color pair
 # options (see screen.py's color pairs)
@@ -17,40 +42,324 @@ ACCURACY_TO_COLOR_PAIR = {
     Accuracy.CORRECT.name: 3,
 }
 
+ESCAPE = 27
+IDLE_TICK_MS = 50  # quiet time after a key before idle work starts
+IDLE_SLICE = 0.01  # seconds of idle work between two checks for input
+HINT_BATCH_SIZE = 16  # guesses ranked per step while precomputing hints
+
+# Kinds of input events
+LETTERS = "letters"
+BACKSPACE = "backspace"
+ENTER = "enter"
+HINT = "hint"
+QUIT = "quit"
+
+# Idle hooks are called with the time (time.monotonic) by which they should
+# return control, and return whether they have work left
+IdleHook = Callable[[float], bool]
+
+
+def is_backspace(input_code: int) -> bool:
+    """Witnessed different codes for backspace in different environments."""
+    return chr(input_code) in ("KEY_BACKSPACE", "\b", "\x7f") or input_code == 263
+
+
+class InputEvent(NamedTuple):
+    kind: str
+    keys: str  # letters typed, or one character per repetition of the key
+
+
+def coalesce_keys(input_codes: Iterable[int]) -> List[InputEvent]:
+    """Turns a burst of keys into events, merging consecutive keys of the
+    same kind: pasted text becomes a single LETTERS event and a held backspace
+    a single BACKSPACE event. Keys after escape are dropped.
+
+    :param input_codes: character codes in the order they were pressed.
+    :return: events in order.
+    """
+    events: List[InputEvent] = []
+    for input_code in input_codes:
+        if input_code == ESCAPE:
+            events.append(InputEvent(QUIT, ""))
+            break
+        if is_backspace(input_code):
+            kind, key = BACKSPACE, "\b"
+        else:
+            key = chr(input_code)
+            if key == "\n":
+                kind = ENTER
+            elif key == "?":
+                kind = HINT
+            else:
+                kind, key = LETTERS, key.upper()
+
+        if events and events[-1].kind == kind:
+            events[-1] = InputEvent(kind, events[-1].keys + key)
+        else:
+            events.append(InputEvent(kind, key))
+    return events
+
+
+@lru_cache(maxsize=None)
+def color_pairs_for(outcome: Feedback) -> Tuple[int, ...]:
+    """Color pairs for every character of an outcome. Feedback's are shared
+    instances, so each distinct outcome is only ever mapped once.
+    """
+    return tuple(ACCURACY_TO_COLOR_PAIR[accuracy.name] for accuracy in outcome)
+
 
 class WordleController:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        model: Optional[Union[WordleModel, "RemoteModel", ModelLoader]] = None,
+        backend: Optional[Backend] = None,
+    ) -> None:
         """The controller starts listening for user input right away. It is
         responsible for handling all requests from the user, handing updates to
         the model, and telling the view how to reflect the updated state.
+
+        :param model: optional model to drive, e.g. a RemoteModel connected to
+        a game server, or a ModelLoader still loading one. Defaults to a local
+        game.
+        :param backend: optional backend the view draws with, defaults to the
+        terminal.
         """
+        self.wordle_model: Union[WordleModel, "RemoteModel"]
+        self._loader: Optional[ModelLoader] = None
+        if isinstance(model, ModelLoader):
+            self._loader = model  # picked up by wait_for_model once loaded
+        else:
+            self.wordle_model = model if model is not None else WordleModel()
+            model = self.wordle_model
+        self.wordle_ui = WordleUI(model.word_length, model.max_guesses, backend)
+        self.keyboard = KeyboardState()
+        self.solver: Optional["Solver"] = None  # created when a hint is needed
+
+        # Best guesses ranked so far for the current number of guesses, and
+        # the search that improves on them until the whole lexicon is ranked
+        self._hint: List["RankedGuess"] = []
+        self._hint_guesses: Optional[int] = None
+        self._hint_search: Optional[Iterator[List["RankedGuess"]]] = None
 
-        self.wordle_ui = WordleUI()
-        self.wordle_model = WordleModel()
+        self.idle_hooks: List[IdleHook] = [self.finish_loading, self.precompute_hint]
 
-        # Listen for user input indefinitely
+        if self._loader is not None:
+            self.wordle_ui.render()  # first frame, without waiting for the model
+        elif self.wordle_model.previous_guesses:
+            # Show guesses of a resumed game
+            self.replay_previous_guesses()
+
+        self.run()
+
+    def run(self) -> None:
+        """Listens for user input until escape is pressed. The loop only
+        blocks waiting for keys once the idle hooks have no work left.
+        """
+        has_idle_work = True
+        timeout_ms = IDLE_TICK_MS
         while True:
-            input_code = self.wordle_ui.get_input_character_code()
-
-            if input_code == 27:  # escape key
-                self.wordle_ui.close()
-                break
-            elif (
-                chr(input_code) in ("KEY_BACKSPACE", "\b", "\x7f") or input_code == 263
-            ):  # witnessed different codes in different environments
-                self.wordle_ui.backspace_was_pressed()
-            elif chr(input_code) == "\n":  # enter key
+            input_codes = self.wordle_ui.get_input_character_codes(
+                timeout_ms if has_idle_work else -1
+            )
+            keys_read_at = time.perf_counter()
+            if input_codes:
+                if not self.handle_events(coalesce_keys(input_codes)):
+                    break
+                # a new guess may give the idle hooks more work, which waits
+                # until typing pauses
+                has_idle_work, timeout_ms = True, IDLE_TICK_MS
+            else:
+                has_idle_work, timeout_ms = self.run_idle_hooks(), 0
+
+            self.wordle_ui.render()
+            metrics = instrumentation.active
+            if metrics is not None and input_codes:
+                metrics.observe(
+                    "wordle_keystroke_seconds",
+                    time.perf_counter() - keys_read_at,
+                    times=len(input_codes),
+                )
+
+    def handle_events(self, events: Iterable[InputEvent]) -> bool:
+        """Applies input events to the model and the view.
+
+        :param events: events in the order they happened.
+        :return: False once the user asked to quit, True otherwise.
+        """
+        for event in events:
+            if event.kind == QUIT:
+                self.close()
+                return False
+            elif event.kind == BACKSPACE:
+                for _ in range(min(len(event.keys), self.wordle_ui.word_length)):
+                    self.wordle_ui.backspace_was_pressed()
+            elif event.kind == ENTER:
+                self.wait_for_model()
                 current_input = self.wordle_ui.get_current_input()
-                outcome = self.wordle_model.guess(current_input)
+                try:
+                    outcome = self.wordle_model.guess(current_input)
+                except ConnectionError as error:
+                    # the remote session is over, the game cannot go on
+                    self.wordle_ui.game_over()
+                    self.wordle_ui.show_hint(str(error))
+                    continue
                 if outcome is not None:
-                    color_pairs = [
-                        ACCURACY_TO_COLOR_PAIR[accuracy.name] for accuracy in outcome
-                    ]
-                    self.wordle_ui.move_on_to_next_row(color_pairs)
+                    self.show_outcome(current_input, outcome)
+                elif isinstance(
+                    self.wordle_model, WordleModel
+                ) and self.wordle_model.breaks_hard_mode(current_input):
+                    self.wordle_ui.show_hint(
+                        "Hard mode: guesses must use every revealed hint"
+                    )
                 if self.wordle_model.did_win is not None:
                     self.wordle_ui.game_over()
+            elif event.kind == HINT:
+                self.show_hint()
+            else:
+                for key in event.keys:
+                    self.wordle_ui.key_was_pressed(key)
+        return True
+
+    def run_idle_hooks(self) -> bool:
+        """Gives the idle hooks one slice of time.
+
+        :return: whether any hook has work left.
+        """
+        deadline = time.monotonic() + IDLE_SLICE
+        has_work = False
+        for hook in self.idle_hooks:
+            has_work = hook(deadline) or has_work
+        return has_work
+
+    def finish_loading(self, deadline: float) -> bool:
+        """Idle hook that picks up the model once the loader has it.
+
+        :param deadline: time (time.monotonic) by which to return.
+        :return: whether the model is still loading.
+        """
+        if self._loader is not None and self._loader.is_ready(
+            max(0.0, deadline - time.monotonic())
+        ):
+            self.wait_for_model()
+        return self._loader is not None
+
+    def wait_for_model(self) -> None:
+        """Waits for the loader, if any, then shows the guesses of a resumed
+        game before whatever was typed while loading.
+        """
+        if self._loader is None:
+            return
+        try:
+            self.wordle_model = self._loader.result()
+        except Exception:
+            self.wordle_ui.close()  # give the terminal back before reporting it
+            raise
+        self._loader = None
+        if self.wordle_model.previous_guesses:
+            typed = self.wordle_ui.get_current_input()
+            for _ in typed:
+                self.wordle_ui.backspace_was_pressed()
+            self.replay_previous_guesses()
+            for char in typed:
+                self.wordle_ui.key_was_pressed(char.upper())
+
+    def close(self) -> None:
+        """Closes the view, and the connection or journal of the model."""
+        self.wordle_ui.close()
+        if self._loader is not None:
+            if not self._loader.is_ready():
+                return  # quit while loading, nothing to close yet
+            self.wordle_model = self._loader.result()
+        if not isinstance(self.wordle_model, WordleModel):
+            self.wordle_model.close()
+        elif self.wordle_model.journal is not None:
+            self.wordle_model.journal.close()
+
+    def replay_previous_guesses(self) -> None:
+        """Redraws every guess the model already knows about, e.g. for a game
+        resumed from a journal.
+        """
+        for word, outcome in self.wordle_model.previous_guesses:
+            for char in word:
+                self.wordle_ui.key_was_pressed(char.upper())
+            self.show_outcome(word, outcome)
+        self.wordle_ui.render()
+
+    def show_outcome(self, word: str, outcome: Feedback) -> None:
+        """Colors the row of a guess, then only the keys whose best known
+        accuracy improved with it.
+
+        :param word: guessed word.
+        :param outcome: outcome of the guess.
+        """
+        self.wordle_ui.move_on_to_next_row(color_pairs_for(outcome))
+        changes = self.keyboard.update(word, outcome)
+        if changes:
+            self.wordle_ui.update_keys(
+                {
+                    char.upper(): ACCURACY_TO_COLOR_PAIR[accuracy.name]
+                    for char, accuracy in changes.items()
+                }
+            )
+
+    def precompute_hint(self, deadline: float) -> bool:
+        """Idle hook that ranks guesses for the next hint a few at a time, so
+        that asking for a hint is instant and uses the whole lexicon.
+
+        :param deadline: time (time.monotonic) by which to return.
+        :return: whether the ranking is still incomplete.
+        """
+        if self._loader is not None:
+            return False  # finish_loading has the work left
+        if self.wordle_model.did_win is not None:
+            return False
+        if not isinstance(self.wordle_model, WordleModel):
+            return False
+
+        previous_guesses = self.wordle_model.previous_guesses
+        if self._hint_guesses != len(previous_guesses):
+            if self.solver is None:
+                from model.solver import Solver
+
+                self.solver = Solver(
+                    self.wordle_model.vocabulary,
+                    hard_mode=self.wordle_model.hard_mode,
+                )
+            self.solver.update(previous_guesses)
+            self._hint = []
+            self._hint_guesses = len(previous_guesses)
+            self._hint_search = self.solver.iter_rank(batch_size=HINT_BATCH_SIZE)
+
+        while self._hint_search is not None and (
+            not self._hint or time.monotonic() < deadline
+        ):
+            ranked = next(self._hint_search, None)
+            if ranked is None:
+                self._hint_search = None
             else:
-                self.wordle_ui.key_was_pressed(chr(input_code).upper())
+                self._hint = ranked
+        return self._hint_search is not None
+
+    def show_hint(self) -> None:
+        """Displays the most informative next guess along with the number of
+        answers that are still possible. Ranking picks up where the idle
+        precomputation left off and gets the solver's usual time budget.
+        """
+        from model.solver import DEFAULT_TIME_BUDGET
+
+        self.wait_for_model()
+        if self.wordle_model.did_win is not None:
+            return
+        if not isinstance(self.wordle_model, WordleModel):
+            self.wordle_ui.show_hint("Hints are not available for remote games")
+            return
+        self.precompute_hint(time.monotonic() + DEFAULT_TIME_BUDGET)
+        assert self.solver is not None
+        best_guess = self._hint[0].word if self._hint else None
+        self.wordle_ui.show_hint(
+            f"Hint: {(best_guess or '?').upper()} "
+            f"({len(self.solver.candidates)} possible answers)"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,213 @@
+"""Opt-in instrumentation of the game's hot paths. Instrumented code looks up
+the module level `active` registry and does nothing more when it is None, so
+the hooks stay in production builds at the cost of one global lookup each.
+Once enabled, counters, gauges and latency histograms are collected and can
+be exported as JSON or in the Prometheus text format, at exit or on demand
+(SIGUSR1), optionally along with a cProfile capture.
+
+Collected metrics:
+
+    wordle_vocabulary_load_seconds     time to load (or compile) a lexicon
+    wordle_index_compiles_total        vocabulary indexes compiled
+    wordle_guess_seconds               latency of WordleModel.guess
+    wordle_invalid_guesses_total       guesses refused by the model
+    wordle_keystroke_seconds           key read to screen updated, per key
+    wordle_screen_flushes_total        terminal updates
+    wordle_screen_window_refreshes_total
+    wordle_screen_text_bytes_total     bytes of text drawn
+"""
+import atexit
+import json
+import signal
+import sys
+import time
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+# upper bounds of the latency histogram buckets, in seconds
+BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class Histogram:
+    __slots__ = ("count", "sum", "min", "max", "bucket_counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.bucket_counts = [0] * len(BUCKETS)  # not cumulative
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        for i, bound in enumerate(BUCKETS):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+                break
+
+    def cumulative_buckets(self) -> Dict[str, int]:
+        """Observations per bucket, Prometheus style: each bucket counts the
+        values up to its bound, "+Inf" counting them all.
+        """
+        buckets = {}
+        total = 0
+        for bound, count in zip(BUCKETS, self.bucket_counts):
+            total += count
+            buckets[repr(bound)] = total
+        buckets["+Inf"] = self.count
+        return buckets
+
+
+class Metrics:
+    def __init__(self) -> None:
+        """Registry of every metric collected while instrumentation is
+        enabled.
+        """
+        self.counters: Dict[str, float] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def count(self, name: str, amount: float = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def observe(self, name: str, value: float, times: int = 1) -> None:
+        """Records a value in a histogram.
+
+        :param name: name of the histogram.
+        :param value: observed value, in seconds for latencies.
+        :param times: number of events that value was observed for.
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        for _ in range(times):
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Observes the duration of a block in a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def snapshot(self) -> Dict:
+        """Every metric as a JSON serializable document."""
+        return {
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "histograms": {
+                name: {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "min": histogram.min if histogram.count else None,
+                    "max": histogram.max,
+                    "buckets": histogram.cumulative_buckets(),
+                }
+                for name, histogram in self.histograms.items()
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2) + "\n"
+
+    def to_prometheus(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines += [f"# TYPE {name} counter", f"{name} {value}"]
+        for name, value in sorted(self.gauges.items()):
+            lines += [f"# TYPE {name} gauge", f"{name} {value}"]
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for bound, count in histogram.cumulative_buckets().items():
+                lines.append(f'{name}_bucket{{le="{bound}"}} {count}')
+            lines += [
+                f"{name}_sum {histogram.sum}",
+                f"{name}_count {histogram.count}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Union[str, Path]) -> None:
+        """Writes a snapshot, in the Prometheus text format if the file name
+        ends with .prom and as JSON otherwise.
+        """
+        path = Path(path)
+        text = self.to_prometheus() if path.suffix == ".prom" else self.to_json()
+        path.write_text(text)
+
+
+active: Optional[Metrics] = None  # None while instrumentation is disabled
+
+
+def enable() -> Metrics:
+    """Starts collecting metrics, keeping any collected so far."""
+    global active
+    if active is None:
+        active = Metrics()
+    return active
+
+
+def disable() -> None:
+    """Stops collecting metrics and drops them."""
+    global active
+    active = None
+
+
+def install(
+    metrics_path: Union[str, Path], cprofile_path: Optional[Union[str, Path]] = None
+) -> Metrics:
+    """Enables instrumentation for the rest of the process: a snapshot is
+    written at exit, SIGTERM included, and whenever the process receives
+    SIGUSR1. The cProfile capture is only written at exit.
+
+    :param metrics_path: file the snapshot is written to, see Metrics.export.
+    :param cprofile_path: optional file to dump cProfile statistics to at
+    exit, readable with the pstats module.
+    :return: metrics registry.
+    """
+    metrics = enable()
+    profiler = None
+    if cprofile_path is not None:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    def export_at_exit() -> None:
+        metrics.export(metrics_path)
+        if profiler is not None:
+            profiler.dump_stats(str(cprofile_path))  # also stops profiling
+
+    atexit.register(export_at_exit)
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        # containers are stopped with SIGTERM, which skips atexit by default
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(
+            signal.SIGUSR1, lambda signum, frame: metrics.export(metrics_path)
+        )
+    return metrics
@@ -1,6 +1,160 @@
 """Simple entrypoint into the application. Responsible for kicking off the
-controller."""
+controller, either for a local game or as a client of a game server.
+
+Startup is kept short: only what the chosen mode needs is imported, and a local
+game draws its board right away while the lexicon loads in the background (see
+model/loader.py)."""
+import argparse
+
+from typing import Optional, Sequence
+
+import instrumentation
+
 from controller.wordle_controller import WordleController
+from model.journal import GameJournal, resume_game
+from model.lexicon import get_lexicon
+from model.loader import ModelLoader
+from model.word_sources import WORD_LENGTH, WORD_LENGTHS
+from model.wordle_model import WordleModel
+from view.backend import Backend
+
+
+def main(
+    argv: Optional[Sequence[str]] = None, backend: Optional[Backend] = None
+) -> None:
+    """Parses the command line and plays a game.
+
+    :param argv: optional arguments, defaults to the process' arguments.
+    :param backend: optional backend to draw with, defaults to the terminal.
+    """
+    parser = argparse.ArgumentParser(description="Wordle in the terminal.")
+    parser.add_argument(
+        "--connect", metavar="HOST:PORT", help="play on a game server over TCP"
+    )
+    parser.add_argument(
+        "--connect-unix",
+        metavar="PATH",
+        help="play on a game server over a unix socket",
+    )
+    parser.add_argument(
+        "--journal",
+        metavar="PATH",
+        help="record every guess to this journal and resume an unfinished game",
+    )
+    parser.add_argument(
+        "--dictionary",
+        metavar="PATH",
+        help="play with the words in this file, one word per line",
+    )
+    parser.add_argument(
+        "--word-length",
+        type=int,
+        default=WORD_LENGTH,
+        choices=WORD_LENGTHS,
+        help="number of letters per word",
+    )
+    parser.add_argument(
+        "--max-guesses",
+        type=int,
+        help="number of guesses per game, defaults to 6, or to one per board "
+        "plus 5 with several boards",
+    )
+    parser.add_argument(
+        "--boards",
+        type=int,
+        default=1,
+        help="play this many boards at once, sharing every guess",
+    )
+    parser.add_argument(
+        "--hard",
+        action="store_true",
+        help="hard mode: every guess must be consistent with the revealed hints",
+    )
+    parser.add_argument(
+        "--adversarial",
+        action="store_true",
+        help="Absurdle: the answer dodges every guess for as long as it can",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="collect timings and counters, written to this file at exit or on "
+        "SIGUSR1 (Prometheus text format if it ends with .prom, JSON otherwise)",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="PATH",
+        help="with --profile, also write cProfile statistics to this file at exit",
+    )
+    args = parser.parse_args(argv)
+    if args.boards > 1 and (args.connect or args.connect_unix or args.journal):
+        parser.error("--boards cannot be combined with a server or a journal")
+    if args.hard and (args.connect or args.connect_unix or args.boards > 1):
+        parser.error(
+            "--hard only applies to local single board games, "
+            "start the server with --hard instead"
+        )
+    if args.adversarial and (
+        args.connect or args.connect_unix or args.boards > 1 or args.journal
+    ):
+        parser.error(
+            "--adversarial cannot be combined with a server, several boards or "
+            "a journal"
+        )
+    if args.cprofile and not args.profile:
+        parser.error("--cprofile requires --profile")
+    if args.profile:
+        instrumentation.install(args.profile, args.cprofile)
+    max_guesses = args.max_guesses or WordleModel.MAX_GUESSES
+
+    if args.connect:
+        from controller.remote_model import RemoteModel
+
+        host, _, port = args.connect.rpartition(":")
+        model = RemoteModel.connect_tcp(host or "127.0.0.1", int(port))
+        WordleController(model, backend)
+    elif args.connect_unix:
+        from controller.remote_model import RemoteModel
+
+        WordleController(RemoteModel.connect_unix(args.connect_unix), backend)
+    elif args.boards > 1:
+        from controller.multi_board_controller import MultiBoardController
+        from model.multi_board import MultiBoardModel
+
+        lexicon = get_lexicon(args.dictionary, args.word_length)
+        MultiBoardController(
+            MultiBoardModel(
+                lexicon, num_boards=args.boards, max_guesses=args.max_guesses
+            ),
+            backend,
+        )
+    else:
+
+        def load() -> WordleModel:
+            lexicon = get_lexicon(args.dictionary, args.word_length)
+            if args.adversarial:
+                from model.adversarial import AdversarialModel
+
+                return AdversarialModel(
+                    lexicon, max_guesses=max_guesses, hard_mode=args.hard
+                )
+            if not args.journal:
+                return WordleModel(
+                    lexicon, max_guesses=max_guesses, hard_mode=args.hard
+                )
+
+            journal = GameJournal(args.journal, lexicon)
+            return resume_game(
+                journal, max_guesses=max_guesses, hard_mode=args.hard
+            ) or WordleModel(
+                lexicon,
+                journal=journal,
+                max_guesses=max_guesses,
+                hard_mode=args.hard,
+            )
+
+        WordleController(ModelLoader(load, args.word_length, max_guesses), backend)
+
 
 if __name__ == "__main__":
-    WordleController()
+    main()
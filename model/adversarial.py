@@ -0,0 +1,79 @@
+"""
+Adversarial ("Absurdle") game. The answer is not chosen up front: every word
+of the lexicon starts out as a candidate, and each guess is answered with the
+outcome shared by the most candidates, which become the only ones left. The
+game is won once a guess is the last candidate.
+
+Grouping the candidates is a counting sort over the packed outcome codes: the
+guess is scored against every candidate in one batch and np.bincount counts
+each of the 3 ** word length possible outcomes, so no per-word Python work is
+done.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+
+from model.lexicon import Lexicon, get_lexicon
+from model.scoring import encode_lexicon, score_against
+from model.wordle_model import WordleModel
+
+
+@lru_cache(maxsize=None)
+def revealed_hints(word_length: int) -> np.ndarray:
+    """How much each outcome reveals, to break ties between equally large
+    groups: outcomes with fewer correct letters, then fewer misplaced ones,
+    reveal less.
+
+    :param word_length: number of letters.
+    :return: one weight per packed outcome code, lower revealing less.
+    """
+    codes = np.arange(3**word_length)
+    digits = codes[:, None] // 3 ** np.arange(word_length) % 3
+    num_correct = (digits == 2).sum(axis=1)
+    num_exists = (digits == 1).sum(axis=1)
+    return num_correct * (word_length + 1) + num_exists
+
+
+class AdversarialModel(WordleModel):
+    def __init__(
+        self,
+        lexicon: Optional[Lexicon] = None,
+        max_guesses: int = WordleModel.MAX_GUESSES,
+        hard_mode: bool = False,
+    ) -> None:
+        """Starts with every word of the lexicon as a possible answer.
+
+        :param lexicon: optional lexicon to play with. Defaults to the process
+        wide lexicon.
+        :param max_guesses: number of guesses after which the game is lost.
+        :param hard_mode: whether every guess must be consistent with the
+        outcomes of the previous ones.
+        """
+        lexicon = lexicon if lexicon is not None else get_lexicon()
+        # any candidate stands in for the answer until the game ends
+        super().__init__(
+            lexicon,
+            winning_index=0,
+            max_guesses=max_guesses,
+            hard_mode=hard_mode,
+        )
+        self._words = encode_lexicon(lexicon)
+        self.candidates = np.arange(len(lexicon))
+
+    def _score(self, word: str) -> int:
+        """Answers a valid guess with the outcome of the largest group of
+        candidates and drops every other candidate.
+
+        :param word: guessed word.
+        :return: packed outcome code.
+        """
+        codes = score_against(word, self._words[self.candidates])
+        counts = np.bincount(codes, minlength=3**self.word_length)
+        largest = np.flatnonzero(counts == counts.max())
+        code = int(largest[np.argmin(revealed_hints(self.word_length)[largest])])
+
+        self.candidates = self.candidates[codes == code]
+        # a guess only keeps itself as the answer when it is the last candidate
+        self.state.winning_index = int(self.candidates[0])
+        return code
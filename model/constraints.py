@@ -0,0 +1,122 @@
+"""
+Everything the outcomes of a game's guesses reveal about the answer, kept as
+one bitmask of allowed letters per position (bit i standing for the i-th
+letter of the alphabet) plus a minimum and maximum count per letter. A word
+satisfies the constraints exactly when every previous guess would have
+produced the same outcome against it, so the constraints both enforce hard
+mode and count the answers that are still possible.
+"""
+from typing import List, TYPE_CHECKING, Union
+
+from model.feedback import Accuracy, Feedback
+
+if TYPE_CHECKING:
+    import numpy as np
+
+ALPHABET_SIZE = 26
+ALL_LETTERS = (1 << ALPHABET_SIZE) - 1
+
+
+class Constraints:
+    __slots__ = (
+        "word_length",
+        "allowed",
+        "min_counts",
+        "max_counts",
+        "required",
+        "num_guesses",
+    )
+
+    def __init__(self, word_length: int) -> None:
+        """Starts without any constraint.
+
+        :param word_length: number of letters of the words to check.
+        """
+        self.word_length = word_length
+        self.allowed = [ALL_LETTERS] * word_length  # letter bitmask per position
+        self.min_counts = bytearray(ALPHABET_SIZE)
+        self.max_counts = bytearray([word_length] * ALPHABET_SIZE)
+        self.required: List[int] = []  # letters with a minimum count
+        self.num_guesses = 0  # guesses the constraints were built from
+
+    def add(self, word: str, outcome: Union[int, Feedback]) -> None:
+        """Narrows the constraints with the outcome of a guess.
+
+        :param word: guessed word.
+        :param outcome: outcome of the guess, as a Feedback or packed code.
+        """
+        if not isinstance(outcome, Feedback):
+            outcome = Feedback.of(outcome, len(word))
+
+        marked = bytearray(ALPHABET_SIZE)  # correct or existing occurrences
+        has_absent = 0  # bitmask of letters with an absent occurrence
+        for position, (char, accuracy) in enumerate(zip(word, outcome)):
+            letter = ord(char) - ord("a")
+            if accuracy is Accuracy.CORRECT:
+                self.allowed[position] = 1 << letter
+                marked[letter] += 1
+            else:
+                self.allowed[position] &= ~(1 << letter)
+                if accuracy is Accuracy.EXISTS:
+                    marked[letter] += 1
+                else:
+                    has_absent |= 1 << letter
+
+        for char in set(word):
+            letter = ord(char) - ord("a")
+            if marked[letter] > self.min_counts[letter]:
+                if not self.min_counts[letter]:
+                    self.required.append(letter)
+                self.min_counts[letter] = marked[letter]
+            if has_absent >> letter & 1:
+                # the answer has no more occurrences than were marked
+                self.max_counts[letter] = marked[letter]
+        self.num_guesses += 1
+
+    def allows(self, word: str) -> bool:
+        """Checks a single word in O(word length).
+
+        :param word: lowercase word of the right length.
+        :return: whether the word satisfies every constraint.
+        """
+        counts = bytearray(ALPHABET_SIZE)
+        for position, char in enumerate(word):
+            letter = ord(char) - ord("a")
+            if not self.allowed[position] >> letter & 1:
+                return False
+            counts[letter] += 1
+            if counts[letter] > self.max_counts[letter]:
+                return False
+        for letter in self.required:  # at most one per position
+            if counts[letter] < self.min_counts[letter]:
+                return False
+        return True
+
+    def filter(self, words: "np.ndarray") -> "np.ndarray":
+        """Checks many words at once.
+
+        :param words: letter codes, see scoring.encode_words.
+        :return: boolean array, True for the words satisfying every
+        constraint.
+        """
+        import numpy as np  # only needed by the solver, keeps it off startup
+
+        # absent letters are cheaper to exclude through the position masks
+        absent = 0
+        for letter, high in enumerate(self.max_counts):
+            if not high:
+                absent |= 1 << letter
+
+        letters = np.arange(ALPHABET_SIZE)
+        matches = np.ones(len(words), dtype=bool)
+        for position, allowed in enumerate(self.allowed):
+            allowed &= ~absent
+            if allowed != ALL_LETTERS:
+                is_allowed = (allowed >> letters) & 1 == 1
+                matches &= is_allowed[words[:, position]]
+        for letter in range(ALPHABET_SIZE):
+            low, high = self.min_counts[letter], self.max_counts[letter]
+            if low or 0 < high < self.word_length:
+                counts = (words == letter).sum(axis=1)
+                matches &= (counts >= low) & (counts <= high)
+        return matches
@@ -0,0 +1,126 @@
+"""
+Compact representation of a guess' outcome. A Feedback wraps the packed base 3
+code of an outcome (first character least significant) and behaves like a
+read-only sequence of Accuracy's. Every possible Feedback of a given length is
+created once in a decode table, so producing one for a guess is a single
+lookup and never allocates.
+"""
+import enum
+
+from functools import lru_cache
+from typing import Iterator, List, Sequence, Tuple, Union, overload
+
+
+class Accuracy(enum.Enum):
+    """Enum representing the accuracy of a given character in a guess."""
+
+    ABSENT = 0
+    EXISTS = 1
+    CORRECT = 2
+
+
+_ACCURACIES = tuple(Accuracy)
+
+
+class Feedback(Sequence[Accuracy]):
+    __slots__ = ("code", "length", "accuracies", "digits")
+
+    def __init__(self, code: int, length: int) -> None:
+        """Decodes a packed outcome. Use Feedback.of to get the shared
+        instance instead of creating new ones.
+
+        :param code: packed outcome code.
+        :param length: number of characters in the guess.
+        """
+        self.code = code
+        self.length = length
+        values = []
+        for _ in range(length):
+            code, value = divmod(code, 3)
+            values.append(value)
+        self.accuracies: Tuple[Accuracy, ...] = tuple(
+            _ACCURACIES[value] for value in values
+        )
+        self.digits = "".join(map(str, values))  # e.g. "20100"
+
+    @staticmethod
+    def of(code: int, length: int) -> "Feedback":
+        """Shared Feedback for a packed outcome code.
+
+        :param code: packed outcome code.
+        :param length: number of characters in the guess.
+        """
+        return decode_table(length)[code]
+
+    @staticmethod
+    def from_accuracies(outcome: Sequence[Accuracy]) -> "Feedback":
+        """Shared Feedback for a list of Accuracy's."""
+        if isinstance(outcome, Feedback):
+            return outcome
+        code = 0
+        for accuracy in reversed(outcome):
+            code = code * 3 + accuracy.value
+        return Feedback.of(code, len(outcome))
+
+    @staticmethod
+    def from_digits(digits: str) -> "Feedback":
+        """Shared Feedback for a digit string such as "20100"."""
+        return Feedback.of(int(digits[::-1], 3), len(digits))
+
+    @property
+    def is_win(self) -> bool:
+        return self.code == 3**self.length - 1
+
+    def to_list(self) -> List[Accuracy]:
+        """The outcome as a (new) list of Accuracy's."""
+        return list(self.accuracies)
+
+    @overload
+    def __getitem__(self, position: int) -> Accuracy: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> Tuple[Accuracy, ...]: ...
+
+    def __getitem__(
+        self, position: Union[int, slice]
+    ) -> Union[Accuracy, Tuple[Accuracy, ...]]:
+        return self.accuracies[position]
+
+    def __iter__(self) -> Iterator[Accuracy]:
+        return iter(self.accuracies)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __int__(self) -> int:
+        return self.code
+
+    def __index__(self) -> int:
+        return self.code
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Feedback):
+            return self.code == other.code and self.length == other.length
+        if isinstance(other, int):
+            return self.code == other
+        if isinstance(other, list):
+            return self.accuracies == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        # equal to its packed code, so it must hash like it too (lists, the
+        # only other thing a Feedback equals, are not hashable)
+        return hash(self.code)
+
+    def __repr__(self) -> str:
+        return f"Feedback({self.digits})"
+
+
+@lru_cache(maxsize=None)
+def decode_table(length: int) -> Tuple[Feedback, ...]:
+    """Every possible Feedback for a word length, indexed by code.
+
+    :param length: number of characters in the guess.
+    :return: tuple of 3 ** length Feedback's.
+    """
+    return tuple(Feedback(code, length) for code in range(3**length))
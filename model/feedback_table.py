@@ -0,0 +1,132 @@
+"""
+Precomputed guess x answer feedback table. The table holds the packed outcome
+of every vocabulary word guessed against every vocabulary word, one byte per
+cell (two for words longer than five letters). It is built once, stored as a
+.npy file keyed by a hash of the vocabulary and memory mapped on later runs,
+which turns any feedback lookup into a single indexing operation:
+table[guess_index, answer_index].
+"""
+import hashlib
+import os
+
+from functools import lru_cache
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+from model import lexicon as lexicon_module
+from model.lexicon import Lexicon
+from model.scoring import encode_lexicon, outcome_dtype, score_matrix
+
+# bump whenever the scorer changes so that stale tables are never reused
+TABLE_VERSION = 2
+
+# number of guess rows handed to a worker at a time
+ROWS_PER_TASK = 256
+
+_worker_answers: Optional[np.ndarray] = None
+
+
+def vocabulary_hash(lexicon: Lexicon) -> str:
+    """Hashes the exact word list so that tables are never shared between
+    different vocabularies.
+
+    :param lexicon: lexicon to hash.
+    :return: hex digest.
+    """
+    return hashlib.sha256(lexicon.index.records).hexdigest()
+
+
+def table_path_for(lexicon: Lexicon) -> Path:
+    """Location of the feedback table for a lexicon.
+
+    :param lexicon: lexicon the table is built from.
+    :return: path of the table inside the cache directory.
+    """
+    digest = vocabulary_hash(lexicon)[:16]
+    return lexicon_module.CACHE_DIR / f"feedback-v{TABLE_VERSION}-{digest}.npy"
+
+
+def _init_worker(answers: np.ndarray) -> None:
+    global _worker_answers
+    _worker_answers = answers
+
+
+def _score_rows(task: Tuple[int, np.ndarray]) -> Tuple[int, np.ndarray]:
+    start, guesses = task
+    assert _worker_answers is not None
+    return start, score_matrix(guesses, _worker_answers)
+
+
+def build_table(
+    lexicon: Lexicon, table_path: Optional[Path] = None, workers: Optional[int] = 1
+) -> Path:
+    """Computes the full feedback table and writes it to disk. Rows are
+    written straight into a memory mapped .npy file as they are produced, so
+    the whole table never has to be held twice.
+
+    :param lexicon: lexicon to build the table for.
+    :param table_path: optional destination, defaults to the cache location.
+    :param workers: number of worker processes. 1 builds in process, None
+    uses every available cpu.
+    :return: path of the table.
+    """
+    if table_path is None:
+        table_path = table_path_for(lexicon)
+
+    words = encode_lexicon(lexicon)
+    num_words = len(words)
+
+    table_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = table_path.with_name(f"{table_path.stem}.{os.getpid()}.tmp.npy")
+    table = np.lib.format.open_memmap(
+        tmp_path,
+        mode="w+",
+        dtype=outcome_dtype(lexicon.word_length),
+        shape=(num_words, num_words),
+    )
+
+    tasks = (
+        (start, words[start : start + ROWS_PER_TASK])
+        for start in range(0, num_words, ROWS_PER_TASK)
+    )
+    if workers == 1:
+        for start, guesses in tasks:
+            table[start : start + len(guesses)] = score_matrix(guesses, words)
+    else:
+        with Pool(workers, initializer=_init_worker, initargs=(words,)) as pool:
+            for start, rows in pool.imap_unordered(_score_rows, tasks):
+                table[start : start + len(rows)] = rows
+
+    table.flush()
+    del table
+    os.replace(tmp_path, table_path)
+
+    return table_path
+
+
+@lru_cache(maxsize=None)
+def load_table(lexicon: Lexicon, workers: Optional[int] = 1) -> np.ndarray:
+    """Memory maps the feedback table for a lexicon, building it first if it
+    does not exist yet. Tables are cached per lexicon.
+
+    :param lexicon: lexicon the table is built from.
+    :param workers: number of worker processes used if a build is needed.
+    :return: read-only array of shape (len(lexicon), len(lexicon)).
+    """
+    table_path = table_path_for(lexicon)
+    try:
+        table = np.load(table_path, mmap_mode="r")
+    except (OSError, ValueError):
+        table = None
+
+    if table is None or table.shape != (len(lexicon), len(lexicon)):
+        table = np.load(build_table(lexicon, table_path, workers), mmap_mode="r")
+
+    return table
+
+
+if __name__ == "__main__":
+    print(build_table(lexicon_module.get_lexicon(), workers=None))
@@ -0,0 +1,42 @@
+"""
+Compact per-game state. Words are referenced by their position in a shared
+lexicon and outcomes are stored as packed base 3 codes, so a single game only
+costs a few dozen bytes on top of the shared vocabulary.
+"""
+from array import array
+from typing import Optional
+
+
+class GameState:
+    __slots__ = ("winning_index", "guesses", "outcomes", "did_win")
+
+    def __init__(self, winning_index: int) -> None:
+        """Holds everything that is specific to a single game.
+
+        :param winning_index: lexicon position of the winning word.
+        """
+        self.winning_index = winning_index
+        self.guesses = array("I")  # lexicon positions of each guess
+        self.outcomes = array("H")  # one packed outcome code per guess
+        self.did_win: Optional[bool] = None
+
+    def __len__(self) -> int:
+        return len(self.guesses)
+
+    def has_guessed(self, word_index: int) -> bool:
+        """Checks whether a word was already guessed. There are at most
+        max_guesses entries so this is effectively constant time.
+
+        :param word_index: lexicon position of the word.
+        :return: boolean value representing whether the word was guessed.
+        """
+        return word_index in self.guesses
+
+    def record(self, word_index: int, outcome_code: int) -> None:
+        """Appends a guess and its packed outcome.
+
+        :param word_index: lexicon position of the guessed word.
+        :param outcome_code: packed outcome of the guess.
+        """
+        self.guesses.append(word_index)
+        self.outcomes.append(outcome_code)
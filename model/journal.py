@@ -0,0 +1,323 @@
+"""
+Append-only binary journal of every guess made in a game. Records have a fixed
+size so the journal can be streamed in large chunks, read backwards from its
+tail and truncated back to a record boundary after a crash.
+
+Journal layout: a fixed size header followed by RECORD sized entries. A
+journal is expected to have a single writing process.
+"""
+import os
+import struct
+import time
+
+from collections import Counter
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from model.lexicon import Lexicon, get_lexicon
+
+if TYPE_CHECKING:
+    from model.wordle_model import WordleModel
+
+MAGIC = b"WRDJ"
+FORMAT_VERSION = 2
+
+# magic, format version, record size, word length and sha256 digest of the
+# source dictionary, which word positions in the records refer to
+HEADER = struct.Struct("<4sHHH32s")
+
+# timestamp, game id, player id, winning word position, guessed word position,
+# packed outcome, guess number (1 based) and status
+RECORD = struct.Struct("<IIIIIHBB")
+
+PLAYING = 0
+WON = 1
+LOST = 2
+
+# defaults for how often appended records are forced to disk
+DEFAULT_FSYNC_EVERY = 64
+DEFAULT_FSYNC_INTERVAL = 1.0  # seconds
+
+RECORDS_PER_READ = 4096
+
+
+class JournalRecord(NamedTuple):
+    timestamp: int
+    game_id: int
+    player_id: int
+    winning_index: int
+    guess_index: int
+    outcome: int
+    guess_number: int
+    status: int
+
+
+def status_code(did_win: Optional[bool]) -> int:
+    """Maps a model's did_win flag to a record status."""
+    if did_win is None:
+        return PLAYING
+    return WON if did_win else LOST
+
+
+def _read_header(journal_file) -> Tuple[int, bytes]:
+    magic, version, record_size, word_length, source_checksum = HEADER.unpack(
+        journal_file.read(HEADER.size)
+    )
+    if magic != MAGIC or version != FORMAT_VERSION or record_size != RECORD.size:
+        raise ValueError(f"{journal_file.name} is not a compatible game journal.")
+    return word_length, source_checksum
+
+
+class GameJournal:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        lexicon: Optional[Lexicon] = None,
+        fsync_every: int = DEFAULT_FSYNC_EVERY,
+        fsync_interval: float = DEFAULT_FSYNC_INTERVAL,
+    ) -> None:
+        """Opens a journal for appending, creating it if needed. A record
+        left half written by a crash is cut off so that appends stay aligned.
+        Records are flushed and fsynced in batches: after fsync_every records
+        or fsync_interval seconds, whichever comes first.
+
+        :param path: path of the journal.
+        :param lexicon: optional lexicon the journaled games are played with.
+        Defaults to the process wide lexicon.
+        :param fsync_every: number of records between fsyncs.
+        :param fsync_interval: maximum number of seconds between fsyncs.
+        """
+        self.path = Path(path)
+        self.lexicon = lexicon if lexicon is not None else get_lexicon()
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+
+        vocabulary = (self.lexicon.word_length, self.lexicon.index.source_checksum)
+        if not self.path.exists() or self.path.stat().st_size < HEADER.size:
+            with open(self.path, "wb") as journal_file:
+                journal_file.write(
+                    HEADER.pack(MAGIC, FORMAT_VERSION, RECORD.size, *vocabulary)
+                )
+        with open(self.path, "rb") as journal_file:
+            if _read_header(journal_file) != vocabulary:
+                raise ValueError(f"{self.path} was written for another vocabulary.")
+
+        self._file = open(self.path, "r+b")
+        size = self._file.seek(0, os.SEEK_END)
+        aligned_size = size - (size - HEADER.size) % RECORD.size
+        if aligned_size != size:
+            self._file.truncate(aligned_size)
+            self._file.seek(aligned_size)
+
+        last = last_record(self.path)
+        self._next_game_id = 0 if last is None else last.game_id + 1
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def new_game_id(self) -> int:
+        """Reserves an id for a new game."""
+        game_id = self._next_game_id
+        self._next_game_id += 1
+        return game_id
+
+    def append(
+        self,
+        game_id: int,
+        player_id: int,
+        winning_index: int,
+        guess_index: int,
+        outcome: int,
+        guess_number: int,
+        status: int,
+    ) -> None:
+        """Appends a single guess.
+
+        :param game_id: id of the game, see new_game_id.
+        :param player_id: id of the player.
+        :param winning_index: lexicon position of the winning word.
+        :param guess_index: lexicon position of the guessed word.
+        :param outcome: packed outcome of the guess.
+        :param guess_number: 1 based number of the guess within the game.
+        :param status: one of PLAYING, WON or LOST after the guess.
+        """
+        self._file.write(
+            RECORD.pack(
+                int(time.time()),
+                game_id,
+                player_id,
+                winning_index,
+                guess_index,
+                outcome,
+                guess_number,
+                status,
+            )
+        )
+        self._unsynced += 1
+        if (
+            self._unsynced >= self.fsync_every
+            or time.monotonic() - self._last_sync >= self.fsync_interval
+        ):
+            self.sync()
+
+    def flush(self) -> None:
+        """Hands buffered records to the operating system so that readers of
+        the journal file see them, without waiting for them to hit the disk.
+        """
+        self._file.flush()
+
+    def sync(self) -> None:
+        """Forces every appended record to disk."""
+        self.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Syncs and closes the journal."""
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+def read_records(path: Union[str, Path]) -> Iterator[JournalRecord]:
+    """Streams every complete record in a journal, in the order they were
+    written, reading RECORDS_PER_READ records at a time.
+
+    :param path: path of the journal.
+    :return: iterator over records.
+    """
+    chunk_size = RECORD.size * RECORDS_PER_READ
+    with open(path, "rb") as journal_file:
+        _read_header(journal_file)
+        while True:
+            chunk = journal_file.read(chunk_size)
+            usable = len(chunk) - len(chunk) % RECORD.size
+            for fields in RECORD.iter_unpack(chunk[:usable]):
+                yield JournalRecord(*fields)
+            if len(chunk) < chunk_size:
+                return
+
+
+def read_records_backwards(path: Union[str, Path]) -> Iterator[JournalRecord]:
+    """Streams every complete record in a journal starting from its tail.
+
+    :param path: path of the journal.
+    :return: iterator over records, most recent first.
+    """
+    with open(path, "rb") as journal_file:
+        _read_header(journal_file)
+        size = journal_file.seek(0, os.SEEK_END)
+        end = size - (size - HEADER.size) % RECORD.size
+        while end > HEADER.size:
+            start = max(HEADER.size, end - RECORD.size * RECORDS_PER_READ)
+            journal_file.seek(start)
+            chunk = journal_file.read(end - start)
+            for fields in reversed(list(RECORD.iter_unpack(chunk))):
+                yield JournalRecord(*fields)
+            end = start
+
+
+def last_record(path: Union[str, Path]) -> Optional[JournalRecord]:
+    """Most recent record in a journal, or None if it is empty."""
+    return next(read_records_backwards(path), None)
+
+
+def resume_game(
+    journal: GameJournal,
+    player_id: int = 0,
+    max_guesses: Optional[int] = None,
+    hard_mode: bool = False,
+) -> Optional["WordleModel"]:
+    """Restores the player's most recent game from the journal tail if it was
+    still in progress, e.g. after a crash. Further guesses are appended to the
+    same game.
+
+    :param journal: open journal.
+    :param player_id: id of the player.
+    :param max_guesses: optional number of guesses the game is played with,
+    defaults to WordleModel.MAX_GUESSES.
+    :param hard_mode: whether the game is played in hard mode.
+    :return: restored model, or None if the player has no unfinished game.
+    """
+    from model.wordle_model import WordleModel
+
+    journal.flush()
+    game_records: List[JournalRecord] = []
+    for record in read_records_backwards(journal.path):
+        if record.player_id != player_id:
+            continue
+        if game_records and record.game_id != game_records[0].game_id:
+            break
+        if record.status != PLAYING and not game_records:
+            return None  # the most recent game is over
+        game_records.append(record)
+        if record.guess_number == 1:
+            break
+
+    if not game_records:
+        return None
+
+    first = game_records[-1]
+    model = WordleModel(
+        journal.lexicon,
+        first.winning_index,
+        journal=journal,
+        game_id=first.game_id,
+        player_id=player_id,
+        max_guesses=max_guesses or WordleModel.MAX_GUESSES,
+        hard_mode=hard_mode,
+    )
+    for record in reversed(game_records):
+        model.state.record(record.guess_index, record.outcome)
+    return model
+
+
+class PlayerStats:
+    __slots__ = ("games", "wins", "current_streak", "max_streak", "distribution")
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.wins = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        self.distribution: Counter = Counter()  # guesses needed per win
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+
+def player_statistics(records: Iterator[JournalRecord]) -> Dict[int, PlayerStats]:
+    """Computes per player statistics and streaks in a single pass. Only
+    finished games count and memory grows with the number of players, not
+    the number of records.
+
+    :param records: records in the order they were written, e.g. from
+    read_records.
+    :return: statistics by player id.
+    """
+    statistics: Dict[int, PlayerStats] = {}
+    for record in records:
+        if record.status == PLAYING:
+            continue
+        stats = statistics.get(record.player_id)
+        if stats is None:
+            stats = statistics[record.player_id] = PlayerStats()
+        stats.games += 1
+        if record.status == WON:
+            stats.wins += 1
+            stats.distribution[record.guess_number] += 1
+            stats.current_streak += 1
+            stats.max_streak = max(stats.max_streak, stats.current_streak)
+        else:
+            stats.current_streak = 0
+    return statistics
@@ -0,0 +1,41 @@
+"""
+Best known accuracy of every letter, as shown on the on-screen keyboard. A
+letter only ever moves up from ABSENT to EXISTS to CORRECT, so a key never
+loses information when a later guess uses its letter in a worse position.
+"""
+from typing import Dict, Optional, Sequence
+
+from model.feedback import Accuracy
+
+ALPHABET_SIZE = 26
+_ACCURACIES = tuple(Accuracy)
+
+
+class KeyboardState:
+    __slots__ = ("_best",)
+
+    def __init__(self) -> None:
+        """Starts with every letter untried."""
+        # accuracy value + 1 per letter, 0 for letters that were not guessed
+        self._best = bytearray(ALPHABET_SIZE)
+
+    def __getitem__(self, char: str) -> Optional[Accuracy]:
+        """Best known accuracy of a lowercase letter, None if untried."""
+        rank = self._best[ord(char) - ord("a")]
+        return _ACCURACIES[rank - 1] if rank else None
+
+    def update(self, word: str, outcome: Sequence[Accuracy]) -> Dict[str, Accuracy]:
+        """Records the outcome of a guess.
+
+        :param word: guessed word, lowercase.
+        :param outcome: Accuracy of each character in the guess.
+        :return: new best accuracy of the letters that improved, the only
+        keys that need repainting.
+        """
+        changes = {}
+        for char, accuracy in zip(word, outcome):
+            letter = ord(char) - ord("a")
+            if accuracy.value + 1 > self._best[letter]:
+                self._best[letter] = accuracy.value + 1
+                changes[char] = accuracy
+        return changes
@@ -0,0 +1,321 @@
+"""
+The lexicon compiles a word source (see model.word_sources) into a compact
+binary index once so that every game can memory map it instead of re-parsing
+the dictionary. A single pass over the source compiles one index per
+supported word length, so every game variant has its own index.
+
+Index layout: a fixed size header followed by sorted, fixed width records of
+word length ascii bytes each (no separators).
+"""
+import hashlib
+import mmap
+import os
+import struct
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import instrumentation
+
+from model.word_sources import WORD_LENGTH, WORD_LENGTHS, WordSource, as_word_source
+
+CACHE_DIR = Path(
+    os.environ.get("WORDLE_CACHE_DIR", Path.home() / ".cache" / "wordle-cli")
+)
+
+MAGIC = b"WRDL"
+FORMAT_VERSION = 1
+
+# magic, format version, word length, word count, source size, source mtime
+# (ns) and sha256 digest of the source dictionary
+HEADER = struct.Struct("<4sHHIQq32s")
+
+
+def source_checksum(source_path: Path) -> bytes:
+    """Computes the sha256 digest of a dictionary file.
+
+    :param source_path: path to the dictionary.
+    :return: raw digest bytes.
+    """
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as source_file:
+        for chunk in iter(lambda: source_file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def index_path_for(source: WordSource) -> Path:
+    """Location of the compiled index for a given word source.
+
+    :param source: word source.
+    :return: path of the compiled index inside the cache directory.
+    """
+    return CACHE_DIR / f"{source.name}.{source.word_length}.idx"
+
+
+def _write_index(
+    words: List[str],
+    word_length: int,
+    stat: os.stat_result,
+    checksum: bytes,
+    index_path: Path,
+) -> Path:
+    """Writes a compiled index. The file is written to a temporary location
+    first and moved into place so that concurrent readers never observe a
+    partial index.
+    """
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        word_length,
+        len(words),
+        stat.st_size,
+        stat.st_mtime_ns,
+        checksum,
+    )
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as index_file:
+        index_file.write(header)
+        index_file.write("".join(words).encode("ascii"))
+    os.replace(tmp_path, index_path)
+
+    return index_path
+
+
+def compile_indexes(
+    source: Optional[Union[WordSource, str, Path]] = None,
+    word_lengths: Iterable[int] = WORD_LENGTHS,
+) -> Dict[int, Path]:
+    """Parses the word source once and writes one compiled index per word
+    length, so that every game variant is ready after a single pass.
+
+    :param source: optional word source or dictionary path, defaults to
+    the default word source.
+    :param word_lengths: word lengths to compile. The source's own word
+    length is always included.
+    :return: path of the compiled index for each word length.
+    """
+    source = as_word_source(source)
+    word_lengths = sorted({*word_lengths, source.word_length})
+
+    stat = os.stat(source.path)
+    checksum = source_checksum(source.path)
+    partitions = source.words_by_length(word_lengths)
+
+    return {
+        length: _write_index(
+            sorted(partitions[length]),
+            length,
+            stat,
+            checksum,
+            index_path_for(source.with_length(length)),
+        )
+        for length in word_lengths
+    }
+
+
+def compile_index(
+    source: Optional[Union[WordSource, str, Path]] = None,
+    index_path: Optional[Path] = None,
+) -> Path:
+    """Parses the word source and writes the compiled index for its word
+    length. Unless an explicit destination is given, the indexes of the
+    other supported word lengths are compiled in the same pass.
+
+    :param source: optional word source or dictionary path, defaults to
+    the default word source.
+    :param index_path: optional destination, defaults to the cache location.
+    :return: path of the compiled index.
+    """
+    source = as_word_source(source)
+    if index_path is None:
+        return compile_indexes(source)[source.word_length]
+
+    return _write_index(
+        sorted(set(source.words())),
+        source.word_length,
+        os.stat(source.path),
+        source_checksum(source.path),
+        index_path,
+    )
+
+
+class VocabularyIndex:
+    def __init__(self, index_path: Path) -> None:
+        """Read-only, memory mapped view over a compiled index. Behaves like a
+        sorted sequence of words.
+
+        :param index_path: path of the compiled index.
+        """
+        self.path = index_path
+        with open(index_path, "rb") as index_file:
+            self._buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            self.format_version,
+            self.word_length,
+            self._count,
+            self.source_size,
+            self.source_mtime_ns,
+            self.source_checksum,
+        ) = HEADER.unpack_from(self._buffer, 0)
+
+        if magic != MAGIC:
+            raise ValueError(f"{index_path} is not a compiled vocabulary index.")
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def records(self) -> memoryview:
+        """Zero copy view over the raw, fixed width word records."""
+        start = HEADER.size
+        return memoryview(self._buffer)[start : start + self._count * self.word_length]
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("vocabulary index out of range")
+        start = HEADER.size + index * self.word_length
+        return self._buffer[start : start + self.word_length].decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self[index]
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self.find(word) is not None
+
+    def find(self, word: str) -> Optional[int]:
+        """Binary search over the sorted records.
+
+        :param word: word to look up.
+        :return: position of the word, or None if it is not in the index.
+        """
+        if len(word) != self.word_length or not word.isascii():
+            return None
+        target = word.encode("ascii")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start = HEADER.size + middle * self.word_length
+            record = self._buffer[start : start + self.word_length]
+            if record < target:
+                low = middle + 1
+            elif record > target:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def is_current(self, source: WordSource) -> bool:
+        """Checks whether the index was compiled from the current contents of
+        the word source. File metadata is compared first so that the common
+        case never reads the source.
+
+        :param source: word source.
+        :return: boolean value representing whether the index is up to date.
+        """
+        if (
+            self.format_version != FORMAT_VERSION
+            or self.word_length != source.word_length
+        ):
+            return False
+        stat = os.stat(source.path)
+        if (stat.st_size, stat.st_mtime_ns) == (self.source_size, self.source_mtime_ns):
+            return True
+        return source_checksum(source.path) == self.source_checksum
+
+
+def load_index(
+    source: Optional[Union[WordSource, str, Path]] = None,
+) -> VocabularyIndex:
+    """Loads the compiled index for a word source, compiling it first if it
+    does not exist yet or if the source changed since it was compiled.
+
+    :param source: optional word source or dictionary path, defaults to the
+    default word source.
+    :return: memory mapped vocabulary index.
+    """
+    source = as_word_source(source)
+    index_path = index_path_for(source)
+
+    try:
+        index: Optional[VocabularyIndex] = VocabularyIndex(index_path)
+    except (OSError, ValueError, struct.error):
+        index = None
+
+    if index is None or not index.is_current(source):
+        index = VocabularyIndex(compile_index(source, index_path))
+        if instrumentation.active is not None:
+            instrumentation.active.count("wordle_index_compiles_total")
+
+    return index
+
+
+class Lexicon:
+    def __init__(self, index: VocabularyIndex) -> None:
+        """Read-only vocabulary shared by any number of games. Words are
+        stored once in the memory mapped index; membership and position
+        lookups go through a hash table built once per lexicon.
+
+        :param index: compiled vocabulary index backing this lexicon.
+        """
+        self.index = index
+        self.word_length = index.word_length
+        self._positions: Dict[str, int] = {word: i for i, word in enumerate(index)}
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, position: int) -> str:
+        return self.index[position]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __contains__(self, word: object) -> bool:
+        return word in self._positions
+
+    def find(self, word: str) -> Optional[int]:
+        """Constant time lookup of a word's position.
+
+        :param word: word to look up.
+        :return: position of the word, or None if it is not in the lexicon.
+        """
+        return self._positions.get(word)
+
+
+@lru_cache(maxsize=None)
+def _shared_lexicon(source: WordSource) -> Lexicon:
+    metrics = instrumentation.active
+    if metrics is None:
+        return Lexicon(load_index(source))
+    with metrics.timer("wordle_vocabulary_load_seconds"):
+        return Lexicon(load_index(source))
+
+
+def get_lexicon(
+    source: Optional[Union[WordSource, str, Path]] = None,
+    word_length: int = WORD_LENGTH,
+) -> Lexicon:
+    """Returns the process wide lexicon for a word source, loading it on
+    first use. Every caller receives the same instance.
+
+    :param source: optional word source or dictionary path, defaults to the
+    default word source.
+    :param word_length: number of letters, used unless source is already a
+    WordSource.
+    :return: shared lexicon.
+    """
+    return _shared_lexicon(as_word_source(source, word_length))
+
+
+if __name__ == "__main__":
+    for path in compile_indexes().values():
+        print(path)
@@ -0,0 +1,60 @@
+"""
+Loads a game in a background thread so that the interface can be drawn before
+the lexicon is ready. Mapping the lexicon, or compiling the index of a new
+dictionary, then overlaps with the first frame and the first keys typed.
+"""
+import threading
+
+from typing import Callable, Optional
+
+from model.wordle_model import WordleModel
+
+
+class ModelLoader:
+    def __init__(
+        self, load: Callable[[], WordleModel], word_length: int, max_guesses: int
+    ) -> None:
+        """Starts loading right away.
+
+        :param load: creates the model, called on the background thread.
+        :param word_length: number of letters of the model's words, so that
+        the board can be laid out before the model exists.
+        :param max_guesses: number of guesses of the model.
+        """
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+        self._load = load
+        self._model: Optional[WordleModel] = None
+        self._error: Optional[BaseException] = None
+        # a daemon thread never keeps a player who quit early waiting
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            self._model = self._load()
+            # hints need the solver (and numpy), which is slow to import and
+            # better imported here than on the first idle tick
+            import model.solver
+        except BaseException as error:
+            self._error = error
+
+    def is_ready(self, timeout: float = 0) -> bool:
+        """Whether the model is loaded (or failed to load).
+
+        :param timeout: how long to wait for it, in seconds.
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def result(self) -> WordleModel:
+        """Waits for the model.
+
+        :return: loaded model.
+        :raise: whatever exception loading the model raised.
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        assert self._model is not None
+        return self._model
@@ -0,0 +1,129 @@
+"""
+Multi-board games (Dordle, Quordle and beyond): every guess is played on K
+boards at once, each with its own winning word. A guess is validated once and
+scored against every unsolved answer in a single batched operation, so the
+cost of a guess barely grows with the number of boards.
+"""
+from array import array
+from datetime import date
+from typing import List, Optional, Sequence
+
+from model.feedback import Feedback
+from model.game_state import GameState
+from model.lexicon import Lexicon, get_lexicon
+from model.schedule import get_schedule
+from model.scoring import encode_words, score_against
+
+
+class MultiBoardModel:
+    EXTRA_GUESSES = 5  # default number of guesses on top of one per board
+
+    def __init__(
+        self,
+        lexicon: Optional[Lexicon] = None,
+        winning_indices: Optional[Sequence[int]] = None,
+        num_boards: int = 2,
+        max_guesses: Optional[int] = None,
+    ) -> None:
+        """Plays num_boards boards that share every guess.
+
+        :param lexicon: optional lexicon to play with. Defaults to the process
+        wide lexicon.
+        :param winning_indices: optional lexicon positions of the winning word
+        of each board. Defaults to today's words.
+        :param num_boards: number of boards, ignored if winning_indices is
+        given.
+        :param max_guesses: optional number of guesses after which the game is
+        lost. Defaults to one per board plus EXTRA_GUESSES.
+        """
+        self.vocabulary = lexicon if lexicon is not None else get_lexicon()
+
+        if winning_indices is None:
+            schedule = get_schedule(self.vocabulary.index)
+            winning_indices = schedule.answer_indices_for(date.today(), num_boards)
+        self.boards = [GameState(winning_index) for winning_index in winning_indices]
+        self.max_guesses = (
+            max_guesses
+            if max_guesses is not None
+            else len(self.boards) + MultiBoardModel.EXTRA_GUESSES
+        )
+
+        # every answer encoded once, so a guess is scored with one call
+        self._answers = encode_words(self.winning_words)
+        self._guesses = array("I")  # lexicon positions of each guess
+        self.did_win: Optional[bool] = None
+
+    @property
+    def num_boards(self) -> int:
+        return len(self.boards)
+
+    @property
+    def word_length(self) -> int:
+        return self.vocabulary.word_length
+
+    @property
+    def winning_words(self) -> List[str]:
+        return [self.vocabulary[board.winning_index] for board in self.boards]
+
+    @property
+    def previous_guesses(self) -> List[str]:
+        """Every guess so far, in order."""
+        return [self.vocabulary[word_index] for word_index in self._guesses]
+
+    def board_guesses(self, board: int) -> List[Feedback]:
+        """Outcomes shown on a board, which stops receiving guesses once it is
+        solved.
+
+        :param board: position of the board.
+        :return: outcome of each guess played on the board, in order.
+        """
+        return [
+            Feedback.of(code, self.word_length) for code in self.boards[board].outcomes
+        ]
+
+    def guess(self, word: str) -> Optional[List[Optional[Feedback]]]:
+        """Plays a guess on every unsolved board. The game must still be
+        ongoing and the guessed word must be a part of the vocabulary and have
+        not been guessed previously.
+
+        :param word: string
+        :return: None if guess was invalid. Otherwise returns one entry per
+        board: the outcome of the guess on that board, or None for boards that
+        were already solved.
+        """
+        word_index = self.vocabulary.find(word)
+        if word_index is None or not self._is_valid_guess(word_index):
+            return None
+        self._guesses.append(word_index)
+
+        unsolved = [i for i, board in enumerate(self.boards) if not board.did_win]
+        codes = score_against(word, self._answers[unsolved]).tolist()
+
+        outcomes: List[Optional[Feedback]] = [None] * len(self.boards)
+        for i, code in zip(unsolved, codes):
+            board = self.boards[i]
+            board.record(word_index, code)
+            if word_index == board.winning_index:
+                board.did_win = True
+            outcomes[i] = Feedback.of(code, len(word))
+
+        if all(board.did_win for board in self.boards):
+            self.did_win = True
+        elif len(self._guesses) == self.max_guesses:
+            self.did_win = False
+            for board in self.boards:
+                if not board.did_win:
+                    board.did_win = False
+
+        return outcomes
+
+    def _is_valid_guess(self, word_index: int) -> bool:
+        """Private method used to determine whether a given word constitutes a valid guess.
+
+        :param word_index: lexicon position of the word to check.
+        :return: boolean value representing whether or not the guess was a
+        valid input.
+        """
+        if self.did_win is not None:
+            return False
+        return word_index not in self._guesses
@@ -0,0 +1,75 @@
+"""
+Line-based protocol spoken between the game server and its clients. Every
+message is a single line of ascii text terminated by a newline; the first word
+is the command.
+
+Server -> client:
+    HELLO <word length> <max guesses>    sent once a session is opened
+    BUSY                                 session limit reached, then closes
+    RESULT <digits> <status> [answer]    outcome of a valid guess, one digit
+                                         (an Accuracy value) per character;
+                                         the answer is revealed once lost
+    INVALID                              the guess was rejected
+    TIMEOUT                              session evicted for being idle
+    ERROR <message>                      malformed request
+    BYE                                  reply to QUIT, then closes
+
+Client -> server:
+    GUESS <word>
+    QUIT
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from model.feedback import Accuracy, Feedback
+
+PLAYING = "PLAYING"
+WON = "WON"
+LOST = "LOST"
+
+
+def game_status(did_win: Optional[bool]) -> str:
+    """Maps a model's did_win flag to a protocol status."""
+    if did_win is None:
+        return PLAYING
+    return WON if did_win else LOST
+
+
+def did_win_from_status(status: str) -> Optional[bool]:
+    """Inverse of game_status."""
+    if status == PLAYING:
+        return None
+    return status == WON
+
+
+def encode_outcome(outcome: Sequence[Accuracy]) -> str:
+    """Encodes an outcome as one digit per character, e.g. "20100"."""
+    if isinstance(outcome, Feedback):
+        return outcome.digits
+    return "".join(str(accuracy.value) for accuracy in outcome)
+
+
+def decode_outcome(digits: str) -> Feedback:
+    """Inverse of encode_outcome."""
+    return Feedback.from_digits(digits)
+
+
+def format_message(command: str, *args: object) -> bytes:
+    """Builds a newline terminated message.
+
+    :param command: message command, e.g. "GUESS".
+    :param args: space separated arguments.
+    :return: encoded line.
+    """
+    return (" ".join([command, *map(str, args)]) + "\n").encode("ascii")
+
+
+def parse_message(line: bytes) -> Tuple[str, List[str]]:
+    """Splits a received line into its command and arguments.
+
+    :param line: raw line, with or without its newline.
+    :return: upper cased command and the list of arguments.
+    """
+    parts = line.decode("ascii", errors="replace").split()
+    if not parts:
+        return "", []
+    return parts[0].upper(), parts[1:]
@@ -0,0 +1,183 @@
+"""
+Deterministic daily answer schedule. A seeded permutation of the vocabulary is
+stored next to the compiled index, so the answer for any date is found by
+reading one entry of the schedule and one record of the index, without
+loading the word list.
+
+Schedule layout: a fixed size header followed by one little endian uint32
+index position per day, repeating once every word has been used.
+"""
+import mmap
+import os
+import random
+import struct
+
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+from model.lexicon import VocabularyIndex
+
+# day zero of the schedule
+EPOCH = date(2021, 6, 19)
+DEFAULT_SEED = 0
+
+MAGIC = b"WRDS"
+FORMAT_VERSION = 1
+
+# magic, format version, seed, number of entries and sha256 digest of the
+# source dictionary the index was compiled from
+HEADER = struct.Struct("<4sHQI32s")
+ENTRY = struct.Struct("<I")
+
+
+def schedule_path_for(index: VocabularyIndex, seed: int = DEFAULT_SEED) -> Path:
+    """Location of the schedule for a compiled index.
+
+    :param index: compiled vocabulary index.
+    :param seed: seed of the permutation.
+    :return: path next to the index.
+    """
+    return index.path.with_name(f"{index.path.stem}.{seed}.schedule")
+
+
+def compile_schedule(
+    index: VocabularyIndex,
+    seed: int = DEFAULT_SEED,
+    schedule_path: Optional[Path] = None,
+) -> Path:
+    """Writes a seeded permutation of the index positions.
+
+    :param index: compiled vocabulary index.
+    :param seed: seed of the permutation.
+    :param schedule_path: optional destination, defaults to next to the index.
+    :return: path of the schedule.
+    """
+    if schedule_path is None:
+        schedule_path = schedule_path_for(index, seed)
+
+    positions = list(range(len(index)))
+    random.Random(seed).shuffle(positions)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, seed, len(index), index.source_checksum)
+    tmp_path = schedule_path.with_name(f"{schedule_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as schedule_file:
+        schedule_file.write(header)
+        schedule_file.write(struct.pack(f"<{len(positions)}I", *positions))
+    os.replace(tmp_path, schedule_path)
+
+    return schedule_path
+
+
+class AnswerSchedule:
+    def __init__(self, index: VocabularyIndex, schedule_path: Path) -> None:
+        """Memory mapped schedule of answers.
+
+        :param index: compiled vocabulary index the schedule refers to.
+        :param schedule_path: path of the compiled schedule.
+        """
+        self.index = index
+        with open(schedule_path, "rb") as schedule_file:
+            self._buffer = mmap.mmap(schedule_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.format_version, self.seed, self._count, self.source_checksum = (
+            HEADER.unpack_from(self._buffer, 0)
+        )
+        if magic != MAGIC:
+            raise ValueError(f"{schedule_path} is not a compiled answer schedule.")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def matches(self, index: VocabularyIndex) -> bool:
+        """Checks whether the schedule was compiled for the given index."""
+        return (
+            self.format_version == FORMAT_VERSION
+            and self._count == len(index)
+            and self.source_checksum == index.source_checksum
+        )
+
+    def _slot(self, day: date) -> int:
+        return (day - EPOCH).days % self._count
+
+    def _entry(self, slot: int) -> int:
+        return ENTRY.unpack_from(self._buffer, HEADER.size + slot * ENTRY.size)[0]
+
+    def answer_index_for(self, day: date) -> int:
+        """Index position of the answer for a date.
+
+        :param day: date to look up.
+        :return: position of the answer in the vocabulary index.
+        """
+        return self._entry(self._slot(day))
+
+    def answer_indices_for(self, day: date, count: int) -> List[int]:
+        """Index positions of the answers for a date when several words are
+        played at once. Every day uses its own block of entries, so a day's
+        answers never reappear the next day.
+
+        :param day: date to look up.
+        :param count: number of answers.
+        :return: positions of the answers in the vocabulary index.
+        """
+        first_slot = (day - EPOCH).days * count
+        return [
+            self._entry((first_slot + offset) % self._count) for offset in range(count)
+        ]
+
+    def answer_for(self, day: date) -> str:
+        """Answer for a date.
+
+        :param day: date to look up.
+        :return: winning word.
+        """
+        return self.index[self.answer_index_for(day)]
+
+    def answers_from(self, start: date, num_days: int) -> List[str]:
+        """Answers for consecutive days, e.g. the next 365 days.
+
+        :param start: first date.
+        :param num_days: number of days.
+        :return: winning words in date order.
+        """
+        first_slot = self._slot(start)
+        return [
+            self.index[self._entry((first_slot + offset) % self._count)]
+            for offset in range(num_days)
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_schedule(index: VocabularyIndex, seed: int = DEFAULT_SEED) -> AnswerSchedule:
+    """Loads the schedule for an index, compiling it first if it is missing
+    or was compiled for a different vocabulary. Schedules are cached per
+    index.
+
+    :param index: compiled vocabulary index.
+    :param seed: seed of the permutation.
+    :return: memory mapped answer schedule.
+    :raise ValueError: if the index has no words to choose answers from.
+    """
+    if not len(index):
+        raise ValueError(
+            f"The dictionary has no {index.word_length} letter words to choose "
+            "answers from, please pick another dictionary or word length."
+        )
+    schedule_path = schedule_path_for(index, seed)
+    try:
+        schedule: Optional[AnswerSchedule] = AnswerSchedule(index, schedule_path)
+    except (OSError, ValueError, struct.error):
+        schedule = None
+
+    if schedule is None or not schedule.matches(index) or schedule.seed != seed:
+        schedule = AnswerSchedule(index, compile_schedule(index, seed, schedule_path))
+
+    return schedule
+
+
+if __name__ == "__main__":
+    from model.lexicon import load_index
+    from model.word_sources import WORD_LENGTHS, default_source
+
+    for word_length in WORD_LENGTHS:
+        print(compile_schedule(load_index(default_source(word_length))))
@@ -0,0 +1,116 @@
+"""
+Vectorized scoring engine. Words are encoded as rows of uint8 letter codes
+(0 for "a" through 25 for "z") and whole arrays of guesses are scored against
+whole arrays of answers at once. Every result is an outcome packed the same
+way as wordle_model.pack_outcome: a base 3 integer where the first character
+is the least significant digit, so 0..242 for five letter words. Codes fit a
+uint8 for words of up to five letters and a uint16 for longer words (see
+outcome_dtype). Duplicate letters are scored like wordle_model.score_guess.
+"""
+from typing import Sequence, Union
+
+import numpy as np
+
+from model.lexicon import Lexicon
+
+ALPHABET_SIZE = 26
+
+# upper bound on the number of guess x answer x letter x letter cells computed
+# at once
+CHUNK_CELLS = 1 << 24
+
+Words = Union[Sequence[str], np.ndarray]
+
+
+def encode_words(words: Sequence[str]) -> np.ndarray:
+    """Encodes equal length lowercase words into a letter code matrix.
+
+    :param words: words to encode.
+    :return: uint8 array of shape (len(words), word length).
+    """
+    if len(words) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    raw = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return (raw - ord("a")).reshape(len(words), -1)
+
+
+def encode_lexicon(lexicon: Lexicon) -> np.ndarray:
+    """Encodes a whole lexicon straight from its memory mapped records,
+    without decoding any words.
+
+    :param lexicon: lexicon to encode.
+    :return: uint8 array of shape (len(lexicon), word length).
+    """
+    raw = np.frombuffer(lexicon.index.records, dtype=np.uint8)
+    return (raw - ord("a")).reshape(len(lexicon), lexicon.word_length)
+
+
+def outcome_dtype(word_length: int) -> type:
+    """Smallest unsigned integer type that holds every outcome code for a
+    word length.
+    """
+    return np.uint8 if 3**word_length <= 1 << 8 else np.uint16
+
+
+def _as_encoded(words: Words) -> np.ndarray:
+    if isinstance(words, np.ndarray):
+        return words
+    return encode_words(words)
+
+
+def score_matrix(guesses: Words, answers: Words) -> np.ndarray:
+    """Scores every guess against every answer.
+
+    :param guesses: words or encoded words to score.
+    :param answers: words or encoded words to score against.
+    :return: array of shape (len(guesses), len(answers)) holding packed
+    outcome codes, see outcome_dtype.
+    """
+    guesses = _as_encoded(guesses)
+    answers = _as_encoded(answers)
+    num_guesses, word_length = guesses.shape
+    num_answers = len(answers)
+
+    dtype = outcome_dtype(word_length)
+    result = np.empty((num_guesses, num_answers), dtype=dtype)
+    if num_guesses == 0 or num_answers == 0:
+        return result
+
+    powers = 3 ** np.arange(word_length, dtype=dtype)
+
+    # number of occurrences of each letter in every answer
+    answer_counts = np.zeros((num_answers, ALPHABET_SIZE), dtype=np.uint8)
+    for position in range(word_length):
+        np.add.at(answer_counts, (np.arange(num_answers), answers[:, position]), 1)
+
+    # earlier[i, k] is set for the positions k scored before position i
+    earlier = np.tri(word_length, k=-1, dtype=bool)
+
+    chunk = max(1, CHUNK_CELLS // (num_answers * word_length * word_length))
+    for start in range(0, num_guesses, chunk):
+        guess_chunk = guesses[start : start + chunk]
+        is_correct = guess_chunk[:, None, :] == answers[None, :, :]
+        # same_letter[g, i, k]: positions i and k of guess g hold the same letter
+        same_letter = guess_chunk[:, :, None] == guess_chunk[:, None, :]
+        # occurrences of the letter at position i already used up by correct
+        # positions or by earlier positions of the guess
+        consumed = (
+            same_letter[:, None, :, :]
+            & (is_correct[:, :, None, :] | earlier[None, None, :, :])
+        ).sum(axis=3, dtype=np.uint8)
+        available = answer_counts[:, guess_chunk].transpose(1, 0, 2)
+        exists = ~is_correct & (available > consumed)
+        digits = np.where(is_correct, 2, exists).astype(dtype)
+        result[start : start + chunk] = (digits * powers).sum(axis=2, dtype=dtype)
+
+    return result
+
+
+def score_against(guess: str, answers: Words) -> np.ndarray:
+    """Scores a single guess against every answer.
+
+    :param guess: guessed word.
+    :param answers: words or encoded words to score against.
+    :return: array of packed outcome codes, one per answer.
+    """
+    return score_matrix(encode_words([guess]), answers)[0]
@@ -0,0 +1,193 @@
+"""
+Solver and hint engine. The solver keeps track of which answers are still
+consistent with a game's previous guesses and ranks possible next guesses by
+their expected information (the entropy of the feedback they would produce
+over the remaining candidates). All scoring is done in batches, either through
+the precomputed feedback table or the vectorized scorer.
+"""
+import time
+
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from model.constraints import Constraints
+from model.lexicon import Lexicon
+from model.scoring import encode_lexicon, score_matrix
+from model.feedback import Accuracy, Feedback
+
+# default time allowed for ranking, small enough to keep the ui responsive
+DEFAULT_TIME_BUDGET = 0.1
+
+# number of guesses whose feedback distributions are computed at once
+GUESSES_PER_BATCH = 128
+
+# candidate answers get a small bonus since they can win the game outright
+CANDIDATE_BONUS = 1e-3
+
+
+class RankedGuess(NamedTuple):
+    word: str
+    expected_information: float  # in bits
+
+
+class Solver:
+    def __init__(
+        self,
+        lexicon: Lexicon,
+        table: Optional[np.ndarray] = None,
+        hard_mode: bool = False,
+    ) -> None:
+        """Starts with every word in the lexicon as a candidate answer.
+
+        :param lexicon: lexicon shared with the game being solved.
+        :param table: optional feedback table for the lexicon (see
+        feedback_table.load_table). Without it feedback is computed on the fly.
+        :param hard_mode: whether only guesses consistent with the outcomes of
+        the previous ones are ranked, as a hard mode game requires.
+        """
+        self.lexicon = lexicon
+        self.table = table
+        self.hard_mode = hard_mode
+        self.words = encode_lexicon(lexicon)
+        self.candidates = np.arange(len(lexicon))
+        self.num_patterns = 3**lexicon.word_length
+        self.constraints = Constraints(lexicon.word_length)
+        self._num_seen_guesses = 0
+
+    def _feedback(self, guess_indices: np.ndarray, answers: np.ndarray) -> np.ndarray:
+        if self.table is not None:
+            return self.table[guess_indices][:, answers]
+        return score_matrix(self.words[guess_indices], self.words[answers])
+
+    def add_guess(self, word: str, outcome: Sequence[Accuracy]) -> None:
+        """Removes every candidate that would not have produced the outcome.
+
+        :param word: guessed word.
+        :param outcome: list of Accuracy's for each character in the guess.
+        """
+        guess_index = self.lexicon.find(word)
+        if guess_index is None:
+            raise ValueError(f"{word} is not part of the lexicon.")
+        code = Feedback.from_accuracies(outcome).code
+        self.constraints.add(word, code)
+        if self.table is not None:
+            feedback = self.table[guess_index][self.candidates]
+            self.candidates = self.candidates[feedback == code]
+        else:
+            # cheaper than scoring the guess against every candidate
+            matches = self.constraints.filter(self.words[self.candidates])
+            self.candidates = self.candidates[matches]
+
+    def update(
+        self, previous_guesses: Sequence[Tuple[str, Sequence[Accuracy]]]
+    ) -> None:
+        """Catches up with a game's guesses. Only guesses made since the last
+        update are applied, so this is cheap to call after every guess.
+
+        :param previous_guesses: the game's (word, outcome) pairs in order.
+        """
+        for word, outcome in previous_guesses[self._num_seen_guesses :]:
+            self.add_guess(word, outcome)
+        self._num_seen_guesses = len(previous_guesses)
+
+    @property
+    def remaining(self) -> List[str]:
+        """Words that are still possible answers."""
+        return [self.lexicon[index] for index in self.candidates]
+
+    def expected_information(self, guess_indices: np.ndarray) -> np.ndarray:
+        """Entropy of the feedback distribution each guess would produce over
+        the remaining candidates.
+
+        :param guess_indices: lexicon positions of the guesses to evaluate.
+        :return: float array of entropies in bits, one per guess.
+        """
+        feedback = self._feedback(guess_indices, self.candidates).astype(np.int64)
+        # count patterns for all guesses at once by giving each row its own
+        # range of bins
+        offsets = np.arange(len(guess_indices))[:, None] * self.num_patterns
+        counts = np.bincount(
+            (feedback + offsets).ravel(),
+            minlength=len(guess_indices) * self.num_patterns,
+        ).reshape(len(guess_indices), self.num_patterns)
+        probabilities = counts / len(self.candidates)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = np.where(counts > 0, probabilities * np.log2(probabilities), 0.0)
+        return -terms.sum(axis=1)
+
+    def iter_rank(
+        self, limit: int = 1, batch_size: int = GUESSES_PER_BATCH
+    ) -> Iterator[List[RankedGuess]]:
+        """Ranks guesses by expected information one batch at a time.
+        Remaining candidates are evaluated first, then the rest of the
+        lexicon (in hard mode, only the words the constraints allow). The best
+        guesses found so far are yielded after every batch, so the caller
+        decides when to stop, e.g. when it runs out of time.
+
+        :param limit: maximum number of guesses to yield.
+        :param batch_size: number of guesses evaluated between two yields.
+        :return: iterator over the best guesses so far, most informative
+        first.
+        """
+        if len(self.candidates) <= 2:
+            yield [
+                RankedGuess(self.lexicon[index], float(len(self.candidates) - 1))
+                for index in self.candidates[:limit]
+            ]
+            return
+
+        is_candidate = np.zeros(len(self.lexicon), dtype=bool)
+        is_candidate[self.candidates] = True
+        order = np.concatenate([self.candidates, np.flatnonzero(~is_candidate)])
+        if self.hard_mode:
+            order = order[self.constraints.filter(self.words[order])]
+
+        best_indices = order[:0]
+        best_scores = np.zeros(0)
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            scores = (
+                self.expected_information(batch) + CANDIDATE_BONUS * is_candidate[batch]
+            )
+            # keep the best so far first so that ties go to earlier guesses
+            guess_indices = np.concatenate([best_indices, batch])
+            all_scores = np.concatenate([best_scores, scores])
+            best = np.argsort(-all_scores, kind="stable")[:limit]
+            best_indices, best_scores = guess_indices[best], all_scores[best]
+            yield [
+                RankedGuess(
+                    self.lexicon[index],
+                    float(score - CANDIDATE_BONUS * is_candidate[index]),
+                )
+                for index, score in zip(best_indices, best_scores)
+            ]
+
+    def rank(
+        self, limit: int = 1, time_budget: Optional[float] = DEFAULT_TIME_BUDGET
+    ) -> List[RankedGuess]:
+        """Ranks guesses by expected information (see iter_rank) until the
+        time budget runs out; the best guesses found so far are returned.
+
+        :param limit: maximum number of guesses to return.
+        :param time_budget: optional number of seconds allowed for ranking.
+        None evaluates the whole lexicon.
+        :return: best guesses, most informative first.
+        """
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+        ranked: List[RankedGuess] = []
+        for ranked in self.iter_rank(limit):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+        return ranked
+
+    def best_guess(
+        self, time_budget: Optional[float] = DEFAULT_TIME_BUDGET
+    ) -> Optional[str]:
+        """Most informative next guess found within the time budget.
+
+        :param time_budget: optional number of seconds allowed for ranking.
+        :return: guessed word, or None if no candidates remain.
+        """
+        ranked = self.rank(1, time_budget)
+        return ranked[0].word if ranked else None
@@ -0,0 +1,173 @@
+"""
+Backends the vocabulary can be compiled from. A WordSource only knows where
+its words live and how to read them: nothing is read until the lexicon has to
+(re)compile its index, and compiled indexes are cached per source.
+
+- SystemDictionary: the system's word list, one word per line.
+- DictionaryFile: any user provided word list, one word per line.
+- BundledWordList: the compact list shipped with the game, which needs no
+  system packages. Each line holds every word of one length, prefixed with
+  that length and concatenated without separators, e.g. "4:ableacheacid...".
+
+A source is read in a single pass for every supported word length at once
+(see words_by_length), so switching between variants never re-parses it.
+"""
+import copy
+import hashlib
+import os
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Union
+
+SYSTEM_DICTIONARY_PATH = Path("/usr/share/dict/american-english")
+BUNDLED_WORDS_PATH = Path(__file__).parent / "data" / "words.txt"
+WORD_LENGTH = 5
+WORD_LENGTHS = range(4, 9)  # word lengths of the supported game variants
+
+
+def is_playable_word(word: str, word_length: int = WORD_LENGTH) -> bool:
+    """Determines whether a dictionary entry can be used in the game.
+
+    :param word: stripped line from the dictionary.
+    :param word_length: number of letters words must have.
+    :return: boolean value representing whether the word is playable.
+    """
+    is_alpha = (
+        word.isascii() and word.isalpha()
+    )  # excludes conjunctive words and foreign words with special characters
+    is_proper_noun = any([c.isupper() for c in word])
+    is_right_length = len(word) == word_length
+    return is_alpha and not is_proper_noun and is_right_length
+
+
+class WordSource(ABC):
+    def __init__(self, path: Union[str, Path], word_length: int = WORD_LENGTH) -> None:
+        """A file of words, read lazily. Sources are compared by value, so
+        equal sources share their compiled index and lexicon.
+
+        :param path: path of the file holding the words.
+        :param word_length: number of letters of the words to play with.
+        """
+        self.path = Path(path)
+        self.word_length = word_length
+
+    @property
+    def name(self) -> str:
+        """Name the compiled index of this source is stored under: the file
+        name, plus a digest of the full path that keeps files sharing a name
+        (e.g. two "words" files) from overwriting each other's index.
+        """
+        digest = hashlib.sha256(str(self.path.resolve()).encode()).hexdigest()
+        return f"{self.path.name}.{digest[:12]}"
+
+    def is_available(self) -> bool:
+        return self.path.is_file()
+
+    @abstractmethod
+    def entries(self) -> Iterator[str]:
+        """Every entry of the source, playable or not."""
+
+    def words(self) -> Iterator[str]:
+        """Playable words of the source, in no particular order."""
+        for word in self.entries():
+            if is_playable_word(word, self.word_length):
+                yield word
+
+    def words_by_length(self, word_lengths: Iterable[int]) -> Dict[int, Set[str]]:
+        """Partitions the playable words of the source by length in a single
+        pass.
+
+        :param word_lengths: word lengths to collect.
+        :return: set of playable words for each requested length.
+        """
+        partitions: Dict[int, Set[str]] = {length: set() for length in word_lengths}
+        for word in self.entries():
+            partition = partitions.get(len(word))
+            if partition is not None and is_playable_word(word, len(word)):
+                partition.add(word)
+        return partitions
+
+    def with_length(self, word_length: int) -> "WordSource":
+        """The same source, played with words of another length."""
+        source = copy.copy(self)
+        source.word_length = word_length
+        return source
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            type(self) is type(other)
+            and isinstance(other, WordSource)
+            and (self.path, self.word_length) == (other.path, other.word_length)
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.path, self.word_length))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, {self.word_length})"
+
+
+class DictionaryFile(WordSource):
+    def entries(self) -> Iterator[str]:
+        with open(self.path) as vocab_file:
+            for line in vocab_file:
+                yield line.strip()
+
+
+class SystemDictionary(DictionaryFile):
+    def __init__(self, word_length: int = WORD_LENGTH) -> None:
+        super().__init__(SYSTEM_DICTIONARY_PATH, word_length)
+
+
+class BundledWordList(WordSource):
+    def __init__(self, word_length: int = WORD_LENGTH) -> None:
+        super().__init__(BUNDLED_WORDS_PATH, word_length)
+
+    @property
+    def name(self) -> str:
+        return "bundled"
+
+    def entries(self) -> Iterator[str]:
+        with open(self.path) as words_file:
+            for line in words_file:
+                length, _, words = line.rstrip("\n").partition(":")
+                word_length = int(length)
+                for start in range(0, len(words), word_length):
+                    yield words[start : start + word_length]
+
+
+def default_source(word_length: int = WORD_LENGTH) -> WordSource:
+    """The word source to play with when none is given: the file named by
+    the WORDLE_DICTIONARY environment variable, else the system dictionary
+    if it is installed, else the bundled word list.
+
+    :param word_length: number of letters of the words to play with.
+    :return: word source.
+    """
+    path = os.environ.get("WORDLE_DICTIONARY")
+    if path:
+        return DictionaryFile(path, word_length)
+    system = SystemDictionary(word_length)
+    if system.is_available():
+        return system
+    return BundledWordList(word_length)
+
+
+def as_word_source(
+    source: Optional[Union[WordSource, str, Path]] = None,
+    word_length: int = WORD_LENGTH,
+) -> WordSource:
+    """Normalizes the ways a vocabulary can be specified.
+
+    :param source: word source, path of a dictionary file, or None for the
+    default source.
+    :param word_length: number of letters, used unless source is already a
+    WordSource.
+    :return: word source.
+    """
+    if isinstance(source, WordSource):
+        return source
+    if source is None or source == "":
+        return default_source(word_length)
+    return DictionaryFile(source, word_length)
@@ -1,99 +1,284 @@
 """
 The model maintains the game's state in the simplest way possible.
 """
-import enum
-
 from datetime import date
-from pathlib import Path
 from typing import Optional, List, Tuple
 
+import instrumentation
+
+from model.constraints import Constraints
+from model.feedback import Accuracy, Feedback
+from model.game_state import GameState
+from model.journal import GameJournal, status_code
+from model.lexicon import Lexicon, get_lexicon
+from model.schedule import get_schedule
+
+ALPHABET_SIZE = 26
+
+
+def letter_counts(word: str) -> bytearray:
+    """Counts the occurrences of each letter in a lowercase word.
+
+    :param word: word to count.
+    :return: table of ALPHABET_SIZE counts, indexed by ord(letter) - ord("a").
+    """
+    counts = bytearray(ALPHABET_SIZE)
+    for char in word:
+        counts[ord(char) - ord("a")] += 1
+    return counts
+
+
+def score_guess(word: str, winning_word: str) -> List[Accuracy]:
+    """Reference scorer for a single guess against a single winning word.
+    Letters in the right place are CORRECT. Each remaining occurrence of a
+    letter in the winning word then marks at most one other occurrence of
+    that letter in the guess as EXISTS, from left to right.
+
+    :param word: guessed word.
+    :param winning_word: word the guess is scored against.
+    :return: list of Accuracy's for each character in the guess.
+    """
+    outcome = [Accuracy.ABSENT] * len(word)
+    unmatched = []
+    for i, (char, winning_char) in enumerate(zip(word, winning_word)):
+        if char == winning_char:
+            outcome[i] = Accuracy.CORRECT
+        else:
+            unmatched.append(winning_char)
+
+    for i, char in enumerate(word):
+        if outcome[i] != Accuracy.CORRECT and char in unmatched:
+            outcome[i] = Accuracy.EXISTS
+            unmatched.remove(char)
+    return outcome
 
-class Accuracy(enum.Enum):
-    """Enum representing the accuracy of a given character in a guess."""
 
-    ABSENT = 0
-    EXISTS = 1
-    CORRECT = 2
+def score_code(
+    word: str, winning_word: str, winning_counts: Optional[bytearray] = None
+) -> int:
+    """Same scoring as score_guess, but produces the packed outcome code
+    directly from a letter count table without building a list.
+
+    :param word: guessed word.
+    :param winning_word: word the guess is scored against.
+    :param winning_counts: optional letter_counts of the winning word, so
+    that the table can be computed once per answer.
+    :return: packed outcome code.
+    """
+    remaining = bytearray(
+        winning_counts if winning_counts is not None else letter_counts(winning_word)
+    )
+    code = 0
+    power = 1
+    pending = []
+    for char, winning_char in zip(word, winning_word):
+        if char == winning_char:
+            code += 2 * power
+            remaining[ord(char) - ord("a")] -= 1
+        else:
+            pending.append((char, power))
+        power *= 3
+
+    for char, power in pending:
+        letter = ord(char) - ord("a")
+        if remaining[letter]:
+            code += power
+            remaining[letter] -= 1
+    return code
+
+
+def pack_outcome(outcome: List[Accuracy]) -> int:
+    """Packs an outcome into a single base 3 integer where the first
+    character is the least significant digit.
+
+    :param outcome: list of Accuracy's for each character in a guess.
+    :return: packed outcome code.
+    """
+    code = 0
+    for accuracy in reversed(outcome):
+        code = code * 3 + accuracy.value
+    return code
+
+
+def unpack_outcome(code: int, length: int) -> List[Accuracy]:
+    """Inverse of pack_outcome.
+
+    :param code: packed outcome code.
+    :param length: number of characters in the guess.
+    :return: list of Accuracy's for each character in the guess.
+    """
+    return Feedback.of(code, length).to_list()
 
 
 class WordleModel:
-    MAX_GUESSES = 6
+    MAX_GUESSES = 6  # default number of guesses
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        lexicon: Optional[Lexicon] = None,
+        winning_index: Optional[int] = None,
+        journal: Optional[GameJournal] = None,
+        game_id: Optional[int] = None,
+        player_id: int = 0,
+        max_guesses: int = MAX_GUESSES,
+        hard_mode: bool = False,
+    ) -> None:
         """Responsible for loading the vocabulary and choosing today's winning
-        word.
+        word. Everything specific to this game lives in a compact GameState,
+        the vocabulary itself is shared.
+
+        :param lexicon: optional lexicon to play with. Defaults to the process
+        wide lexicon, which is shared rather than copied between games.
+        :param winning_index: optional lexicon position of the winning word.
+        Defaults to today's word.
+        :param journal: optional journal every valid guess is appended to.
+        :param game_id: optional id of this game in the journal. Defaults to a
+        new id reserved from the journal.
+        :param player_id: id of the player, recorded in the journal.
+        :param max_guesses: number of guesses after which the game is lost.
+        The word length is the lexicon's.
+        :param hard_mode: whether every guess must be consistent with the
+        outcomes of the previous ones.
         """
-        self.previous_guesses: List[Tuple[str, List[Accuracy]]] = []
-
-        # load vocabulary
-        self.vocabulary = []
-        vocab_path = Path("/usr/share/dict/american-english")
-        with open(vocab_path) as vocab_file:
-            lines = vocab_file.readlines()
-            for line in lines:
-                word = line.strip()
-                is_alpha = all(
-                    [c.isalpha() for c in word]
-                )  # excludes conjunctive words and foreign words with special characters
-                is_proper_noun = any([c.isupper() for c in word])
-                is_five_letters = len(word) == 5
-                if is_alpha and not is_proper_noun and is_five_letters:
-                    self.vocabulary.append(word)
-
-        # choose winning word based on date
-        today = date.today()
-        date_hash = hash(today)
-        index = date_hash % len(self.vocabulary)
-        self.winning_word = self.vocabulary[index]
-
-        self.did_win: Optional[bool] = None
-
-    def guess(self, word: str) -> Optional[List[Accuracy]]:
+        # load vocabulary (shared with every other game in this process)
+        self.vocabulary = lexicon if lexicon is not None else get_lexicon()
+
+        if winning_index is None:
+            # choose winning word based on date
+            schedule = get_schedule(self.vocabulary.index)
+            winning_index = schedule.answer_index_for(date.today())
+        self.state = GameState(winning_index)
+        self.max_guesses = max_guesses
+        self.hard_mode = hard_mode
+        self._winning_counts: Optional[bytearray] = None
+        self._constraints = Constraints(self.word_length)
+
+        self.journal = journal
+        self.player_id = player_id
+        if game_id is None and journal is not None:
+            game_id = journal.new_game_id()
+        self.game_id = game_id or 0
+
+    @property
+    def word_length(self) -> int:
+        return self.vocabulary.word_length
+
+    @property
+    def winning_word(self) -> str:
+        return self.vocabulary[self.state.winning_index]
+
+    @property
+    def did_win(self) -> Optional[bool]:
+        return self.state.did_win
+
+    @property
+    def previous_guesses(self) -> List[Tuple[str, Feedback]]:
+        """Decodes the game state into (word, outcome) pairs in guess order."""
+        length = self.word_length
+        return [
+            (self.vocabulary[word_index], Feedback.of(code, length))
+            for word_index, code in zip(self.state.guesses, self.state.outcomes)
+        ]
+
+    @property
+    def constraints(self) -> Constraints:
+        """Constraints revealed by the guesses so far. They are updated
+        incrementally, with only the guesses made since the last access.
+        """
+        constraints = self._constraints
+        seen = constraints.num_guesses
+        for word_index, code in zip(
+            self.state.guesses[seen:], self.state.outcomes[seen:]
+        ):
+            constraints.add(self.vocabulary[word_index], code)
+        return constraints
+
+    def breaks_hard_mode(self, word: str) -> bool:
+        """Checks whether a word is refused only because it ignores hints
+        revealed by previous guesses.
+
+        :param word: string
+        :return: True in hard mode for words of the vocabulary that are not
+        consistent with every previous outcome.
+        """
+        return (
+            self.hard_mode
+            and word in self.vocabulary
+            and not self.constraints.allows(word)
+        )
+
+    def guess(self, word: str) -> Optional[Feedback]:
         """Handles guesses. The game must still be ongoing and the guessed
         word must be a part of the vocabulary and have not been guessed
-        previously.
+        previously. In hard mode it must also be consistent with the outcomes
+        of the previous guesses.
 
         :param word: string
         :return: None if guess was invalid. Otherwise returns the outcome of'
-        the guess as represented by a list of Accuracy's for each character in
-        the guess.
+        the guess as a Feedback, which behaves like a list of Accuracy's for
+        each character in the guess (see Feedback.to_list).
         """
-        if not self._is_valid_guess(word):
+        metrics = instrumentation.active
+        if metrics is None:
+            return self._guess(word)
+        with metrics.timer("wordle_guess_seconds"):
+            outcome = self._guess(word)
+        if outcome is None:
+            metrics.count("wordle_invalid_guesses_total")
+        return outcome
+
+    def _guess(self, word: str) -> Optional[Feedback]:
+        word_index = self.vocabulary.find(word)
+        if word_index is None or not self._is_valid_guess(word_index):
             return None
 
-        outcome = []
-        for i, char in enumerate(word):
-            if char not in self.winning_word:
-                outcome.append(Accuracy.ABSENT)
-            elif char == self.winning_word[i]:
-                outcome.append(Accuracy.CORRECT)
-            else:
-                outcome.append(Accuracy.EXISTS)
+        code = self._score(word)
+        self.state.record(word_index, code)
 
-        self.previous_guesses.append((word, outcome))
+        if word_index == self.state.winning_index:
+            self.state.did_win = True
+        elif len(self.state) == self.max_guesses:
+            self.state.did_win = False
 
-        if word == self.winning_word:
-            self.did_win = True
-        elif len(self.previous_guesses) == WordleModel.MAX_GUESSES:
-            self.did_win = False
+        if self.journal is not None:
+            self.journal.append(
+                self.game_id,
+                self.player_id,
+                self.state.winning_index,
+                word_index,
+                code,
+                len(self.state),
+                status_code(self.state.did_win),
+            )
 
-        return outcome
+        return Feedback.of(code, len(word))
 
-    def _is_valid_guess(self, word: str) -> bool:
+    def _score(self, word: str) -> int:
+        """Scores a valid guess against the winning word.
+
+        :param word: guessed word.
+        :return: packed outcome code.
+        """
+        winning_word = self.winning_word
+        if self._winning_counts is None:
+            self._winning_counts = letter_counts(winning_word)
+        return score_code(word, winning_word, self._winning_counts)
+
+    def _is_valid_guess(self, word_index: int) -> bool:
         """Private method used to determine whether a given word constitutes a valid guess.
 
-        :param word: string to check.
+        :param word_index: lexicon position of the word to check.
         :return: boolean value representing whether or not the guess was a
         valid input.
         """
-        if self.did_win is not None:
-            return False
-        if len(self.previous_guesses) == WordleModel.MAX_GUESSES:
+        if self.state.did_win is not None:
             return False
-        if word not in self.vocabulary:
+        if len(self.state) == self.max_guesses:
             return False
-        if word in [guessed_word for guessed_word, outcome in self.previous_guesses]:
+        if self.state.has_guessed(word_index):
             return False
+        if self.hard_mode:
+            return self.constraints.allows(self.vocabulary[word_index])
         return True
 
 
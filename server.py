@@ -0,0 +1,221 @@
+"""Asyncio game server. Hosts many WordleModel sessions in one process, all
+sharing a single loaded lexicon, and speaks the newline delimited protocol
+described in model/protocol.py over TCP or a unix socket. Every connection is
+one session.
+"""
+import argparse
+import asyncio
+import sys
+
+from typing import Dict, Optional, Sequence
+
+import instrumentation
+
+from controller.headless import render_model
+from model.lexicon import Lexicon, get_lexicon
+from model.protocol import (
+    LOST,
+    encode_outcome,
+    format_message,
+    game_status,
+    parse_message,
+)
+from model.word_sources import WORD_LENGTH, WORD_LENGTHS
+from model.wordle_model import WordleModel
+
+DEFAULT_PORT = 7777
+DEFAULT_MAX_SESSIONS = 1024
+DEFAULT_IDLE_TIMEOUT = 300.0  # seconds
+
+# requests are tiny, anything longer than this is rejected outright
+MAX_LINE_LENGTH = 256
+
+
+class GameServer:
+    def __init__(
+        self,
+        lexicon: Optional[Lexicon] = None,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_guesses: int = WordleModel.MAX_GUESSES,
+        show_games: bool = False,
+        hard_mode: bool = False,
+        winning_index: Optional[int] = None,
+    ) -> None:
+        """Responsible for session bookkeeping. Connections beyond
+        max_sessions are turned away with BUSY and sessions that stay silent
+        for idle_timeout seconds are evicted.
+
+        :param lexicon: optional lexicon shared by every session. Defaults to
+        the process wide lexicon.
+        :param max_sessions: maximum number of concurrent sessions.
+        :param idle_timeout: seconds of inactivity before a session is evicted.
+        :param max_guesses: number of guesses every game is played with.
+        :param show_games: whether to print the board of every finished game.
+        :param hard_mode: whether every game is played in hard mode.
+        :param winning_index: optional lexicon position of the word every game
+        is won with. Defaults to today's word.
+        """
+        self.lexicon = lexicon if lexicon is not None else get_lexicon()
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.max_guesses = max_guesses
+        self.show_games = show_games
+        self.hard_mode = hard_mode
+        self.winning_index = winning_index
+        self.sessions: Dict[int, WordleModel] = {}
+        self._next_session_id = 0
+
+    async def start_tcp(
+        self, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+    ) -> asyncio.AbstractServer:
+        """Starts listening on a TCP socket.
+
+        :param host: interface to bind.
+        :param port: port to bind, 0 picks a free port.
+        :return: running asyncio server.
+        """
+        return await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_LINE_LENGTH
+        )
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        """Starts listening on a unix domain socket.
+
+        :param path: filesystem path of the socket.
+        :return: running asyncio server.
+        """
+        return await asyncio.start_unix_server(
+            self.handle_connection, path, limit=MAX_LINE_LENGTH
+        )
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Runs a single session until the client quits, disconnects or is
+        evicted. Every reply is drained before the next request is read, so
+        a client that stops reading also stops being served.
+        """
+        if len(self.sessions) >= self.max_sessions:
+            writer.write(format_message("BUSY"))
+            await self._close(writer)
+            return
+
+        session_id = self._next_session_id
+        self._next_session_id += 1
+        model = WordleModel(
+            self.lexicon,
+            self.winning_index,
+            max_guesses=self.max_guesses,
+            hard_mode=self.hard_mode,
+        )
+        self.sessions[session_id] = model
+
+        try:
+            writer.write(
+                format_message("HELLO", self.lexicon.word_length, self.max_guesses)
+            )
+            await writer.drain()
+
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    writer.write(format_message("TIMEOUT"))
+                    break
+                except ValueError:  # line longer than MAX_LINE_LENGTH
+                    writer.write(format_message("ERROR", "line too long"))
+                    break
+
+                if not line:  # client disconnected
+                    break
+
+                command, args = parse_message(line)
+                if command == "QUIT":
+                    writer.write(format_message("BYE"))
+                    break
+                elif command == "GUESS" and len(args) == 1:
+                    writer.write(self._guess(model, args[0].lower()))
+                else:
+                    writer.write(format_message("ERROR", "unknown command"))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            del self.sessions[session_id]
+            await self._close(writer)
+
+    def _guess(self, model: WordleModel, word: str) -> bytes:
+        outcome = model.guess(word)
+        if outcome is None:
+            return format_message("INVALID")
+        if self.show_games and model.did_win is not None:
+            print(render_model(model, ansi=sys.stdout.isatty()), flush=True)
+        status = game_status(model.did_win)
+        if status == LOST:
+            return format_message(
+                "RESULT", encode_outcome(outcome), status, model.winning_word
+            )
+        return format_message("RESULT", encode_outcome(outcome), status)
+
+    async def _close(self, writer: asyncio.StreamWriter) -> None:
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def serve(args: argparse.Namespace) -> None:
+    game_server = GameServer(
+        get_lexicon(word_length=args.word_length),
+        max_sessions=args.max_sessions,
+        idle_timeout=args.idle_timeout,
+        max_guesses=args.max_guesses,
+        show_games=args.show_games,
+        hard_mode=args.hard,
+    )
+    if args.unix:
+        server = await game_server.start_unix(args.unix)
+    else:
+        server = await game_server.start_tcp(args.host, args.port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this unix socket path instead")
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument(
+        "--word-length", type=int, default=WORD_LENGTH, choices=WORD_LENGTHS
+    )
+    parser.add_argument("--max-guesses", type=int, default=WordleModel.MAX_GUESSES)
+    parser.add_argument(
+        "--show-games",
+        action="store_true",
+        help="print the board of every finished game",
+    )
+    parser.add_argument(
+        "--hard",
+        action="store_true",
+        help="hard mode: every guess must be consistent with the revealed hints",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="collect timings and counters, written to this file at exit or on "
+        "SIGUSR1 (Prometheus text format if it ends with .prom, JSON otherwise)",
+    )
+    args = parser.parse_args(argv)
+    if args.profile:
+        instrumentation.install(args.profile)
+    asyncio.run(serve(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""Headless entrypoint that plays many games with a pluggable strategy across a
+pool of worker processes and reports throughput, the guess count distribution
+and the win rate. Used to regression test strategies and load test the model.
+
+Strategies are classes constructed with (lexicon, table, seed) that expose
+next_guess(previous_guesses) -> str. Built-in strategies are listed in
+STRATEGIES; any other class can be used as "package.module:ClassName".
+"""
+import argparse
+import importlib
+import random
+import sys
+import time
+
+from collections import Counter
+from multiprocessing import Pool
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from controller.headless import render_model
+from model.feedback_table import load_table
+from model.lexicon import Lexicon, get_lexicon
+from model.solver import Solver
+from model.wordle_model import Accuracy, WordleModel
+
+
+class SolverStrategy:
+    def __init__(
+        self,
+        lexicon: Lexicon,
+        table: Optional[np.ndarray],
+        seed: int,
+        time_budget: Optional[float] = None,
+    ) -> None:
+        """Plays the most informative guess according to the solver. The
+        opening guess is the same for every game so it is only ranked once.
+        """
+        self.lexicon = lexicon
+        self.table = table
+        self.time_budget = time_budget
+        self._opening_guess: Optional[str] = None
+        self._solver: Optional[Solver] = None  # created for every game
+
+    def next_guess(self, previous_guesses: List[Tuple[str, List[Accuracy]]]) -> str:
+        if not previous_guesses:
+            self._solver = Solver(self.lexicon, self.table)
+            if self._opening_guess is None:
+                self._opening_guess = self._solver.best_guess(self.time_budget)
+            assert self._opening_guess is not None
+            return self._opening_guess
+
+        assert self._solver is not None
+        self._solver.update(previous_guesses)
+        guess = self._solver.best_guess(self.time_budget)
+        assert guess is not None
+        return guess
+
+
+class RandomStrategy:
+    def __init__(
+        self, lexicon: Lexicon, table: Optional[np.ndarray], seed: int
+    ) -> None:
+        """Guesses random words that are still possible answers. Useful as a
+        baseline and as a cheap load generator.
+        """
+        self.lexicon = lexicon
+        self.table = table
+        self.random = random.Random(seed)
+        self._solver: Optional[Solver] = None  # created for every game
+
+    def next_guess(self, previous_guesses: List[Tuple[str, List[Accuracy]]]) -> str:
+        if not previous_guesses:
+            self._solver = Solver(self.lexicon, self.table)
+        assert self._solver is not None
+        self._solver.update(previous_guesses)
+        return self.lexicon[self.random.choice(self._solver.candidates)]
+
+
+STRATEGIES: Dict[str, Callable] = {
+    "solver": SolverStrategy,
+    "random": RandomStrategy,
+}
+
+# set in every worker process by _init_worker
+_lexicon: Optional[Lexicon] = None
+_strategy = None
+
+
+def resolve_strategy(name: str) -> Callable:
+    """Looks up a built-in strategy or imports one given as module:ClassName.
+
+    :param name: strategy name.
+    :return: strategy class.
+    :raise ValueError: if the strategy cannot be found.
+    """
+    if name in STRATEGIES:
+        return STRATEGIES[name]
+    module_name, _, class_name = name.partition(":")
+    try:
+        return getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError, ValueError) as error:
+        raise ValueError(
+            f"Unknown strategy {name!r}, expected one of {', '.join(STRATEGIES)} "
+            f"or module:ClassName ({error})."
+        ) from error
+
+
+def _init_worker(strategy: Callable, use_table: bool, seed: int) -> None:
+    global _lexicon, _strategy
+    _lexicon = get_lexicon()
+    table = load_table(_lexicon) if use_table else None
+    _strategy = strategy(_lexicon, table, seed)
+
+
+def play(lexicon: Lexicon, strategy, answer_index: int) -> WordleModel:
+    """Plays a single game to completion.
+
+    :param lexicon: lexicon to play with.
+    :param strategy: strategy deciding each guess.
+    :param answer_index: lexicon position of the winning word.
+    :return: the finished game.
+    """
+    model = WordleModel(lexicon, answer_index)
+    while model.did_win is None:
+        if model.guess(strategy.next_guess(model.previous_guesses)) is None:
+            raise RuntimeError("Strategy made an invalid guess.")
+    return model
+
+
+def play_game(lexicon: Lexicon, strategy, answer_index: int) -> int:
+    """Plays a single game to completion.
+
+    :param lexicon: lexicon to play with.
+    :param strategy: strategy deciding each guess.
+    :param answer_index: lexicon position of the winning word.
+    :return: number of guesses needed to win, or 0 if the game was lost.
+    """
+    model = play(lexicon, strategy, answer_index)
+    return len(model.state) if model.did_win else 0
+
+
+def _play_chunk(answer_indices: Sequence[int]) -> List[int]:
+    assert _lexicon is not None
+    return [play_game(_lexicon, _strategy, index) for index in answer_indices]
+
+
+def simulate(
+    answer_indices: Sequence[int],
+    strategy_name: str = "solver",
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    use_table: bool = True,
+    seed: int = 0,
+) -> Counter:
+    """Plays one game per answer across a process pool.
+
+    :param answer_indices: lexicon positions of the answers to play.
+    :param strategy_name: built-in strategy name or module:ClassName.
+    :param workers: number of worker processes, defaults to every cpu.
+    :param chunk_size: number of games per work unit.
+    :param use_table: whether strategies get the precomputed feedback table.
+    :param seed: seed handed to each strategy.
+    :return: counter of guess counts (0 meaning the game was lost).
+    :raise ValueError: if the strategy cannot be found.
+    """
+    # resolved here so that a bad name fails once instead of in every worker
+    strategy = resolve_strategy(strategy_name)
+    if use_table:
+        load_table(get_lexicon())  # build once up front instead of per worker
+
+    chunks = [
+        answer_indices[start : start + chunk_size]
+        for start in range(0, len(answer_indices), chunk_size)
+    ]
+    results: Counter = Counter()
+    with Pool(
+        workers,
+        initializer=_init_worker,
+        initargs=(strategy, use_table, seed),
+    ) as pool:
+        for guess_counts in pool.imap_unordered(_play_chunk, chunks):
+            results.update(guess_counts)
+    return results
+
+
+def format_report(results: Counter, elapsed: float) -> str:
+    """Summarises simulation results.
+
+    :param results: counter of guess counts (0 meaning the game was lost).
+    :param elapsed: wall clock seconds taken by the simulation.
+    :return: human readable report.
+    """
+    num_games = sum(results.values())
+    num_wins = num_games - results[0]
+    games_per_second = num_games / elapsed if elapsed > 0 else 0.0
+    win_rate = 100 * num_wins / num_games if num_games else 0.0
+    lines = [
+        f"games:         {num_games}",
+        f"elapsed:       {elapsed:.2f}s ({games_per_second:.1f} games/sec)",
+        f"win rate:      {win_rate:.2f}%",
+    ]
+    if num_wins:
+        total_guesses = sum(count * n for count, n in results.items() if count)
+        lines.append(f"mean guesses:  {total_guesses / num_wins:.3f} (wins only)")
+    lines.append("distribution:")
+    for count in range(1, WordleModel.MAX_GUESSES + 1):
+        lines.append(f"  {count}: {results[count]}")
+    lines.append(f"  X: {results[0]}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--games",
+        type=int,
+        help="play a random sample of this many answers instead of every word",
+    )
+    parser.add_argument("--strategy", default="solver")
+    parser.add_argument("--workers", type=int, help="defaults to every cpu")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-table",
+        action="store_true",
+        help="score on the fly instead of using the precomputed feedback table",
+    )
+    parser.add_argument(
+        "--show",
+        type=int,
+        default=0,
+        metavar="N",
+        help="also print the boards of the first N games",
+    )
+    args = parser.parse_args(argv)
+    try:
+        strategy = resolve_strategy(args.strategy)
+    except ValueError as error:
+        parser.error(str(error))
+    if args.games is not None and args.games < 1:
+        parser.error("--games must be at least 1")
+
+    answer_indices: Sequence[int] = range(len(get_lexicon()))
+    if args.games is not None:
+        # not seeded like the strategies, whose guesses would follow the sample
+        answer_indices = random.Random(f"games:{args.seed}").sample(
+            list(answer_indices), min(args.games, len(answer_indices))
+        )
+
+    start = time.perf_counter()
+    results = simulate(
+        answer_indices,
+        args.strategy,
+        args.workers,
+        args.chunk_size,
+        not args.no_table,
+        args.seed,
+    )
+    print(format_report(results, time.perf_counter() - start))
+
+    if args.show:
+        lexicon = get_lexicon()
+        table = None if args.no_table else load_table(lexicon)
+        player = strategy(lexicon, table, args.seed)
+        for answer_index in answer_indices[: args.show]:
+            model = play(lexicon, player, answer_index)
+            print("\n" + render_model(model, ansi=sys.stdout.isatty()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Fixtures shared by the tests. Every test compiles its indexes into its own
+cache directory, so that tests never read or write the cache of the machine
+running them, even when they load the default dictionary or start worker
+processes.
+"""
+import pytest
+
+from model import lexicon
+
+WORDS = ["crane", "slate", "apple", "eerie", "llama", "sassy", "tepid", "crate"]
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Redirects the index cache to the test's temporary directory."""
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(lexicon, "CACHE_DIR", cache)
+    monkeypatch.setenv("WORDLE_CACHE_DIR", str(cache))  # for spawned workers
+    # lexicons shared by earlier tests were mapped from their own caches
+    lexicon._shared_lexicon.cache_clear()
+    yield cache
+    lexicon._shared_lexicon.cache_clear()
+
+
+@pytest.fixture
+def words():
+    """The words of the default test dictionary."""
+    return list(WORDS)
+
+
+@pytest.fixture
+def write_words(tmp_path):
+    """Writes a dictionary file, WORDS by default, and returns its path."""
+
+    def write(words=WORDS, name="words"):
+        source = tmp_path / name
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text("\n".join(words) + "\n")
+        return source
+
+    return write
+
+
+@pytest.fixture
+def make_index(write_words):
+    """Compiles the index of a dictionary, WORDS by default."""
+
+    def make(words=WORDS):
+        return lexicon.load_index(write_words(words))
+
+    return make
+
+
+@pytest.fixture
+def make_lexicon(make_index):
+    """Loads a lexicon from a dictionary, WORDS by default."""
+
+    def make(words=WORDS):
+        return lexicon.Lexicon(make_index(words))
+
+    return make
@@ -0,0 +1,38 @@
+from collections import Counter
+
+from model.adversarial import AdversarialModel, revealed_hints
+from model.feedback import Feedback
+from model.wordle_model import score_code
+
+
+def test_guess_keeps_the_largest_group(make_lexicon):
+    shared = make_lexicon()
+    model = AdversarialModel(shared)
+    candidates = list(shared)
+
+    for guess in ["slate", "crane", "tepid"]:
+        groups = Counter(score_code(guess, answer) for answer in candidates)
+        outcome = model.guess(guess)
+        assert groups[outcome.code] == max(groups.values())
+        candidates = [c for c in candidates if score_code(guess, c) == outcome.code]
+        assert [shared[i] for i in model.candidates] == candidates
+        assert model.winning_word in candidates
+
+
+def test_ties_reveal_as_little_as_possible(make_lexicon, words):
+    shared = make_lexicon()
+    weights = revealed_hints(5)
+    assert weights[Feedback.from_digits("00000").code] == 0
+    assert (
+        weights[Feedback.from_digits("00001").code]
+        < weights[Feedback.from_digits("00002").code]
+    )
+
+    # every word gets its own group, the least revealing one is kept
+    model = AdversarialModel(shared)
+    outcome = model.guess("crane")
+    codes = [score_code("crane", answer) for answer in words]
+    assert outcome.code == min(codes, key=lambda code: weights[code])
+    assert not outcome.is_win and len(model.candidates) == 1
+    assert model.guess(model.winning_word).is_win
+    assert model.did_win
@@ -0,0 +1,85 @@
+import csv
+import json
+
+from analytics import analyze, decode_word, encode_word, parse_outcome
+from model.protocol import encode_outcome
+from model.wordle_model import Accuracy, score_guess
+
+GAMES = [
+    ("crane", ["slate", "crate", "crane"]),
+    ("crane", ["crane"]),
+    ("eerie", ["slate", "crane", "apple", "llama", "sassy", "tepid"]),
+    ("apple", ["slate", "apple"]),
+]
+
+
+def records(with_guess_number=True):
+    for game_id, (answer, guesses) in enumerate(GAMES):
+        for number, guess in enumerate(guesses, 1):
+            record = {
+                "game_id": game_id,
+                "answer": answer,
+                "guess": guess,
+                "outcome": encode_outcome(score_guess(guess, answer)),
+            }
+            if with_guess_number:
+                record["guess_number"] = number
+            yield record
+
+
+def test_word_and_outcome_encoding():
+    assert decode_word(encode_word("crane"), 5) == "crane"
+    outcome = [Accuracy.CORRECT, Accuracy.ABSENT, Accuracy.EXISTS]
+    names = ["CORRECT", "ABSENT", "EXISTS"]
+    assert parse_outcome("201", 3) == parse_outcome(names, 3)
+    assert parse_outcome([2, 0, 1], 3) == 2 + 0 * 3 + 1 * 9
+    assert parse_outcome(encode_outcome(outcome), 3) == parse_outcome([2, 0, 1], 3)
+
+    # packed codes read from text (CSV) or from numbers (JSON)
+    assert parse_outcome("20100", 5) == 2 + 1 * 9
+    assert parse_outcome("100", 5) == parse_outcome(100, 5) == 100
+    assert parse_outcome("242", 5) == 242
+
+
+def test_jsonl_report(tmp_path):
+    path = tmp_path / "games.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records(False)))
+
+    report = analyze(str(path)).report()
+    assert report["games"] == 4
+    assert report["answers"]["crane"] == {
+        "games": 2,
+        "solve_rate": 1.0,
+        "average_guesses": 2.0,
+    }
+    assert report["answers"]["eerie"]["solve_rate"] == 0.0
+    assert report["hardest_answers"][0] == "eerie"
+    assert report["first_guesses"]["slate"] == 3
+    assert report["letter_frequency"][0]["s"] == 4
+
+
+def test_parallel_csv_matches_serial(tmp_path):
+    path = tmp_path / "games.csv"
+    with open(path, "w", newline="") as log_file:
+        writer = csv.DictWriter(
+            log_file, ["game_id", "answer", "guess", "outcome", "guess_number"]
+        )
+        writer.writeheader()
+        writer.writerows(records())
+
+    serial = analyze(str(path)).report()
+    parallel = analyze(str(path), workers=2, chunk_bytes=50).report()
+    assert parallel == serial
+    assert serial["games"] == 4
+
+    # the same log with packed outcome codes instead of digit strings
+    packed = tmp_path / "packed.csv"
+    with open(packed, "w", newline="") as log_file:
+        writer = csv.DictWriter(
+            log_file, ["game_id", "answer", "guess", "outcome", "guess_number"]
+        )
+        writer.writeheader()
+        for record in records():
+            record["outcome"] = parse_outcome(record["outcome"], 5)
+            writer.writerow(record)
+    assert analyze(str(packed)).report() == serial
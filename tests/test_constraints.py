@@ -0,0 +1,39 @@
+import random
+
+from model.constraints import Constraints
+from model.scoring import encode_words
+from model.wordle_model import score_code
+
+
+def random_words(rng, count, length, alphabet="abcde"):
+    # a small alphabet gives plenty of repeated letters
+    return ["".join(rng.choice(alphabet) for _ in range(length)) for _ in range(count)]
+
+
+def test_constraints_match_outcomes():
+    rng = random.Random(2)
+    for length in range(1, 9):
+        words = random_words(rng, 200, length)
+        encoded = encode_words(words)
+        for _ in range(20):
+            answer = rng.choice(words)
+            guesses = random_words(rng, rng.randint(1, 3), length)
+            constraints = Constraints(length)
+            for guess in guesses:
+                constraints.add(guess, score_code(guess, answer))
+
+            expected = [
+                all(score_code(g, word) == score_code(g, answer) for g in guesses)
+                for word in words
+            ]
+            assert [constraints.allows(word) for word in words] == expected
+            assert constraints.filter(encoded).tolist() == expected
+
+
+def test_duplicate_letter_counts():
+    constraints = Constraints(5)
+    constraints.add("lolly", score_code("lolly", "hello"))
+    assert constraints.min_counts[ord("l") - ord("a")] == 2
+    assert constraints.max_counts[ord("l") - ord("a")] == 2
+    assert constraints.allows("hello")
+    assert not constraints.allows("lilly")  # three l's
@@ -0,0 +1,32 @@
+from controller.wordle_controller import (
+    BACKSPACE,
+    ENTER,
+    HINT,
+    LETTERS,
+    QUIT,
+    InputEvent,
+    coalesce_keys,
+)
+
+
+def codes(text):
+    return [ord(char) for char in text]
+
+
+def test_bursts_are_coalesced():
+    assert coalesce_keys(codes("crane\nsl\x7f\x7f\x7f??")) == [
+        InputEvent(LETTERS, "CRANE"),
+        InputEvent(ENTER, "\n"),
+        InputEvent(LETTERS, "SL"),
+        InputEvent(BACKSPACE, "\b\b\b"),
+        InputEvent(HINT, "??"),
+    ]
+    assert coalesce_keys([263, 263]) == [InputEvent(BACKSPACE, "\b\b")]
+    assert coalesce_keys([]) == []
+
+
+def test_keys_after_escape_are_dropped():
+    assert coalesce_keys(codes("ab") + [27] + codes("cd")) == [
+        InputEvent(LETTERS, "AB"),
+        InputEvent(QUIT, ""),
+    ]
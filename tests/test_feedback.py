@@ -0,0 +1,40 @@
+from model.feedback import Accuracy, Feedback, decode_table
+from model.wordle_model import pack_outcome, score_code, score_guess
+
+
+def test_feedback_is_shared_and_decoded():
+    outcome = [
+        Accuracy.CORRECT,
+        Accuracy.ABSENT,
+        Accuracy.EXISTS,
+        Accuracy.ABSENT,
+        Accuracy.CORRECT,
+    ]
+    feedback = Feedback.from_accuracies(outcome)
+    assert feedback is Feedback.of(pack_outcome(outcome), 5)
+    assert feedback is Feedback.from_digits("20102")
+    assert feedback == outcome
+    assert feedback.to_list() == outcome
+    assert feedback[2] == Accuracy.EXISTS
+    assert int(feedback) == pack_outcome(outcome)
+    assert not feedback.is_win
+    assert Feedback.of(3**5 - 1, 5).is_win
+
+
+def test_feedback_hashes_like_its_code():
+    feedback = Feedback.from_digits("20102")
+    assert feedback == feedback.code
+    assert hash(feedback) == hash(feedback.code)
+    assert {feedback.code: "seen"}[feedback] == "seen"
+    assert len({feedback, feedback.code, Feedback.from_digits("20102")}) == 1
+
+
+def test_decode_table_covers_every_code():
+    table = decode_table(4)
+    assert len(table) == 3**4
+    assert all(feedback.code == code for code, feedback in enumerate(table))
+
+
+def test_score_code_matches_score_guess():
+    for guess, answer in [("slate", "crane"), ("eerie", "melee"), ("crane", "crane")]:
+        assert score_code(guess, answer) == pack_outcome(score_guess(guess, answer))
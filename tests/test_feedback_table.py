@@ -0,0 +1,35 @@
+import numpy as np
+
+from model import feedback_table, lexicon
+from model.scoring import score_matrix
+
+
+def test_table_matches_score_matrix(make_lexicon):
+    shared = make_lexicon()
+    table = feedback_table.load_table(shared)
+
+    assert isinstance(table, np.memmap)
+    assert np.array_equal(table, score_matrix(list(shared), list(shared)))
+
+
+def test_parallel_build_matches_serial_build(tmp_path, monkeypatch, make_lexicon):
+    shared = make_lexicon()
+    monkeypatch.setattr(feedback_table, "ROWS_PER_TASK", 2)
+
+    serial = np.load(feedback_table.build_table(shared, tmp_path / "serial.npy"))
+    parallel = np.load(
+        feedback_table.build_table(shared, tmp_path / "parallel.npy", workers=2)
+    )
+    assert np.array_equal(serial, parallel)
+
+
+def test_table_is_reused(monkeypatch, make_lexicon):
+    shared = make_lexicon()
+    feedback_table.build_table(shared)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("table should not be rebuilt")
+
+    monkeypatch.setattr(feedback_table, "build_table", fail)
+    table = feedback_table.load_table(lexicon.Lexicon(shared.index))
+    assert table.shape == (len(shared), len(shared))
@@ -0,0 +1,66 @@
+import json
+
+import instrumentation
+
+from controller.wordle_controller import WordleController
+from model import lexicon
+from model.wordle_model import WordleModel
+from view.framebuffer import FramebufferBackend
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = instrumentation.Metrics()
+    metrics.observe("latency", 0.0002)
+    metrics.observe("latency", 0.003, times=2)
+    metrics.observe("latency", 5.0)
+
+    buckets = metrics.histograms["latency"].cumulative_buckets()
+    assert buckets["0.0001"] == 0
+    assert buckets["0.00025"] == 1
+    assert buckets["0.005"] == 3
+    assert buckets["1.0"] == 3
+    assert buckets["+Inf"] == 4
+
+
+def test_export_formats(tmp_path):
+    metrics = instrumentation.Metrics()
+    metrics.count("wordle_guesses_total")
+    metrics.set("wordle_vocabulary_size", 8)
+    metrics.observe("wordle_guess_seconds", 0.001)
+
+    metrics.export(tmp_path / "metrics.prom")
+    text = (tmp_path / "metrics.prom").read_text()
+    assert "# TYPE wordle_guesses_total counter\nwordle_guesses_total 1\n" in text
+    assert 'wordle_guess_seconds_bucket{le="0.001"} 1\n' in text
+    assert "wordle_guess_seconds_count 1\n" in text
+
+    metrics.export(tmp_path / "metrics.json")
+    snapshot = json.loads((tmp_path / "metrics.json").read_text())
+    assert snapshot["gauges"] == {"wordle_vocabulary_size": 8}
+    assert snapshot["histograms"]["wordle_guess_seconds"]["count"] == 1
+
+
+def test_hot_paths_are_instrumented(write_words):
+    source = write_words()
+    metrics = instrumentation.enable()
+    try:
+        shared = lexicon.get_lexicon(source)
+        model = WordleModel(shared, shared.find("crane"))
+        keys = "zzzzz\n" + "\x7f" * 5 + "crane\n"
+        WordleController(model, FramebufferBackend(80, 40, keys=keys))
+    finally:
+        instrumentation.disable()
+
+    assert model.did_win
+    assert metrics.counters["wordle_index_compiles_total"] == 1
+    assert metrics.histograms["wordle_vocabulary_load_seconds"].count == 1
+    assert metrics.histograms["wordle_guess_seconds"].count == 2
+    assert metrics.counters["wordle_invalid_guesses_total"] == 1
+    assert metrics.histograms["wordle_keystroke_seconds"].count == 17
+    assert metrics.counters["wordle_screen_flushes_total"] > 0
+    assert metrics.counters["wordle_screen_text_bytes_total"] > 0
+
+    # nothing is collected once disabled
+    assert instrumentation.active is None
+    model.guess("slate")
+    assert metrics.histograms["wordle_guess_seconds"].count == 2
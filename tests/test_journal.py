@@ -0,0 +1,62 @@
+from model.journal import (
+    RECORD,
+    GameJournal,
+    player_statistics,
+    read_records,
+    resume_game,
+)
+from model.wordle_model import WordleModel
+
+
+def test_guesses_are_journaled(tmp_path, make_lexicon):
+    shared = make_lexicon()
+    journal = GameJournal(tmp_path / "journal", shared)
+    model = WordleModel(shared, shared.find("crane"), journal=journal, player_id=7)
+    model.guess("slate")
+    model.guess("crane")
+    journal.close()
+
+    records = list(read_records(tmp_path / "journal"))
+    assert [shared[record.guess_index] for record in records] == ["slate", "crane"]
+    assert [record.guess_number for record in records] == [1, 2]
+    assert records[-1].outcome == model.state.outcomes[-1]
+
+    stats = player_statistics(iter(records))[7]
+    assert (stats.games, stats.wins, stats.max_streak) == (1, 1, 1)
+    assert stats.distribution[2] == 1
+
+
+def test_unfinished_game_is_resumed_after_crash(tmp_path, make_lexicon):
+    shared = make_lexicon()
+    journal = GameJournal(tmp_path / "journal", shared, fsync_every=1)
+    model = WordleModel(shared, shared.find("crane"), journal=journal)
+    model.guess("slate")
+    model.guess("apple")
+    journal._file.write(b"\0" * (RECORD.size // 2))  # torn write
+    journal._file.flush()
+
+    reopened = GameJournal(tmp_path / "journal", shared)
+    resumed = resume_game(reopened)
+    assert resumed is not None
+    assert resumed.game_id == model.game_id
+    assert resumed.previous_guesses == model.previous_guesses
+
+    resumed.guess("crane")
+    assert resumed.did_win
+    assert resume_game(reopened) is None
+    reopened.close()
+    assert len(list(read_records(tmp_path / "journal"))) == 3
+
+
+def test_streaks(tmp_path, make_lexicon, words):
+    shared = make_lexicon()
+    journal = GameJournal(tmp_path / "journal", shared)
+    for won in (True, True, False, True):
+        model = WordleModel(shared, shared.find("crane"), journal=journal)
+        for word in ["crane"] if won else words[1:7]:
+            model.guess(word)
+    journal.close()
+
+    stats = player_statistics(read_records(tmp_path / "journal"))[0]
+    assert (stats.games, stats.wins) == (4, 3)
+    assert (stats.current_streak, stats.max_streak) == (1, 2)
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from model import lexicon
+from model.word_sources import (
+    WORD_LENGTHS,
+    BundledWordList,
+    DictionaryFile,
+    WordSource,
+    as_word_source,
+    default_source,
+    is_playable_word,
+)
+
+
+def test_index_only_contains_playable_words(write_words):
+    source = write_words(["crane", "Paris", "don't", "éclat", "apple", "cat"])
+
+    index = lexicon.load_index(source)
+    assert list(index) == ["apple", "crane"]
+
+
+def test_index_lookup(write_words):
+    source = write_words(["slate", "crane", "apple", "zesty"])
+
+    index = lexicon.load_index(source)
+    assert len(index) == 4
+    assert index[0] == "apple"
+    assert index[-1] == "zesty"
+    assert index.find("slate") == 2
+    assert "crane" in index
+    assert "crank" not in index
+    assert "cran" not in index
+
+
+def test_index_is_rebuilt_when_source_changes(write_words):
+    source = write_words(["crane"])
+    assert list(lexicon.load_index(source)) == ["crane"]
+
+    write_words(["crane", "slate"])
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert list(lexicon.load_index(source)) == ["crane", "slate"]
+
+
+def test_lexicon_lookup(write_words):
+    source = write_words(["slate", "crane", "apple"])
+
+    shared = lexicon.get_lexicon(source)
+    assert shared is lexicon.get_lexicon(source)
+    assert len(shared) == 3
+    assert shared.find("crane") == 1
+    assert shared.find("crank") is None
+    assert "slate" in shared
+    assert shared[2] == "slate"
+
+
+def test_bundled_word_list():
+    for word_length in range(4, 9):
+        index = lexicon.load_index(BundledWordList(word_length))
+        assert len(index) > 100
+        assert index.word_length == word_length
+        assert all(is_playable_word(word, word_length) for word in index)
+    assert "crane" in lexicon.load_index(BundledWordList())
+
+
+def test_word_sources(monkeypatch, write_words):
+    source = write_words(["crane", "slate", "able", "echo"])
+
+    four_letters = DictionaryFile(source, 4)
+    assert list(lexicon.load_index(four_letters)) == ["able", "echo"]
+    assert as_word_source(str(source)) == DictionaryFile(source)
+    assert lexicon.get_lexicon(four_letters) is lexicon.get_lexicon(
+        DictionaryFile(source, 4)
+    )
+
+    monkeypatch.setenv("WORDLE_DICTIONARY", str(source))
+    assert default_source() == DictionaryFile(source)
+
+    with pytest.raises(TypeError):  # sources have to say how entries are read
+        WordSource(source)
+
+
+def test_one_pass_compiles_every_word_length(write_words):
+    source = write_words(["crane", "able", "abacus", "ability", "absolute"])
+
+    paths = lexicon.compile_indexes(source)
+    assert sorted(paths) == list(WORD_LENGTHS)
+    assert list(lexicon.load_index(DictionaryFile(source, 6))) == ["abacus"]
+
+    # switching variants reuses the index compiled in the same pass
+    mtime = paths[8].stat().st_mtime_ns
+    assert list(lexicon.load_index(DictionaryFile(source, 8))) == ["absolute"]
+    assert paths[8].stat().st_mtime_ns == mtime
+
+
+def test_same_named_dictionaries_have_their_own_index(write_words):
+    first_source = write_words(["crane", "slate"], "a/words")
+    second_source = write_words(["apple"], "b/words")
+
+    first = lexicon.load_index(first_source)
+    second = lexicon.load_index(second_source)
+    assert first.path != second.path
+    assert list(lexicon.load_index(first_source)) == ["crane", "slate"]
+    assert list(second) == ["apple"]
@@ -1,4 +1,5 @@
-from model.wordle_model import WordleModel, Accuracy
+from model.lexicon import get_lexicon
+from model.wordle_model import WordleModel, Accuracy, pack_outcome, unpack_outcome
 
 
 def test_outcome_exists():
@@ -83,3 +84,75 @@ def test_no_outcome_for_seventh_bad_guess():
     )  # safe to use because we have not tried this yet and it is guaranteed to be a valid word
     outcome = model.guess(final_guess)
     assert outcome is None
+
+
+def test_models_share_vocabulary():
+    assert WordleModel().vocabulary is WordleModel().vocabulary
+
+
+def test_no_outcome_for_repeated_guess():
+    model = WordleModel()
+    word_to_guess = (
+        model.vocabulary[0]
+        if model.winning_word != model.vocabulary[0]
+        else model.vocabulary[1]
+    )
+
+    assert model.guess(word_to_guess) is not None
+    assert model.guess(word_to_guess) is None
+
+
+def test_outcome_packing_round_trip():
+    outcome = [
+        Accuracy.CORRECT,
+        Accuracy.ABSENT,
+        Accuracy.EXISTS,
+        Accuracy.ABSENT,
+        Accuracy.CORRECT,
+    ]
+    code = pack_outcome(outcome)
+    assert 0 <= code < 3**5
+    assert unpack_outcome(code, 5) == outcome
+
+
+def test_previous_guesses_are_recorded():
+    model = WordleModel()
+    word_to_guess = (
+        model.vocabulary[0]
+        if model.winning_word != model.vocabulary[0]
+        else model.vocabulary[1]
+    )
+
+    outcome = model.guess(word_to_guess)
+    assert model.previous_guesses == [(word_to_guess, outcome)]
+
+
+def test_word_length_and_guess_variants():
+    lexicon = get_lexicon(word_length=7)
+    model = WordleModel(lexicon, 0, max_guesses=3)
+    assert model.word_length == 7
+    for word in (lexicon[1], lexicon[2], lexicon[3]):
+        outcome = model.guess(word)
+        assert outcome is not None and len(outcome) == 7
+    assert model.did_win is False
+    assert model.guess(model.winning_word) is None
+
+    model = WordleModel(lexicon, 0, max_guesses=3)
+    assert model.guess(model.winning_word).is_win
+    assert model.previous_guesses[0][1].code == 3**7 - 1
+
+
+def test_hard_mode():
+    lexicon = get_lexicon()
+    model = WordleModel(lexicon, lexicon.find("crane"), hard_mode=True)
+    assert model.guess("slate") is not None  # a and e are known to be in place
+
+    assert model.breaks_hard_mode("bring")
+    assert model.guess("bring") is None
+    assert not model.breaks_hard_mode("crane")
+    assert model.guess("crane").is_win
+
+    model = WordleModel(lexicon, lexicon.find("crane"))
+    model.guess("slate")
+    assert not model.breaks_hard_mode("bring")
+    assert model.guess("bring") is not None
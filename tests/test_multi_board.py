@@ -0,0 +1,69 @@
+from controller.multi_board_controller import MultiBoardController
+from model.multi_board import MultiBoardModel
+from model.wordle_model import score_code
+from view.framebuffer import FramebufferBackend
+
+
+def test_guess_is_scored_on_every_board(make_lexicon):
+    shared = make_lexicon()
+    answers = ["crane", "llama", "tepid", "crate"]
+    model = MultiBoardModel(shared, [shared.find(word) for word in answers])
+    assert model.num_boards == 4
+    assert model.max_guesses == 4 + MultiBoardModel.EXTRA_GUESSES
+
+    outcomes = model.guess("slate")
+    assert [outcome.code for outcome in outcomes] == [
+        score_code("slate", answer) for answer in answers
+    ]
+    assert model.guess("slate") is None
+    assert model.guess("zzzzz") is None
+
+    # solved boards stop receiving guesses
+    assert model.guess("crane")[0].is_win
+    outcomes = model.guess("llama")
+    assert outcomes[0] is None and outcomes[1].is_win
+    assert len(model.board_guesses(0)) == 2
+    assert len(model.board_guesses(2)) == 3
+    assert model.did_win is None
+
+    model.guess("tepid")
+    model.guess("crate")
+    assert model.did_win is True
+    assert model.previous_guesses == ["slate", "crane", "llama", "tepid", "crate"]
+
+
+def test_game_is_lost_after_max_guesses(make_lexicon):
+    shared = make_lexicon()
+    model = MultiBoardModel(
+        shared, [shared.find("crane"), shared.find("eerie")], max_guesses=2
+    )
+    model.guess("crane")
+    model.guess("slate")
+    assert model.did_win is False
+    assert [board.did_win for board in model.boards] == [True, False]
+    assert model.guess("eerie") is None
+
+
+def test_sixteen_boards_fit_a_small_terminal(make_lexicon, words):
+    answers = words + ["frame", "grape", "brake", "drape", "craze", "prick"]
+    answers += ["brick", "crimp"]
+    misses = ["grind", "crump", "dumpy", "fjord", "nymph"]
+    shared = make_lexicon(answers + misses)
+    model = MultiBoardModel(shared, [shared.find(word) for word in answers])
+    assert model.max_guesses == 21
+    keys = "".join(word + "\n" for word in misses + answers)
+    backend = FramebufferBackend(70, 50, keys=keys)
+
+    MultiBoardController(model, backend)
+    assert model.did_win
+    screen = backend.render_text()
+    assert "Solved every board in 21 guesses" in screen
+    # boards scroll to their latest guesses, the last one ends on its answer
+    rows = [line for line in screen.splitlines() if "│" in line]
+    assert rows[-1].endswith("│ C R I M P │")
+
+
+def test_default_answers_come_from_the_schedule():
+    model = MultiBoardModel(num_boards=16)
+    assert model.num_boards == 16
+    assert len(set(model.winning_words)) == 16
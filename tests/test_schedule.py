@@ -0,0 +1,38 @@
+from datetime import date, timedelta
+
+import pytest
+
+from model import lexicon
+from model.schedule import get_schedule
+from model.word_sources import DictionaryFile
+
+
+def test_schedule_is_a_permutation(make_index, words):
+    schedule = get_schedule(make_index())
+    answers = schedule.answers_from(date(2024, 1, 1), len(words))
+    assert sorted(answers) == sorted(words)
+
+
+def test_schedule_lookups_agree(make_index, words):
+    schedule = get_schedule(make_index())
+    start = date(2024, 12, 25)
+    answers = schedule.answers_from(start, 20)
+    assert answers == [
+        schedule.answer_for(start + timedelta(days=offset)) for offset in range(20)
+    ]
+    # repeats once every word has been used
+    assert answers[: len(words)] == answers[len(words) : 2 * len(words)]
+
+
+def test_schedule_is_deterministic(make_index):
+    index = make_index()
+    first = get_schedule(index).answers_from(date(2025, 1, 1), 8)
+    get_schedule.cache_clear()
+    assert get_schedule(index, seed=0).answers_from(date(2025, 1, 1), 8) == first
+
+
+def test_empty_index_is_reported(write_words):
+    empty = lexicon.load_index(DictionaryFile(write_words(), 7))
+    assert len(empty) == 0
+    with pytest.raises(ValueError, match="no 7 letter words"):
+        get_schedule(empty)
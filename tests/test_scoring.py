@@ -0,0 +1,80 @@
+import random
+
+from model.scoring import encode_words, score_against, score_matrix
+from model.wordle_model import (
+    Accuracy,
+    letter_counts,
+    pack_outcome,
+    score_code,
+    score_guess,
+)
+
+
+def random_words(rng, count, length=5):
+    # small alphabet so that repeated and shared letters are common
+    return ["".join(rng.choice("abcdeis") for _ in range(length)) for _ in range(count)]
+
+
+def test_encode_words():
+    encoded = encode_words(["abcde", "zzzzz"])
+    assert encoded.shape == (2, 5)
+    assert encoded[0].tolist() == [0, 1, 2, 3, 4]
+    assert encoded[1].tolist() == [25] * 5
+
+
+def test_score_matrix_matches_reference_scorer():
+    rng = random.Random(0)
+    guesses = random_words(rng, 40)
+    answers = random_words(rng, 60)
+
+    matrix = score_matrix(guesses, answers)
+    assert matrix.shape == (40, 60)
+    for i, guess in enumerate(guesses):
+        for j, answer in enumerate(answers):
+            assert matrix[i, j] == pack_outcome(score_guess(guess, answer))
+
+
+def test_score_against_winning_word_is_all_correct():
+    answers = ["crane", "slate", "apple"]
+    outcomes = score_against("slate", answers)
+    assert outcomes[1] == 3**5 - 1
+    assert outcomes[0] != 3**5 - 1
+
+
+def test_duplicate_letters():
+    # only as many letters are reported as the answer actually holds
+    assert score_guess("eerie", "melee") == [
+        Accuracy.EXISTS,
+        Accuracy.CORRECT,
+        Accuracy.ABSENT,
+        Accuracy.ABSENT,
+        Accuracy.CORRECT,
+    ]
+    assert score_guess("speed", "abide") == [
+        Accuracy.ABSENT,
+        Accuracy.ABSENT,
+        Accuracy.EXISTS,
+        Accuracy.ABSENT,
+        Accuracy.EXISTS,
+    ]
+    assert score_guess("lolly", "hello") == [
+        Accuracy.ABSENT,
+        Accuracy.EXISTS,
+        Accuracy.CORRECT,
+        Accuracy.CORRECT,
+        Accuracy.ABSENT,
+    ]
+
+
+def test_scorers_agree_on_random_words():
+    rng = random.Random(1)
+    for length in range(1, 9):
+        guesses = random_words(rng, 30, length)
+        answers = random_words(rng, 30, length)
+        matrix = score_matrix(guesses, answers)
+        for i, guess in enumerate(guesses):
+            for j, answer in enumerate(answers):
+                expected = pack_outcome(score_guess(guess, answer))
+                assert score_code(guess, answer) == expected
+                assert score_code(guess, answer, letter_counts(answer)) == expected
+                assert matrix[i, j] == expected
@@ -0,0 +1,70 @@
+import asyncio
+import time
+
+from controller.remote_model import RemoteModel
+from controller.wordle_controller import WordleController
+from model.wordle_model import Accuracy, score_guess
+from server import GameServer
+from view.framebuffer import FramebufferBackend
+
+
+async def run_client(server, client):
+    """Runs a blocking client against a running server."""
+    tcp_server = await server.start_tcp(port=0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    async with tcp_server:
+        return await asyncio.get_running_loop().run_in_executor(None, client, port)
+
+
+def test_remote_game(make_lexicon):
+    shared = make_lexicon()
+    server = GameServer(shared, winning_index=shared.find("crane"))
+    guesses = ["zzzzz", "slate", "apple", "crane"]
+
+    def play(port):
+        model = RemoteModel.connect_tcp("127.0.0.1", port)
+        replies = [(model.guess(word), model.did_win) for word in guesses]
+        model.close()
+        return replies, model
+
+    replies, model = asyncio.run(run_client(server, play))
+    assert replies == [
+        (None, None),
+        (score_guess("slate", "crane"), None),
+        (score_guess("apple", "crane"), None),
+        ([Accuracy.CORRECT] * 5, True),
+    ]
+    assert [word for word, _ in model.previous_guesses] == guesses[1:]
+    assert server.sessions == {}
+
+
+def test_busy_and_idle_eviction(make_lexicon):
+    server = GameServer(make_lexicon(), max_sessions=1, idle_timeout=0.2)
+
+    def connect_twice(port):
+        first = RemoteModel.connect_tcp("127.0.0.1", port)
+        try:
+            RemoteModel.connect_tcp("127.0.0.1", port)
+            busy = False
+        except ConnectionRefusedError:
+            busy = True
+        evicted = first._receive()[0]
+        return busy, evicted
+
+    busy, evicted = asyncio.run(run_client(server, connect_twice))
+    assert busy
+    assert evicted == "TIMEOUT"
+
+
+def test_idle_session_ends_the_game(make_lexicon):
+    server = GameServer(make_lexicon(), idle_timeout=0.2)
+
+    def idle_then_guess(port):
+        model = RemoteModel.connect_tcp("127.0.0.1", port)
+        time.sleep(0.5)
+        backend = FramebufferBackend(80, 40, keys="crane\ncrane\n")
+        WordleController(model, backend)  # must not raise
+        return backend.render_text()
+
+    screen = asyncio.run(run_client(server, idle_then_guess))
+    assert "The game server ended the idle session." in screen
@@ -0,0 +1,39 @@
+from collections import Counter
+
+import pytest
+
+from simulate import (
+    RandomStrategy,
+    SolverStrategy,
+    format_report,
+    play_game,
+    simulate,
+)
+
+
+def test_strategies_win_every_game(make_lexicon):
+    shared = make_lexicon()
+    for strategy in (SolverStrategy(shared, None, 0), RandomStrategy(shared, None, 0)):
+        results = Counter(play_game(shared, strategy, i) for i in range(len(shared)))
+        assert results[0] == 0
+        assert "win rate:      100.00%" in format_report(results, 1.0)
+
+
+def test_simulation_across_workers(monkeypatch, write_words):
+    monkeypatch.setenv("WORDLE_DICTIONARY", str(write_words()))
+    # three chunks of at most 3 games spread over two worker processes
+    results = simulate(range(8), "solver", workers=2, chunk_size=3)
+    assert sum(results.values()) == 8
+    assert results[0] == 0
+    assert results[1] == 1  # only the opening guess wins in one
+
+
+def test_unknown_strategy_fails_before_starting_workers():
+    with pytest.raises(ValueError, match="Unknown strategy 'bogus'"):
+        simulate([0], "bogus", workers=1)
+
+
+def test_report_without_games():
+    report = format_report(Counter(), 0.0)
+    assert "games:         0" in report
+    assert "win rate:      0.00%" in report
@@ -0,0 +1,35 @@
+from model import feedback_table
+from model.solver import Solver
+from model.wordle_model import score_guess
+
+
+def test_candidates_are_filtered_incrementally(make_lexicon):
+    solver = Solver(make_lexicon())
+    guesses = [("slate", score_guess("slate", "crane"))]
+
+    solver.update(guesses)
+    assert "crane" in solver.remaining
+    assert all(score_guess("slate", word) == guesses[0][1] for word in solver.remaining)
+
+    guesses.append(("crane", score_guess("crane", "crane")))
+    solver.update(guesses)
+    assert solver.remaining == ["crane"]
+    assert solver.best_guess() == "crane"
+
+
+def test_ranking_with_and_without_table(make_lexicon):
+    shared = make_lexicon()
+    with_table = Solver(shared, feedback_table.load_table(shared))
+    without_table = Solver(shared)
+
+    ranked = without_table.rank(limit=3, time_budget=None)
+    assert len(ranked) == 3
+    assert ranked[0].expected_information >= ranked[-1].expected_information
+    assert with_table.rank(limit=3, time_budget=None) == ranked
+
+
+def test_incremental_ranking_matches_full_ranking(make_lexicon):
+    solver = Solver(make_lexicon())
+    steps = list(solver.iter_rank(limit=3, batch_size=3))
+    assert len(steps) == 3  # 8 words in batches of 3
+    assert steps[-1] == solver.rank(limit=3, time_budget=None)
@@ -0,0 +1,122 @@
+import time
+
+import pytest
+
+from controller.headless import render_game
+from controller.wordle_controller import WordleController
+from model.keyboard_state import KeyboardState
+from model.loader import ModelLoader
+from model.wordle_model import Accuracy, WordleModel, score_guess
+from view.backend import Backend
+from view.framebuffer import FramebufferBackend
+from view.wordle_ui import WordleUI
+
+
+def test_incomplete_backend_cannot_be_created():
+    class SizeOnly(Backend):
+        def size(self):
+            return 80, 40
+
+    with pytest.raises(TypeError):
+        SizeOnly()
+
+
+def test_only_changed_cells_are_output():
+    backend = FramebufferBackend(80, 40)
+    ui = WordleUI(backend=backend)
+    assert "Developed by" in backend.render_text()
+
+    cells = backend.stats.cells_changed
+    ui.render()  # nothing new to draw
+    assert backend.stats.cells_changed == cells
+
+    ui.key_was_pressed("C")
+    ui.render()
+    assert backend.stats.cells_changed == cells + 1
+    assert "│ C │" in backend.render_text()
+
+    ui.move_on_to_next_row([3])
+    ui.update_keys({"C": 3})
+    ui.render()
+    assert backend.render_ansi().count("\x1b[0;1;37;42m C \x1b[0m") == 2
+
+
+def test_render_game():
+    guesses = [(word, score_guess(word, "crane")) for word in ["slate", "crane"]]
+    assert render_game(guesses, 5, 3, "Solved in 2 guesses") == "\n".join(
+        [
+            " Wordle",
+            "             ┌───────────┐",
+            "             │ S L A T E │",
+            "             │ C R A N E │",
+            "             │           │",
+            "             └───────────┘",
+            "",
+            "",
+            "   Solved in 2 guesses",
+        ]
+    )
+
+
+def test_controller_plays_scripted_keys(make_lexicon):
+    shared = make_lexicon()
+    model = WordleModel(shared, shared.find("crane"))
+    backend = FramebufferBackend(80, 40, keys="slatx\x7fe\ncrane\n")
+
+    controller = WordleController(model, backend)  # returns once keys run out
+    assert model.did_win
+    assert [word for word, _ in model.previous_guesses] == ["slate", "crane"]
+    assert "│ C │ │ R │ │ A │ │ N │ │ E │" in backend.render_text()
+    assert controller.keyboard["e"] is Accuracy.CORRECT  # was EXISTS in slate
+
+
+def test_controller_draws_before_the_model_loads(make_lexicon):
+    shared = make_lexicon()
+    backend = FramebufferBackend(80, 40, keys="crane\n")
+    shown_while_loading = []
+
+    def load():
+        deadline = time.monotonic() + 5
+        while not backend.stats.updates and time.monotonic() < deadline:
+            time.sleep(0.001)
+        shown_while_loading.append(backend.render_text())
+        return WordleModel(shared, shared.find("crane"))
+
+    controller = WordleController(ModelLoader(load, 5, 6), backend)
+    assert "Developed by" in shown_while_loading[0]
+    assert controller.wordle_model.did_win
+
+
+def test_hard_mode_hints_are_accepted_guesses(make_lexicon, words):
+    # prick, brick, crimp, grind and crump split the answers best but reuse
+    # letters slate ruled out
+    words += ["frame", "grape", "brake", "drape", "craze"]
+    words += ["prick", "brick", "crimp", "grind", "crump"]
+    shared = make_lexicon(words)
+    model = WordleModel(shared, shared.find("crane"), hard_mode=True)
+    backend = FramebufferBackend(80, 40, keys="slate\n?")
+
+    controller = WordleController(model, backend)
+    hint = controller._hint[0].word
+    assert not model.breaks_hard_mode(hint)
+    assert f"Hint: {hint.upper()}" in backend.render_text()
+
+
+def test_keyboard_keeps_best_accuracy():
+    keyboard = KeyboardState()
+    assert keyboard["l"] is None
+    changes = keyboard.update("lolly", score_guess("lolly", "hello"))
+    assert changes == {
+        "l": Accuracy.CORRECT,
+        "o": Accuracy.EXISTS,
+        "y": Accuracy.ABSENT,
+    }
+    assert keyboard["l"] is Accuracy.CORRECT
+
+    # l is misplaced here, which must not downgrade its key
+    assert keyboard.update("label", score_guess("label", "hello")) == {
+        "a": Accuracy.ABSENT,
+        "b": Accuracy.ABSENT,
+        "e": Accuracy.EXISTS,
+    }
+    assert keyboard["l"] is Accuracy.CORRECT
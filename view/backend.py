@@ -0,0 +1,117 @@
+"""
+Terminal backends the Screen draws with. A backend creates windows and pushes
+them to a display; windows follow the curses window interface (addstr, bkgd,
+clear, noutrefresh, getch, ...). CursesBackend drives the real terminal, while
+view/framebuffer.py provides an in-memory one for tests, benchmarks and
+headless rendering.
+"""
+import curses
+
+from abc import ABC, abstractmethod
+from curses.textpad import rectangle
+from typing import Tuple, TYPE_CHECKING, Union, cast
+
+if TYPE_CHECKING:
+    from _curses import _CursesWindow
+    from view.framebuffer import FramebufferWindow
+
+    Window = Union[_CursesWindow, FramebufferWindow]
+else:
+    from typing import Any
+
+    Window = Any
+
+# Standard terminal colors, numbered like curses' and ANSI's
+COLOR_RED = 1
+COLOR_GREEN = 2
+COLOR_YELLOW = 3
+COLOR_WHITE = 7
+
+
+class Backend(ABC):
+    A_BOLD = 0  # attribute for bold text
+
+    @abstractmethod
+    def start(self) -> Window:
+        """Takes over the display and sets up keyboard input: keys are read
+        unbuffered, without echo, and special keys are translated.
+
+        :return: window covering the whole display.
+        """
+
+    @abstractmethod
+    def size(self) -> Tuple[int, int]:
+        """Width and height of the display, in characters."""
+
+    @abstractmethod
+    def init_pair(self, index: int, foreground: int, background: int) -> None:
+        """Defines a color pair.
+
+        :param index: number of the pair, from 1.
+        :param foreground: text color, -1 for the terminal's default.
+        :param background: background color, -1 for the terminal's default.
+        """
+
+    @abstractmethod
+    def color_pair(self, index: int) -> int:
+        """Attributes that draw with a color pair."""
+
+    @abstractmethod
+    def new_window(self, height: int, width: int, y: int, x: int) -> Window:
+        """Creates a window at a position of the display."""
+
+    @abstractmethod
+    def rectangle(self, window: Window, y1: int, x1: int, y2: int, x2: int) -> None:
+        """Draws a border on a window, corners included."""
+
+    @abstractmethod
+    def update(self) -> None:
+        """Updates the display with every window refreshed since the last
+        update.
+        """
+
+    @abstractmethod
+    def stop(self, stdscr: Window) -> None:
+        """Gives the display back, undoing start.
+
+        :param stdscr: window returned by start.
+        """
+
+
+class CursesBackend(Backend):
+    A_BOLD = curses.A_BOLD
+
+    def start(self) -> Window:
+        stdscr = curses.initscr()
+        curses.start_color()
+        curses.use_default_colors()
+        curses.noecho()  # prevent keys from echoing to stdout
+        curses.cbreak()  # read key inputs before enter is hit
+        stdscr.keypad(
+            True
+        )  # interpret key input and translate to curses special chars (ex: curses.KEY_LEFT)
+        return stdscr
+
+    def size(self) -> Tuple[int, int]:
+        return curses.COLS, curses.LINES
+
+    def init_pair(self, index: int, foreground: int, background: int) -> None:
+        curses.init_pair(index, foreground, background)
+
+    def color_pair(self, index: int) -> int:
+        return curses.color_pair(index)
+
+    def new_window(self, height: int, width: int, y: int, x: int) -> Window:
+        return curses.newwin(height, width, y, x)
+
+    def rectangle(self, window: Window, y1: int, x1: int, y2: int, x2: int) -> None:
+        rectangle(cast("_CursesWindow", window), y1, x1, y2, x2)
+
+    def update(self) -> None:
+        curses.doupdate()
+
+    def stop(self, stdscr: Window) -> None:
+        curses.nocbreak()
+        stdscr.keypad(False)
+        curses.echo()
+        curses.endwin()
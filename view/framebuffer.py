@@ -0,0 +1,280 @@
+"""
+In-memory terminal backend. Windows draw into character and attribute grids,
+updates are composed onto a virtual display, and every step is counted: draw
+calls, window refreshes, display updates and the bytes a terminal would have
+been sent for the cells that changed. Keys are scripted instead of typed, so
+the full interface runs headless in tests, benchmarks and servers, and the
+display can be rendered to plain text or ANSI colored text.
+"""
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from view.backend import Backend, Window
+
+ESCAPE = 27
+
+# box drawing characters
+TOP_LEFT, TOP_RIGHT, BOTTOM_LEFT, BOTTOM_RIGHT = "┌", "┐", "└", "┘"
+HORIZONTAL, VERTICAL = "─", "│"
+
+
+class FramebufferError(Exception):
+    """Raised when drawing outside of a window, like curses.error."""
+
+
+class DrawStats:
+    def __init__(self) -> None:
+        self.draw_calls = 0
+        self.refreshes = 0  # windows copied to the virtual display
+        self.updates = 0  # display updates
+        self.cells_changed = 0  # display cells that differ after an update
+        self.bytes_output = 0  # UTF-8 size of the changed cells
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value}" for name, value in vars(self).items())
+        return f"DrawStats({fields})"
+
+
+class FramebufferWindow:
+    def __init__(
+        self, backend: "FramebufferBackend", height: int, width: int, y: int, x: int
+    ) -> None:
+        """A window drawing into its own grid of cells.
+
+        :param backend: backend the window belongs to.
+        :param height: number of lines.
+        :param width: number of columns.
+        :param y: line of the display the window starts at.
+        :param x: column of the display the window starts at.
+        """
+        self._backend = backend
+        self.height = height
+        self.width = width
+        self.y = y
+        self.x = x
+        self._background = 0
+        self._chars = [[" "] * width for _ in range(height)]
+        self._attributes = [[0] * width for _ in range(height)]
+        self._timeout = -1
+        # like curses, only cells drawn since the last refresh are copied to
+        # the display: first and last touched column of each line
+        self._touched: Dict[int, Tuple[int, int]] = {}
+        self._touch_all()
+
+    def _touch_all(self) -> None:
+        self._touched = {row: (0, self.width - 1) for row in range(self.height)}
+
+    def _put(self, y: int, x: int, char: str, attributes: int) -> None:
+        if not (0 <= y < self.height and 0 <= x < self.width):
+            raise FramebufferError(f"({y}, {x}) is outside of the window")
+        self._chars[y][x] = char
+        self._attributes[y][x] = attributes
+        first, last = self._touched.get(y, (x, x))
+        self._touched[y] = (min(first, x), max(last, x))
+
+    def addstr(self, y: int, x: int, message: str, attributes: int = 0) -> None:
+        """Writes text like curses does: a newline clears the rest of the line
+        and moves to the start of the next one, long lines wrap, and moving
+        past the last cell of the window is an error.
+        """
+        self._backend.stats.draw_calls += 1
+        attributes |= self._background
+        for char in message:
+            if char == "\n":
+                for col in range(x, self.width):
+                    self._put(y, col, " ", self._background)
+                y, x = y + 1, 0
+            else:
+                self._put(y, x, char, attributes)
+                x += 1
+                if x == self.width:
+                    y, x = y + 1, 0
+            if y == self.height:
+                raise FramebufferError("text does not fit in the window")
+
+    def bkgd(self, char: str, attributes: int = 0) -> None:
+        """Sets the background of every cell, keeping the text."""
+        self._backend.stats.draw_calls += 1
+        self._background = attributes
+        for row in range(self.height):
+            self._attributes[row] = [attributes] * self.width
+        self._touch_all()
+
+    def clear(self) -> None:
+        self._backend.stats.draw_calls += 1
+        for row in range(self.height):
+            self._chars[row] = [" "] * self.width
+            self._attributes[row] = [self._background] * self.width
+        self._touch_all()
+
+    def noutrefresh(self) -> None:
+        """Copies the cells drawn since the last refresh onto the virtual
+        display.
+        """
+        self._backend.stats.refreshes += 1
+        for row, (first, last) in self._touched.items():
+            self._backend.compose(
+                self.y + row,
+                self.x + first,
+                self._chars[row][first : last + 1],
+                self._attributes[row][first : last + 1],
+            )
+        self._touched.clear()
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    def keypad(self, flag: bool) -> None:
+        pass
+
+    def timeout(self, delay: int) -> None:
+        self._timeout = delay
+
+    def nodelay(self, flag: bool) -> None:
+        self._timeout = 0 if flag else -1
+
+    def getch(self) -> int:
+        """Next scripted key. Once the script runs out, waiting for a key
+        returns -1 like a timeout does, and blocking for one returns escape so
+        that input loops end.
+        """
+        if self._backend.keys:
+            return self._backend.keys.popleft()
+        return -1 if self._timeout >= 0 else ESCAPE
+
+
+class FramebufferBackend(Backend):
+    A_BOLD = 1 << 21
+
+    def __init__(
+        self, width: int = 120, height: int = 50, keys: Union[str, Iterable[int]] = ()
+    ) -> None:
+        """Display kept in memory.
+
+        :param width: number of columns of the display.
+        :param height: number of lines of the display.
+        :param keys: optional keys to script, as text or character codes.
+        """
+        self.width = width
+        self.height = height
+        self.stats = DrawStats()
+        self.keys: Deque[int] = deque()
+        self.push_keys(keys)
+
+        self._pairs: Dict[int, Tuple[int, int]] = {}
+        # what was last sent to the display, and what the next update sends
+        self._display = self._blank()
+        self._virtual = self._blank()
+
+    def _blank(self) -> List[List[Tuple[str, int]]]:
+        return [[(" ", 0)] * self.width for _ in range(self.height)]
+
+    def push_keys(self, keys: Union[str, Iterable[int]]) -> None:
+        """Scripts keys to be read after the ones already scripted.
+
+        :param keys: text or character codes.
+        """
+        if isinstance(keys, str):
+            keys = [ord(char) for char in keys]
+        self.keys.extend(keys)
+
+    def start(self) -> FramebufferWindow:
+        return self.new_window(self.height, self.width, 0, 0)
+
+    def size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def init_pair(self, index: int, foreground: int, background: int) -> None:
+        self._pairs[index] = (foreground, background)
+
+    def color_pair(self, index: int) -> int:
+        return index << 8
+
+    def new_window(self, height: int, width: int, y: int, x: int) -> FramebufferWindow:
+        if y < 0 or x < 0 or y + height > self.height or x + width > self.width:
+            raise FramebufferError("window does not fit on the display")
+        return FramebufferWindow(self, height, width, y, x)
+
+    def rectangle(self, window: Window, y1: int, x1: int, y2: int, x2: int) -> None:
+        assert isinstance(window, FramebufferWindow)
+        self.stats.draw_calls += 1
+        for x in range(x1 + 1, x2):
+            window._put(y1, x, HORIZONTAL, 0)
+            window._put(y2, x, HORIZONTAL, 0)
+        for y in range(y1 + 1, y2):
+            window._put(y, x1, VERTICAL, 0)
+            window._put(y, x2, VERTICAL, 0)
+        window._put(y1, x1, TOP_LEFT, 0)
+        window._put(y1, x2, TOP_RIGHT, 0)
+        window._put(y2, x1, BOTTOM_LEFT, 0)
+        window._put(y2, x2, BOTTOM_RIGHT, 0)
+
+    def compose(self, y: int, x: int, chars: List[str], attributes: List[int]) -> None:
+        """Copies a run of cells onto the virtual display.
+
+        :param y: line of the cells.
+        :param x: column of the first cell.
+        :param chars: character of each cell.
+        :param attributes: attributes of each cell.
+        """
+        self._virtual[y][x : x + len(chars)] = zip(chars, attributes)
+
+    def update(self) -> None:
+        """Sends the cells that changed since the last update to the
+        display, counting them along with the bytes they take.
+        """
+        self.stats.updates += 1
+        for y, (line, shown) in enumerate(zip(self._virtual, self._display)):
+            if line == shown:
+                continue
+            for cell, shown_cell in zip(line, shown):
+                if cell != shown_cell:
+                    self.stats.cells_changed += 1
+                    self.stats.bytes_output += len(cell[0].encode("utf-8"))
+            self._display[y] = list(line)
+
+    def stop(self, stdscr: Window) -> None:
+        pass
+
+    def render_text(self) -> str:
+        """The display as plain text, without trailing blanks."""
+        lines = ["".join(char for char, _ in line).rstrip() for line in self._display]
+        return "\n".join(lines).rstrip("\n")
+
+    def render_ansi(self) -> str:
+        """The display as text with ANSI escape sequences for colors and bold,
+        without trailing blanks.
+        """
+        lines = []
+        for line in self._display:
+            end = len(line)
+            while end and line[end - 1] == (" ", 0):
+                end -= 1
+            text = []
+            current = 0
+            for char, attributes in line[:end]:
+                if attributes != current:
+                    text.append(self._escape_sequence(attributes))
+                    current = attributes
+                text.append(char)
+            if current:
+                text.append(self._escape_sequence(0))
+            lines.append("".join(text))
+        return "\n".join(lines).rstrip("\n")
+
+    def _escape_sequence(self, attributes: int) -> str:
+        codes = ["0"]
+        if attributes & self.A_BOLD:
+            codes.append("1")
+        foreground, background = self._pairs.get((attributes >> 8) & 0xFF, (-1, -1))
+        if foreground >= 0:
+            codes.append(str(30 + foreground))
+        if background >= 0:
+            codes.append(str(40 + background))
+        return f"\x1b[{';'.join(codes)}m"
+
+    def cell_at(self, y: int, x: int) -> Optional[Tuple[str, int]]:
+        """Character and attributes shown at a position of the display."""
+        if 0 <= y < self.height and 0 <= x < self.width:
+            return self._display[y][x]
+        return None
@@ -0,0 +1,211 @@
+"""
+Compact view for multi-board games. Every board is a small bordered grid with
+one character per letter, laid out in as many columns as fit on screen, so
+that dozens of boards can be shown at once. Boards too tall for the screen
+show only their latest guesses, scrolling up as more are played. The word
+being typed is shown on an input line below the boards.
+"""
+from typing import List, Optional, Sequence, Tuple
+from view.backend import Backend
+from view.screen import Screen, Window
+from view.screen import DEFAULT_PADDING_X
+
+BOARD_GAP = 2  # blank columns between neighbouring boards
+HEADER_HEIGHT = 2
+
+
+class MultiBoardUI:
+    def __init__(
+        self,
+        num_boards: int,
+        word_length: int,
+        max_guesses: int,
+        backend: Optional[Backend] = None,
+    ) -> None:
+        """Lays out every board and the input line.
+
+        :param num_boards: number of boards.
+        :param word_length: number of letters per guess.
+        :param max_guesses: number of guesses per game.
+        :param backend: optional backend to draw with, defaults to the
+        terminal.
+        """
+        self._screen = Screen(backend)
+        self.word_length = word_length
+        self.max_guesses = max_guesses
+
+        self._is_accepting_input = True  # switches to false once game is over
+
+        title = f"Wordle on {num_boards} boards" if num_boards > 1 else "Wordle"
+        self._screen.add_text(self._screen.stdscr, 1, 1, title)
+
+        # Letters are separated by blank columns when there is room and
+        # packed next to each other otherwise, with a blank column on either
+        # side. Boxes add a border. When not every guess fits, the layout
+        # showing the most guesses per board wins.
+        available_width = self._screen.screen_width - 2 * DEFAULT_PADDING_X
+        # the input line and the footer line go below the boards
+        available_height = self._screen.screen_height - HEADER_HEIGHT - 3
+        layouts = []
+        for letter_gap in (1, 0):
+            board_width = word_length + 2 + (word_length - 1) * letter_gap
+            board_span = board_width + 2 + BOARD_GAP
+            boards_per_row = max(1, (available_width + BOARD_GAP) // board_span)
+            boards_per_row = min(boards_per_row, num_boards)
+            board_rows = -(-num_boards // boards_per_row)
+            visible_rows = min(max_guesses, available_height // board_rows - 2)
+            layouts.append((visible_rows, letter_gap, board_width, boards_per_row))
+            if visible_rows == max_guesses:
+                break
+        visible_rows, letter_gap, board_width, boards_per_row = max(
+            layouts, key=lambda layout: layout[0]
+        )
+        if visible_rows < 1:
+            raise RuntimeError(
+                f"Terminal window is too small for {num_boards} boards, please "
+                "resize your window before trying again."
+            )
+        self._letter_gap = letter_gap
+        self._visible_rows = visible_rows
+        board_span = board_width + 2 + BOARD_GAP
+        board_height = visible_rows + 2
+        input_y = HEADER_HEIGHT + -(-num_boards // boards_per_row) * board_height
+
+        x0 = (self._screen.screen_width - boards_per_row * board_span + BOARD_GAP) // 2
+        self._boards: List[Window] = []
+        for board in range(num_boards):
+            row, col = divmod(board, boards_per_row)
+            x1 = x0 + col * board_span + 1
+            y1 = HEADER_HEIGHT + row * board_height + 1
+            self._boards.append(
+                self._screen.add_box(x1, y1, x1 + board_width, y1 + visible_rows)
+            )
+        # guesses played on each board with the color pair of each character
+        self._board_guesses: List[List[Tuple[str, Sequence[int]]]] = [
+            [] for _ in range(num_boards)
+        ]
+
+        self._input_y = input_y
+        self.current_input = ""
+        self._draw_input()
+
+        self.render()
+
+    def _draw_input(self) -> None:
+        self._screen.add_text(
+            self._screen.stdscr,
+            DEFAULT_PADDING_X,
+            self._input_y,
+            ("> " + self.current_input.upper()).ljust(self.word_length + 2),
+        )
+
+    def key_was_pressed(self, key: str) -> None:
+        """Adds a letter to the input line, unless the input is already a full
+        word or the view is no longer accepting inputs.
+
+        :param key: char from A-Z.
+        """
+        if not self._is_accepting_input:
+            return
+        if (
+            key.isascii()
+            and key.isalpha()
+            and len(self.current_input) < self.word_length
+        ):
+            self.current_input += key
+            self._draw_input()
+
+    def backspace_was_pressed(self) -> None:
+        """Removes the last letter from the input line."""
+        if self._is_accepting_input and self.current_input:
+            self.current_input = self.current_input[:-1]
+            self._draw_input()
+
+    def get_current_input(self) -> str:
+        """Getter to allow the controller to retrieve the current input.
+
+        :return: string containing current user input.
+        """
+        return self.current_input.strip().lower()
+
+    def show_outcomes(self, colors: Sequence[Optional[Sequence[int]]]) -> None:
+        """Writes the current input on the next row of every board it was
+        played on, colored by its outcome there, and clears the input line.
+
+        :param colors: for each board, the color pair of each character, or
+        None for boards the guess was not played on.
+        """
+        word = self.current_input.upper()
+        for board, board_colors in enumerate(colors):
+            if board_colors is None:
+                continue
+            guesses = self._board_guesses[board]
+            guesses.append((word, board_colors))
+            if len(guesses) <= self._visible_rows:
+                self._draw_guess(board, len(guesses) - 1, word, board_colors)
+            else:
+                # scroll up to keep the latest guesses in view
+                for row, (shown, shown_colors) in enumerate(
+                    guesses[-self._visible_rows :]
+                ):
+                    self._draw_guess(board, row, shown, shown_colors)
+
+        self.current_input = ""
+        self._draw_input()
+
+    def _draw_guess(
+        self, board: int, row: int, word: str, colors: Sequence[int]
+    ) -> None:
+        for i, color_pair_index in enumerate(colors):
+            self._screen.add_text(
+                self._boards[board],
+                1 + i * (1 + self._letter_gap),
+                row,
+                word[i],
+                self._screen.color(color_pair_index),
+            )
+
+    def show_hint(self, message: str) -> None:
+        """Displays a message on the footer line, replacing any previous one.
+
+        :param message: text to display.
+        """
+        self._screen.add_text(
+            self._screen.stdscr,
+            DEFAULT_PADDING_X,
+            self._screen.screen_height - 1,
+            message.ljust(self._screen.screen_width - 2 * DEFAULT_PADDING_X),
+        )
+
+    def render(self) -> None:
+        """Pushes everything drawn since the last render to the terminal in
+        a single update.
+        """
+        self._screen.flush()
+
+    def game_over(self) -> None:
+        """Stops the view from accepting further user input and removes the
+        input line.
+        """
+        self._is_accepting_input = False
+        self.current_input = ""
+        self._screen.add_text(
+            self._screen.stdscr,
+            DEFAULT_PADDING_X,
+            self._input_y,
+            " " * (self.word_length + 2),
+        )
+
+    def get_input_character_codes(self, timeout_ms: int = -1) -> List[int]:
+        """Waits for keyboard input and returns every key pressed since the
+        last call.
+
+        :param timeout_ms: how long to wait in milliseconds, -1 to block until
+        a key is pressed.
+        :return: character codes, empty if no key was pressed in time.
+        """
+        return self._screen.read_keys(timeout_ms)
+
+    def close(self) -> None:
+        """Closes to underlying screen."""
+        self._screen.close()
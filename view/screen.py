@@ -1,52 +1,49 @@
 """
 Custom wrapper built around curses. This exposes everything needed to allow
-the wordle_ui to build the interface.
+the wordle_ui to build the interface. Drawing goes through a backend (see
+backend.py), the real terminal by default.
 """
-import curses
+from typing import Dict, List, Optional
 
-from curses.textpad import Textbox, rectangle
-from typing import List, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from _curses import _CursesWindow
-
-    Window = _CursesWindow
-else:
-    from typing import Any
-
-    Window = Any
+import instrumentation
 
+from view.backend import Backend, CursesBackend, Window
+from view.backend import COLOR_GREEN, COLOR_RED, COLOR_WHITE, COLOR_YELLOW
 
 DEFAULT_PADDING_X = 3
 DEFAULT_PADDING_Y = 2
 
 
 class Screen:
-    def __init__(self) -> None:
-        """Responsible for curses related housekeeping."""
-        # Setting up curses
-        self.stdscr = curses.initscr()  # find screen dimensions and basic props
+    def __init__(self, backend: Optional[Backend] = None) -> None:
+        """Responsible for curses related housekeeping. Drawing is batched:
+        windows that were drawn to are only marked dirty, and flush() pushes
+        all of them to the terminal in a single update.
+
+        :param backend: optional backend to draw with, e.g. an in-memory
+        framebuffer. Defaults to the terminal through curses.
+        """
+        # Setting up the display and user input
+        self.backend = backend if backend is not None else CursesBackend()
+        self.stdscr = self.backend.start()
         self.stdscr.clear()
 
+        # Windows drawn to since the last flush, keyed by id to avoid repeats
+        self._dirty_windows: Dict[int, Window] = {}
+
         # Recording props
-        self.screen_width = curses.COLS - 1
-        self.screen_height = curses.LINES - 1
+        width, height = self.backend.size()
+        self.screen_width = width - 1
+        self.screen_height = height - 1
 
         # Setting up color palette
-        curses.start_color()
-        curses.use_default_colors()
-        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_RED)
-        curses.init_pair(2, curses.COLOR_WHITE, curses.COLOR_YELLOW)
-        curses.init_pair(3, curses.COLOR_WHITE, curses.COLOR_GREEN)
-
-        # Setting up user input
-        curses.noecho()  # prevent keys from echoing to stdout
-        curses.cbreak()  # read key inputs before enter is hit
-        self.stdscr.keypad(
-            True
-        )  # interpret key input and translate to curses special chars (ex: curses.KEY_LEFT)
-
-    def add_text(self, window: Window, x: int, y: int, message: str) -> None:
+        self.backend.init_pair(1, COLOR_WHITE, COLOR_RED)
+        self.backend.init_pair(2, COLOR_WHITE, COLOR_YELLOW)
+        self.backend.init_pair(3, COLOR_WHITE, COLOR_GREEN)
+
+    def add_text(
+        self, window: Window, x: int, y: int, message: str, attributes: int = 0
+    ) -> None:
         """Responsible for adding text to an existing curses window.
         Note: Curses cannot write text to a window that does not have enough
         room to display said text.
@@ -55,15 +52,90 @@ class Screen:
         :param x: row relative to top left of curses window.
         :param y: column relative to top left of curses window.
         :param message: text to display in the curses window.
+        :param attributes: optional curses attributes, e.g. a color pair.
         """
         try:
-            window.addstr(y, x, message)
-            window.refresh()
+            window.addstr(y, x, message, attributes)
+            self.mark_dirty(window)
+            if instrumentation.active is not None:
+                instrumentation.active.count(
+                    "wordle_screen_text_bytes_total", len(message.encode("utf-8"))
+                )
         except:
             raise RuntimeError(
                 "Terminal window is too small, please resize your window to at least 70x50 before trying again."
             )
 
+    def color(self, color_pair_index: int) -> int:
+        """Attributes drawing bold text in one of the color pairs.
+
+        :param color_pair_index: color pair, see the palette in __init__.
+        """
+        return self.backend.color_pair(color_pair_index) | self.backend.A_BOLD
+
+    def fill(self, window: Window, color_pair_index: int) -> None:
+        """Colors the background of a whole window, keeping its text.
+
+        :param window: curses window to color.
+        :param color_pair_index: color pair, see the palette in __init__.
+        """
+        window.bkgd(" ", self.color(color_pair_index))
+        self.mark_dirty(window)
+
+    def mark_dirty(self, window: Window) -> None:
+        """Schedules a window to be redrawn on the next flush.
+
+        :param window: curses window that was drawn to.
+        """
+        self._dirty_windows[id(window)] = window
+
+    def flush(self) -> None:
+        """Copies every dirty window to curses' virtual screen and updates
+        the terminal once. The main screen goes first so that the boxes drawn
+        on it never cover the windows inside them.
+        """
+        if not self._dirty_windows:
+            return
+        stdscr = self._dirty_windows.pop(id(self.stdscr), None)
+        if stdscr is not None:
+            stdscr.noutrefresh()
+        for window in self._dirty_windows.values():
+            window.noutrefresh()
+        metrics = instrumentation.active
+        if metrics is not None:
+            metrics.count("wordle_screen_flushes_total")
+            metrics.count(
+                "wordle_screen_window_refreshes_total",
+                len(self._dirty_windows) + (stdscr is not None),
+            )
+        self._dirty_windows.clear()
+        self.backend.update()
+
+    def read_keys(self, timeout_ms: int = -1) -> List[int]:
+        """Waits for keyboard input, then drains every key that is already
+        pending without waiting any further, so that a burst of keys (pasted
+        text, a held key) is read in one go.
+
+        :param timeout_ms: how long to wait for the first key in milliseconds,
+        0 to not wait at all or -1 to block until a key is pressed.
+        :return: character codes of the keys read, in order. Empty if none
+        arrived in time.
+        """
+        self.stdscr.timeout(timeout_ms)
+        input_code = self.stdscr.getch()
+        if input_code == -1:
+            return []
+        input_codes = [input_code]
+        self.stdscr.nodelay(True)
+        try:
+            while True:
+                input_code = self.stdscr.getch()
+                if input_code == -1:
+                    return input_codes
+                input_codes.append(input_code)
+        finally:
+            self.stdscr.nodelay(False)
+
     def add_centered_text(self, window: Window, message: str) -> None:
         """Responsible for adding text to an existing curses window. This will
         center the text in both x and y by adding spaces to the beginning of each line and adding newlines to the start of the entire message.
@@ -97,9 +169,9 @@ class Screen:
         """
         width = x2 - x1
         height = y2 - y1
-        window = curses.newwin(height, width, y1, x1)
-        rectangle(self.stdscr, y1 - 1, x1 - 1, y2, x2)
-        self.stdscr.refresh()
+        window = self.backend.new_window(height, width, y1, x1)
+        self.backend.rectangle(self.stdscr, y1 - 1, x1 - 1, y2, x2)
+        self.mark_dirty(self.stdscr)
 
         return window
 
@@ -228,7 +300,4 @@ class Screen:
 
     def close(self) -> None:
         """Closes the underlying curses screen and ends the session."""
-        curses.nocbreak()
-        self.stdscr.keypad(False)
-        curses.echo()
-        curses.endwin()
+        self.backend.stop(self.stdscr)
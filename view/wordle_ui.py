@@ -3,17 +3,50 @@ The view creates the full user interface to be displayed on screen. It is built
 using the screen module (custom wrapper built around curses). The view exposes
 all required APIs needed for the controller to do its job.
 """
-import curses
-
-from typing import List
+from typing import List, Mapping, Optional, Sequence
+from view.backend import Backend
 from view.screen import Screen
-from view.screen import DEFAULT_PADDING_Y
+from view.screen import DEFAULT_PADDING_X, DEFAULT_PADDING_Y
+
+BANNER_BOTTOM = 12  # last line of the banner's border
+
+
+def fit_padding(num_boxes: int, box_size: int, available: int, preferred: int) -> int:
+    """Largest padding, up to the preferred one, that fits a row or column of
+    boxes in the available space. Padding never goes below 1 so that boxes
+    stay apart.
+
+    :param num_boxes: number of boxes in the row or column.
+    :param box_size: width or height of each box.
+    :param available: space available for the boxes and the gaps between them.
+    :param preferred: padding to use when there is enough space.
+    :return: padding between boxes.
+    """
+    padding = preferred
+    while padding > 1 and num_boxes * box_size + (num_boxes - 1) * padding > available:
+        padding -= 1
+    return padding
 
 
 class WordleUI:
-    def __init__(self) -> None:
-        """Lays out full UI and stores each window for later use."""
-        self._screen = Screen()
+    def __init__(
+        self,
+        word_length: int = 5,
+        max_guesses: int = 6,
+        backend: Optional[Backend] = None,
+    ) -> None:
+        """Lays out full UI and stores each window for later use. The guess
+        grid has one row per guess and one column per letter; padding around
+        the grid and the keyboard shrinks when they would not fit otherwise.
+
+        :param word_length: number of letters per guess.
+        :param max_guesses: number of guesses per game.
+        :param backend: optional backend to draw with, defaults to the
+        terminal.
+        """
+        self._screen = Screen(backend)
+        self.word_length = word_length
+        self.max_guesses = max_guesses
 
         self._is_accepting_input = True  # switches to false once game is over
 
@@ -32,22 +65,11 @@ class WordleUI:
         """
         banner = self._screen.add_banner(3, 9, title)
 
-        # Setting up user input grid
-        guess_box_height = 1
-        guess_box_width = 3
-        self._guess_box_grid = self._screen.add_centered_box_grid(
-            guess_box_height, guess_box_width, 6, 5
-        )
-
-        self.current_row = 0
-        self.current_col = 0
-        self.current_input = ""
-
         # Setting up keyboard grid
         qwerty_grid = [
             ["Q", "W", "E", "R", "T", "Y", "U", "I", "O", "P"],
             ["A", "S", "D", "F", "G", "H", "J", "K", "L"],
-            ["\u23CE", "Z", "X", "C", "V", "B", "N", "N", "M", "\u232B"],
+            ["\u23CE", "Z", "X", "C", "V", "B", "N", "M", "\u232B"],
         ]
         self.qwerty_window_map = {}
 
@@ -55,41 +77,67 @@ class WordleUI:
         key_box_width = 3
         footer_offset = 1
 
-        top_row = self._screen.add_box_row(
-            self._screen.screen_height
-            - 3 * (key_box_height + DEFAULT_PADDING_Y)
-            - footer_offset,
-            key_box_height,
-            key_box_width,
-            10,
-        )
-        for i, key_window in enumerate(top_row):
-            self.qwerty_window_map[qwerty_grid[0][i]] = key_window
-            self._screen.add_centered_text(key_window, qwerty_grid[0][i])
-
-        middle_row = self._screen.add_box_row(
-            self._screen.screen_height
-            - 2 * (key_box_height + DEFAULT_PADDING_Y)
-            - footer_offset,
-            key_box_height,
-            key_box_width,
-            9,
+        guess_box_height = 1
+        guess_box_width = 3
+
+        # The guess grid is centered between the banner and the keyboard.
+        # Padding shrinks, first within the grid and then within the keyboard,
+        # when there are too many guesses to fit.
+        for key_padding_y in (DEFAULT_PADDING_Y, 1):
+            keyboard_top = (
+                self._screen.screen_height
+                - len(qwerty_grid) * (key_box_height + key_padding_y)
+                - footer_offset
+            )
+            grid_space = keyboard_top - BANNER_BOTTOM - 4  # borders of both
+            grid_padding_y = fit_padding(
+                max_guesses, guess_box_height, grid_space, DEFAULT_PADDING_Y
+            )
+            grid_height = (
+                max_guesses * guess_box_height + (max_guesses - 1) * grid_padding_y
+            )
+            if grid_height <= grid_space:
+                break
+        else:
+            raise RuntimeError(
+                f"Terminal window is too small for {max_guesses} guesses, please "
+                "resize your window before trying again."
+            )
+        grid_padding_x = fit_padding(
+            word_length,
+            guess_box_width,
+            self._screen.screen_width - 2 * DEFAULT_PADDING_X,
+            DEFAULT_PADDING_X,
         )
-        for i, key_window in enumerate(middle_row):
-            self.qwerty_window_map[qwerty_grid[1][i]] = key_window
-            self._screen.add_centered_text(key_window, qwerty_grid[1][i])
-
-        bottom_row = self._screen.add_box_row(
-            self._screen.screen_height
-            - 1 * (key_box_height + DEFAULT_PADDING_Y)
-            - footer_offset,
-            key_box_height,
-            key_box_width,
-            10,
+
+        # Setting up user input grid
+        self._guess_box_grid = self._screen.add_box_grid(
+            BANNER_BOTTOM + 2 + max(0, grid_space - grid_height) // 2,
+            guess_box_height,
+            guess_box_width,
+            max_guesses,
+            word_length,
+            padding_x=grid_padding_x,
+            padding_y=grid_padding_y,
         )
-        for i, key_window in enumerate(bottom_row):
-            self.qwerty_window_map[qwerty_grid[2][i]] = key_window
-            self._screen.add_centered_text(key_window, qwerty_grid[2][i])
+
+        self.current_row = 0
+        self.current_col = 0
+        self.current_input = ""
+
+        # Setting up keyboard rows
+        for row, keys in enumerate(qwerty_grid):
+            key_row = self._screen.add_box_row(
+                keyboard_top + row * (key_box_height + key_padding_y),
+                key_box_height,
+                key_box_width,
+                len(keys),
+            )
+            for key, key_window in zip(keys, key_row):
+                self.qwerty_window_map[key] = key_window
+                self._screen.add_centered_text(key_window, key)
+
+        self.render()
 
     def key_was_pressed(self, key: str) -> None:
         """Handles alpha key presses. If key is valid, this displays the new
@@ -102,7 +150,7 @@ class WordleUI:
             return
 
         if key in self.qwerty_window_map:
-            if self.current_col <= 4:
+            if self.current_col < self.word_length:
                 current_input_window = self._guess_box_grid[self.current_row][
                     self.current_col
                 ]
@@ -123,7 +171,7 @@ class WordleUI:
                 self.current_col
             ]
             current_input_window.clear()
-            current_input_window.refresh()
+            self._screen.mark_dirty(current_input_window)
             self.current_input = self.current_input[:-1]
 
     def get_current_input(self) -> str:
@@ -133,51 +181,68 @@ class WordleUI:
         """
         return self.current_input.strip().lower()
 
-    def move_on_to_next_row(self, previous_guess_colors: List[int]) -> None:
+    def move_on_to_next_row(self, previous_guess_colors: Sequence[int]) -> None:
         """Expects a list containing indexes for the desired color_pair for
         each of the previously guessed characters. Assumes provided colors are
-        valid color pairs as defined in screen.py.
+        valid color pairs as defined in screen.py. Keys are colored separately,
+        see update_keys.
 
-        :param previous_guess_colors: list of integers presenting pre-defined
-        color pairs.
+        :param previous_guess_colors: sequence of integers presenting
+        pre-defined color pairs.
         """
 
         for i, color_pair_index in enumerate(previous_guess_colors):
             input_window_at_index = self._guess_box_grid[self.current_row][i]
-            key_at_index = self.current_input[i]
-
-            # update input window color
-            input_window_at_index.bkgd(
-                " ", curses.color_pair(color_pair_index) | curses.A_BOLD
-            )
-            input_window_at_index.refresh()
-
-            # update key window color
-            key_window_at_index = self.qwerty_window_map[key_at_index]
-            key_window_at_index.bkgd(
-                " ", curses.color_pair(color_pair_index) | curses.A_BOLD
-            )
-            key_window_at_index.refresh()
+            self._screen.fill(input_window_at_index, color_pair_index)
 
         if not self._is_accepting_input:
             return
 
-        if self.current_row <= 4:
+        if self.current_row < self.max_guesses - 1:
             self.current_row += 1
             self.current_col = 0
             self.current_input = ""
 
+    def update_keys(self, key_colors: Mapping[str, int]) -> None:
+        """Recolors keyboard keys, leaving every other key untouched.
+
+        :param key_colors: color pair for each key to recolor, by key (A-Z).
+        """
+        for key, color_pair_index in key_colors.items():
+            self._screen.fill(self.qwerty_window_map[key], color_pair_index)
+
+    def show_hint(self, message: str) -> None:
+        """Displays a hint on the footer line below the keyboard, replacing
+        any previous hint.
+
+        :param message: text to display.
+        """
+        self._screen.add_text(
+            self._screen.stdscr,
+            DEFAULT_PADDING_X,
+            self._screen.screen_height - 1,
+            message.ljust(self._screen.screen_width - 2 * DEFAULT_PADDING_X),
+        )
+
+    def render(self) -> None:
+        """Pushes everything drawn since the last render to the terminal in
+        a single update. Expected to be called once per input event.
+        """
+        self._screen.flush()
+
     def game_over(self) -> None:
         """Stops the view from accepting further user input."""
         self._is_accepting_input = False
 
-    def get_input_character_code(self) -> int:
-        """Blocking function that waits for the next keyboard input. Captures
-        the last character code that the user typed.
+    def get_input_character_codes(self, timeout_ms: int = -1) -> List[int]:
+        """Waits for keyboard input and returns every key pressed since the
+        last call.
 
-        :return: character code
+        :param timeout_ms: how long to wait in milliseconds, -1 to block until
+        a key is pressed.
+        :return: character codes, empty if no key was pressed in time.
         """
-        return self._screen.stdscr.getch()
+        return self._screen.read_keys(timeout_ms)
 
     def close(self) -> None:
         """Closes to underlying screen."""